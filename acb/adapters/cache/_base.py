@@ -1,10 +1,11 @@
+import asyncio
+import brotli
 import typing as t
 from aiocache import BaseCache
 from aiocache.serializers import BaseSerializer
 from msgspec import msgpack
 from pydantic import SecretStr
 
-from acb.actions.compress import compress, decompress
 from acb.cleanup import CleanupMixin
 from acb.config import Config, Settings
 from acb.depends import Inject, depends
@@ -83,27 +84,117 @@ class CacheBaseSettings(Settings, SSLConfigMixin):
             )
 
 
+CacheCodec = t.Literal["none", "brotli", "zstd", "lz4"]
+
+
+def _zstd() -> t.Any:
+    try:
+        import zstandard
+    except ImportError as e:
+        msg = "zstd codec requires the 'zstandard' package"
+        raise ImportError(msg) from e
+    return zstandard
+
+
+def _lz4() -> t.Any:
+    try:
+        import lz4.frame
+    except ImportError as e:
+        msg = "lz4 codec requires the 'lz4' package"
+        raise ImportError(msg) from e
+    return lz4.frame
+
+
+# Header byte -> (codec, compress, decompress)
+_CODECS: dict[
+    int, tuple[str, t.Callable[[t.Any], bytes], t.Callable[[t.Any], bytes]]
+] = {
+    0xA0: ("none", bytes, bytes),
+    0xA1: (
+        "brotli",
+        lambda data: brotli.compress(data, quality=3),
+        brotli.decompress,
+    ),
+    0xA2: (
+        "zstd",
+        lambda data: _zstd().ZstdCompressor().compress(data),
+        lambda data: _zstd().ZstdDecompressor().decompress(data),
+    ),
+    0xA3: (
+        "lz4",
+        lambda data: _lz4().compress(data),
+        lambda data: _lz4().decompress(data),
+    ),
+}
+_CODEC_HEADERS: dict[str, int] = {
+    name: header for header, (name, _, _) in _CODECS.items()
+}
+
+
 class MsgPackSerializer(BaseSerializer):  # type: ignore[misc]
-    def __init__(self, *args: t.Any, use_list: bool = True, **kwargs: t.Any) -> None:
+    """Bytes-native msgpack serializer with optional compression.
+
+    Each payload starts with a header byte naming the codec it was written
+    with, so entries stay readable when the codec or threshold changes.
+    Payloads smaller than ``compression_threshold`` are stored uncompressed.
+    """
+
+    DEFAULT_ENCODING = None
+
+    def __init__(
+        self,
+        *args: t.Any,
+        use_list: bool = True,
+        codec: CacheCodec = "brotli",
+        compression_threshold: int = 1024,
+        **kwargs: t.Any,
+    ) -> None:
+        if codec not in _CODEC_HEADERS:
+            msg = f"Unknown cache codec: {codec}"
+            raise ValueError(msg)
         self.use_list = use_list
+        self.codec = codec
+        self.compression_threshold = compression_threshold
+        self._encoder = msgpack.Encoder()
+        self._decoder = msgpack.Decoder()
         super().__init__(*args, **kwargs)
 
-    def dumps(self, value: t.Any) -> str:
-        msgpack_data = msgpack.encode(value)
-        return compress.brotli(msgpack_data).decode("latin-1")
-
-    def loads(self, value: str) -> t.Any:
+    def dumps(self, value: t.Any) -> bytes:
+        payload = self._encoder.encode(value)
+        codec = self.codec
+        if len(payload) < self.compression_threshold:
+            codec = "none"
+        header = _CODEC_HEADERS[codec]
+        if codec != "none":
+            payload = _CODECS[header][1](payload)
+        return header.to_bytes() + payload
+
+    def loads(self, value: bytes | str | None) -> t.Any:
         if not value:
-            return None  # type: ignore[return-value]
-        data_bytes = value.encode("latin-1")
-        msgpack_data = decompress.brotli(data_bytes)
+            return None
+        if isinstance(value, str):
+            return self._loads_legacy(value)
+        codec = _CODECS.get(value[0])
+        if codec is None:
+            return self._loads_legacy(value)
+        body = memoryview(value)[1:]
+        if codec[0] == "none":
+            return self._decoder.decode(body)
+        return self._decoder.decode(codec[2](body))
+
+    def _loads_legacy(self, value: bytes | str) -> t.Any:
+        # Headerless entries are brotli streams carried as latin-1 strings;
+        # read back as bytes they arrive UTF-8 encoded, whose first byte can
+        # never collide with a codec header
+        if isinstance(value, bytes):
+            try:
+                value = value.decode()
+            except UnicodeDecodeError:
+                return self._decoder.decode(brotli.decompress(value))
+        msgpack_data = brotli.decompress(value.encode("latin-1"))
         if not msgpack_data:
-            return None  # type: ignore[return-value]
-        try:
-            msgpack_bytes = msgpack_data.encode("latin-1")
-        except AttributeError:
-            msgpack_bytes = t.cast("bytes", msgpack_data)
-        return msgpack.decode(msgpack_bytes)
+            return None
+        return self._decoder.decode(msgpack_data)
 
 
 class CacheProtocol(t.Protocol):
@@ -117,6 +208,16 @@ class CacheProtocol(t.Protocol):
 
     async def scan(self, pattern: str) -> t.AsyncIterator[str]: ...
 
+    async def delete_pattern(self, pattern: str) -> int: ...
+
+    async def get_many(self, keys: list[str]) -> list[t.Any]: ...
+
+    async def set_many(
+        self, items: t.Mapping[str, t.Any], ttl: int | None = None
+    ) -> None: ...
+
+    async def delete_many(self, keys: list[str]) -> int: ...
+
 
 class CacheBase(BaseCache, CleanupMixin):  # type: ignore[misc]
     config: Inject[Config]
@@ -191,3 +292,24 @@ class CacheBase(BaseCache, CleanupMixin):  # type: ignore[misc]
         """Delete cache key."""
         client = await self._ensure_client()
         return bool(await client.delete(key))  # type: ignore[no-any-return]
+
+    # Batch operations - implementations should override these with native
+    # multi-key commands; the defaults issue the single-key calls concurrently
+    async def get_many(self, keys: list[str]) -> list[t.Any]:
+        """Get cache values for several keys, ``None`` for missing keys."""
+        return list(await asyncio.gather(*(self.get(key) for key in keys)))
+
+    async def set_many(
+        self,
+        items: t.Mapping[str, t.Any],
+        ttl: int | None = None,
+    ) -> None:
+        """Set several cache values with a shared TTL."""
+        await asyncio.gather(
+            *(self.set(key, value, ttl=ttl) for key, value in items.items()),
+        )
+
+    async def delete_many(self, keys: list[str]) -> int:
+        """Delete several cache keys and return how many existed."""
+        deleted = await asyncio.gather(*(self.delete(key) for key in keys))
+        return sum(bool(result) for result in deleted)
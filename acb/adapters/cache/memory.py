@@ -1,3 +1,4 @@
+from fnmatch import fnmatchcase
 from uuid import UUID
 
 import typing as t
@@ -146,6 +147,34 @@ class Cache(CacheBase):
         cache = await self.get_client()
         return bool(await cache.clear(namespace=namespace))
 
+    async def delete_pattern(self, pattern: str) -> int:
+        """Delete all keys matching a glob-style ``pattern``."""
+        cache = await self.get_client()
+        namespaced = cache._build_key(pattern)
+        keys = [key for key in list(cache._cache) if fnmatchcase(key, namespaced)]
+        for key in keys:
+            await cache.delete(key, namespace="")
+        return len(keys)
+
+    async def get_many(self, keys: list[str]) -> list[t.Any]:
+        cache = await self.get_client()
+        return list(await cache.multi_get(keys))
+
+    async def set_many(
+        self,
+        items: t.Mapping[str, t.Any],
+        ttl: int | None = None,
+    ) -> None:
+        cache = await self.get_client()
+        await cache.multi_set(list(items.items()), ttl=ttl)
+
+    async def delete_many(self, keys: list[str]) -> int:
+        cache = await self.get_client()
+        deleted = 0
+        for key in keys:
+            deleted += bool(await cache.delete(key))
+        return deleted
+
     async def _multi_set(
         self,
         pairs: list[tuple[str, t.Any]],
@@ -39,6 +39,7 @@ Created: 2025-01-12
 
 from uuid import UUID
 
+import asyncio
 import typing as t
 from pydantic import SecretStr
 
@@ -118,6 +119,8 @@ class CacheSettings(CacheBaseSettings):
     local_host: str = "127.0.0.1"
     port: int | None = 6379
     cluster: bool | None = False
+    scan_batch_size: int = 1000
+    unlink_rate_limit: float | None = None
 
     @depends.inject
     def __init__(self, config: Inject[Config], **values: t.Any) -> None:
@@ -322,14 +325,89 @@ class Cache(CacheBase, SSLConfigMixin):
             pattern = (
                 f"{self.config.app.name if self.config.app else 'acb'}:{namespace}:*"
             )
-        client = await self.get_client()
-        keys = await client.keys(pattern)
-        if keys:
-            debug(keys)
-            for key in keys:
-                await client.unlink((key,))
+        await self.delete_pattern(pattern)
         return True
 
+    async def delete_pattern(
+        self,
+        pattern: str,
+        batch_size: int | None = None,
+        rate_limit: float | None = None,
+    ) -> int:
+        """Delete all keys matching ``pattern`` without blocking Redis.
+
+        Keys are walked with a cursor-based ``SCAN`` and removed with one
+        multi-key ``UNLINK`` per batch; the next page is scanned while the
+        previous ``UNLINK`` is in flight. ``rate_limit`` caps the number of
+        keys unlinked per second.
+
+        Returns:
+            Number of keys deleted
+        """
+        batch_size = batch_size or self.config.cache.scan_batch_size
+        if rate_limit is None:
+            rate_limit = self.config.cache.unlink_rate_limit
+        client = await self.get_client()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deleted = 0
+        submitted = 0
+        pending: asyncio.Future[t.Any] | None = None
+        batch: list[t.Any] = []
+
+        async def flush() -> None:
+            nonlocal deleted, pending, submitted
+            if pending is not None:
+                deleted += int(await pending or 0)
+                pending = None
+            if rate_limit:
+                delay = started + submitted / rate_limit - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            pending = asyncio.ensure_future(client.unlink(tuple(batch)))
+            submitted += len(batch)
+            batch.clear()
+
+        try:
+            async for key in client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    await flush()
+            if batch:
+                await flush()
+            if pending is not None:
+                deleted += int(await pending or 0)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+        debug(f"Unlinked {deleted} keys matching {pattern}")
+        return deleted
+
+    async def get_many(self, keys: list[str]) -> list[t.Any]:
+        if not keys:
+            return []
+        client = await self.get_client()
+        return list(await client.mget(keys))
+
+    async def set_many(
+        self,
+        items: t.Mapping[str, t.Any],
+        ttl: int | None = None,
+    ) -> None:
+        if not items:
+            return
+        client = await self.get_client()
+        # Non-transactional pipeline: every SET goes out in one round trip
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=ttl or None)
+
+    async def delete_many(self, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        client = await self.get_client()
+        return int(await client.delete(keys))
+
     async def _exists(self, key: str, _conn: t.Any = None) -> bool:
         client = await self.get_client()
         number = await client.exists([key])
@@ -0,0 +1,430 @@
+"""Tiered Cache Adapter for ACB.
+
+Puts a bounded in-process L1 cache in front of Redis (L2). Reads of hot keys
+are served from process memory without a network round trip, while writes go
+to Redis and are fanned out to every other worker as pub/sub invalidation
+messages so their L1 copies are dropped.
+
+Features:
+    - Bounded LRU L1 with a short TTL cap as a safety net for lost messages
+    - Redis pub/sub invalidation for keys, patterns and namespace clears
+    - Per-tier hit ratios via ``get_tier_stats()``
+    - All Redis adapter features (pooling, cluster, TLS, SCAN-based clears)
+
+Requirements:
+    - Redis server (standalone or cluster)
+    - coredis
+
+Example:
+    ```yaml
+    # settings/adapters.yml
+    cache: tiered
+    ```
+
+    ```python
+    from acb.depends import Inject, depends
+    from acb.adapters import import_adapter
+
+    Cache = import_adapter("cache")
+
+
+    @depends.inject
+    async def my_function(cache: Inject[Cache]):
+        await cache.set("user:123", {"name": "John"}, ttl=300)
+        return await cache.get("user:123")  # served from L1 on repeat reads
+    ```
+"""
+
+import re
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from uuid import UUID, uuid4
+
+import asyncio
+import contextlib
+import typing as t
+from aiocache.serializers import PickleSerializer
+from coredis.exceptions import RedisError
+from dataclasses import dataclass
+from msgspec import DecodeError, json
+
+from acb.adapters import AdapterCapability, AdapterMetadata, AdapterStatus
+from acb.debug import debug
+from acb.depends import depends
+
+from .redis import Cache as RedisCache
+from .redis import CacheSettings as RedisCacheSettings
+
+_COUNTER_PATTERN = re.compile(rb"-?\d+")
+
+MODULE_ID = UUID("0199e8a2-5c41-7d3e-9f12-4b7a6c2e81d5")
+MODULE_STATUS = AdapterStatus.BETA
+
+MODULE_METADATA = AdapterMetadata(
+    module_id=MODULE_ID,
+    name="Tiered Cache",
+    category="cache",
+    provider="tiered",
+    version="1.0.0",
+    acb_min_version="0.18.0",
+    author="lesleslie <les@wedgwoodwebworks.com>",
+    created_date="2025-10-16",
+    last_modified="2025-10-16",
+    status=MODULE_STATUS,
+    capabilities=[
+        AdapterCapability.ASYNC_OPERATIONS,
+        AdapterCapability.CONNECTION_POOLING,
+        AdapterCapability.CACHING,
+        AdapterCapability.TLS_SUPPORT,
+        AdapterCapability.RECONNECTION,
+        AdapterCapability.METRICS,
+    ],
+    required_packages=["coredis"],
+    description="In-process L1 cache in front of Redis with pub/sub invalidation",
+    settings_class="CacheSettings",
+    config_example={
+        "host": "localhost",
+        "port": 6379,
+        "l1_max_entries": 10000,
+        "l1_ttl": 60,
+    },
+)
+
+
+@dataclass
+class TieredCacheStats:
+    """Hit counters for each cache tier."""
+
+    l1_hits: int = 0
+    l2_hits: int = 0
+    misses: int = 0
+    invalidations_sent: int = 0
+    invalidations_received: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.l1_hits + self.l2_hits + self.misses
+
+    @property
+    def l1_hit_ratio(self) -> float:
+        return self.l1_hits / self.requests if self.requests else 0.0
+
+    @property
+    def l2_hit_ratio(self) -> float:
+        """Share of L1 misses that were served by Redis."""
+        l2_requests = self.l2_hits + self.misses
+        return self.l2_hits / l2_requests if l2_requests else 0.0
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {
+            "l1_hits": self.l1_hits,
+            "l2_hits": self.l2_hits,
+            "misses": self.misses,
+            "l1_hit_ratio": self.l1_hit_ratio,
+            "l2_hit_ratio": self.l2_hit_ratio,
+            "invalidations_sent": self.invalidations_sent,
+            "invalidations_received": self.invalidations_received,
+        }
+
+
+class CacheSettings(RedisCacheSettings):
+    l1_max_entries: int = 10_000
+    l1_ttl: int = 60
+    invalidation_channel: str | None = None
+
+
+class Cache(RedisCache):
+    def __init__(self, redis_url: str | None = None, **kwargs: t.Any) -> None:
+        super().__init__(redis_url=redis_url, **kwargs)
+        self._l1: OrderedDict[str, tuple[t.Any, float]] = OrderedDict()
+        self._tier_stats = TieredCacheStats()
+        self._instance_id = uuid4().hex
+        self._invalidation_task: asyncio.Task[None] | None = None
+        self._serializer = PickleSerializer()
+
+    @property
+    def _channel(self) -> str:
+        channel = self.config.cache.invalidation_channel
+        if channel:
+            return str(channel)
+        app_name = self.config.app.name if self.config.app else "acb"
+        return f"{app_name}:cache:invalidate"
+
+    def _tier_key(self, key: str, namespace: str | None) -> str:
+        """Key used in both tiers, so L1 entries and invalidations match Redis."""
+        return str(self.build_key(key, namespace=namespace))
+
+    def _loads(self, raw: bytes) -> t.Any:
+        # INCRBY stores counters as plain integers; pickles never look like one
+        if _COUNTER_PATTERN.fullmatch(raw):
+            return int(raw)
+        return self._serializer.loads(raw)
+
+    def _l1_get(self, key: str) -> tuple[t.Any, bool]:
+        entry = self._l1.get(key)
+        if entry is None:
+            return None, False
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._l1[key]
+            return None, False
+        self._l1.move_to_end(key)
+        return value, True
+
+    def _l1_set(self, key: str, value: t.Any, ttl: int | None) -> None:
+        l1_ttl = self.config.cache.l1_ttl
+        if ttl:
+            l1_ttl = min(ttl, l1_ttl)
+        self._l1[key] = (value, time.monotonic() + l1_ttl)
+        self._l1.move_to_end(key)
+        while len(self._l1) > self.config.cache.l1_max_entries:
+            self._l1.popitem(last=False)
+
+    def _l1_drop_pattern(self, pattern: str) -> None:
+        for key in [key for key in self._l1 if fnmatchcase(key, pattern)]:
+            del self._l1[key]
+
+    async def get(
+        self,
+        key: str,
+        default: t.Any = None,
+        loads_fn: t.Callable[..., t.Any] | None = None,
+        namespace: str | None = None,
+        _conn: t.Any = None,
+    ) -> t.Any:
+        key = self._tier_key(key, namespace)
+        value, found = self._l1_get(key)
+        if found:
+            self._tier_stats.l1_hits += 1
+            return value
+
+        client = await self.get_client()
+        raw = await client.get(key)
+        if raw is None:
+            self._tier_stats.misses += 1
+            return default
+
+        self._tier_stats.l2_hits += 1
+        value = self._loads(raw)
+        self._l1_set(key, value, None)
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: int | None = None,
+        dumps_fn: t.Callable[..., t.Any] | None = None,
+        namespace: str | None = None,
+        _cas_token: t.Any = None,
+        _conn: t.Any = None,
+    ) -> None:
+        key = self._tier_key(key, namespace)
+        client = await self.get_client()
+        await client.set(key, self._serializer.dumps(value), ex=ttl or None)
+        self._l1_set(key, value, ttl)
+        await self._publish_invalidation("key", key)
+
+    async def add(
+        self,
+        key: str,
+        value: t.Any,
+        ttl: int | None = None,
+        dumps_fn: t.Callable[..., t.Any] | None = None,
+        namespace: str | None = None,
+        _conn: t.Any = None,
+    ) -> bool:
+        from coredis.tokens import PureToken
+
+        key = self._tier_key(key, namespace)
+        client = await self.get_client()
+        added = await client.set(
+            key,
+            self._serializer.dumps(value),
+            ex=ttl or None,
+            condition=PureToken.NX,
+        )
+        if not added:
+            msg = f"Key {key} already exists, use .set to update the value"
+            raise ValueError(msg)
+        self._l1_set(key, value, ttl)
+        await self._publish_invalidation("key", key)
+        return True
+
+    async def increment(
+        self,
+        key: str,
+        delta: int = 1,
+        namespace: str | None = None,
+        _conn: t.Any = None,
+    ) -> int:
+        key = self._tier_key(key, namespace)
+        client = await self.get_client()
+        value = int(await client.incrby(key, delta))
+        self._l1.pop(key, None)
+        await self._publish_invalidation("key", key)
+        return value
+
+    async def expire(
+        self,
+        key: str,
+        ttl: int,
+        namespace: str | None = None,
+        _conn: t.Any = None,
+    ) -> bool:
+        key = self._tier_key(key, namespace)
+        client = await self.get_client()
+        if ttl:
+            updated = await client.expire(key, ttl)
+        else:
+            updated = await client.persist(key)
+        # The L1 copy carries the old expiry, so it is dropped everywhere
+        self._l1.pop(key, None)
+        await self._publish_invalidation("key", key)
+        return bool(updated)
+
+    async def delete(
+        self,
+        key: str,
+        namespace: str | None = None,
+        _conn: t.Any = None,
+    ) -> bool:
+        key = self._tier_key(key, namespace)
+        self._l1.pop(key, None)
+        client = await self.get_client()
+        deleted = await client.delete([key])
+        await self._publish_invalidation("key", key)
+        return bool(deleted)
+
+    async def get_many(self, keys: list[str]) -> list[t.Any]:
+        values: list[t.Any] = [None] * len(keys)
+        missing: list[int] = []
+        for index, key in enumerate(keys):
+            value, found = self._l1_get(key)
+            if found:
+                self._tier_stats.l1_hits += 1
+                values[index] = value
+            else:
+                missing.append(index)
+        if not missing:
+            return values
+
+        raw_values = await super().get_many([keys[index] for index in missing])
+        for index, raw in zip(missing, raw_values, strict=True):
+            if raw is None:
+                self._tier_stats.misses += 1
+                continue
+            self._tier_stats.l2_hits += 1
+            values[index] = self._loads(raw)
+            self._l1_set(keys[index], values[index], None)
+        return values
+
+    async def set_many(
+        self,
+        items: t.Mapping[str, t.Any],
+        ttl: int | None = None,
+    ) -> None:
+        if not items:
+            return
+        await super().set_many(
+            {key: self._serializer.dumps(value) for key, value in items.items()},
+            ttl=ttl,
+        )
+        for key, value in items.items():
+            self._l1_set(key, value, ttl)
+        await self._publish_invalidation("keys", list(items))
+
+    async def delete_many(self, keys: list[str]) -> int:
+        if not keys:
+            return 0
+        for key in keys:
+            self._l1.pop(key, None)
+        deleted = await super().delete_many(keys)
+        await self._publish_invalidation("keys", keys)
+        return deleted
+
+    async def delete_pattern(
+        self,
+        pattern: str,
+        batch_size: int | None = None,
+        rate_limit: float | None = None,
+    ) -> int:
+        self._l1_drop_pattern(pattern)
+        deleted = await super().delete_pattern(pattern, batch_size, rate_limit)
+        await self._publish_invalidation("pattern", pattern)
+        return deleted
+
+    def get_tier_stats(self) -> dict[str, t.Any]:
+        """Return per-tier hit counters and ratios."""
+        return self._tier_stats.to_dict() | {"l1_size": len(self._l1)}
+
+    async def _publish_invalidation(self, kind: str, target: str | list[str]) -> None:
+        message = json.encode(
+            {"origin": self._instance_id, "kind": kind, "target": target},
+        )
+        try:
+            client = await self.get_client()
+            await client.publish(self._channel, message)
+            self._tier_stats.invalidations_sent += 1
+        except (RedisError, OSError) as e:
+            # Other workers fall back to the L1 TTL cap
+            self.logger.warning(f"Failed to publish cache invalidation: {e}")
+
+    def _handle_invalidation(self, data: bytes | str) -> None:
+        try:
+            message = json.decode(data)
+        except DecodeError:
+            message = None
+        if not isinstance(message, dict) or not message.get("target"):
+            debug(f"Ignoring malformed cache invalidation: {data!r}")
+            return
+        if message.get("origin") == self._instance_id:
+            return
+
+        self._tier_stats.invalidations_received += 1
+        kind = message.get("kind")
+        target = message["target"]
+        if kind == "pattern":
+            self._l1_drop_pattern(str(target))
+        elif kind == "keys" and isinstance(target, list):
+            for key in target:
+                self._l1.pop(key, None)
+        else:
+            self._l1.pop(target, None)
+
+    async def _listen_for_invalidations(self) -> None:
+        while True:
+            try:
+                client = await self.get_client()
+                async with client.pubsub(
+                    channels=[self._channel],
+                    ignore_subscribe_messages=True,
+                ) as pubsub:
+                    async for message in pubsub:
+                        if message and message.get("type") == "message":
+                            self._handle_invalidation(message["data"])
+            except (RedisError, OSError) as e:
+                # Entries cached while unsubscribed may have missed updates
+                self._l1.clear()
+                self.logger.warning(f"Cache invalidation listener error: {e}")
+                await asyncio.sleep(1)
+
+    async def init(self, *args: t.Any, **kwargs: t.Any) -> None:
+        await super().init(*args, **kwargs)
+        if self._invalidation_task is None:
+            self._invalidation_task = asyncio.create_task(
+                self._listen_for_invalidations(),
+            )
+
+    async def _close(self, *args: t.Any, _conn: t.Any = None, **kwargs: t.Any) -> None:
+        if self._invalidation_task is not None:
+            self._invalidation_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._invalidation_task
+            self._invalidation_task = None
+        self._l1.clear()
+        await super()._close(*args, _conn=_conn, **kwargs)
+
+
+depends.set(Cache, "tiered")
@@ -65,7 +65,7 @@ from uuid import UUID
 import asyncio
 import typing as t
 from contextlib import asynccontextmanager, suppress
-from pydantic import Field
+from pydantic import Field, ValidationError
 
 from acb.adapters import AdapterCapability, AdapterMetadata, AdapterStatus
 from acb.cleanup import CleanupMixin
@@ -177,6 +177,10 @@ class RedisMessagingSettings(BaseMessagingSettings):
     use_lua_scripts: bool = True
     pipeline_size: int = 100
 
+    # Longest the delayed-message promoter sleeps between checks; it wakes
+    # earlier for the next due message or a locally enqueued delayed one
+    delayed_poll_interval: float = 1.0
+
     # Message retention
     message_ttl: int = 86400  # 24 hours
 
@@ -232,6 +236,7 @@ class RedisMessaging(CleanupMixin):
 
         # Background task handles
         self._delayed_processor_task: asyncio.Task[None] | None = None
+        self._delayed_wakeup = asyncio.Event()
         self._pubsub_client: t.Any = None
         self._logger: LoggerType | None = None
         self._connected: bool = False
@@ -424,7 +429,7 @@ class RedisMessaging(CleanupMixin):
                 await asyncio.wait_for(
                     client.evalsha(
                         self._lua_scripts["enqueue"],
-                        3,
+                        2,
                         target_key.encode(),
                         message_key.encode(),
                         queue_message.model_dump_json().encode(),
@@ -447,6 +452,9 @@ class RedisMessaging(CleanupMixin):
                         timeout=self._settings.send_timeout,
                     )
 
+            if delay_seconds > 0:
+                self._delayed_wakeup.set()
+
             self.logger.debug(
                 f"Sent message {queue_message.message_id} to queue {queue}",
             )
@@ -466,6 +474,32 @@ class RedisMessaging(CleanupMixin):
                 original_error=e,
             ) from e
 
+    async def enqueue_batch(
+        self,
+        queue: str,
+        messages: list[tuple[bytes, MessagePriority, dict[str, str] | None]],
+    ) -> list[str]:
+        """Add multiple messages to a queue in one round trip.
+
+        Args:
+            queue: Queue name
+            messages: (payload, priority, headers) tuples
+
+        Returns:
+            Message IDs in input order
+        """
+        return await self._send_batch(
+            [
+                QueueMessage(
+                    queue=queue,
+                    payload=message,
+                    priority=priority,
+                    headers=headers or {},
+                )
+                for message, priority, headers in messages
+            ],
+        )
+
     async def dequeue(
         self,
         queue: str,
@@ -902,7 +936,9 @@ class RedisMessaging(CleanupMixin):
             local queue_key = KEYS[1]
             local message_key = KEYS[2]
             local message_data = ARGV[1]
-            local score = tonumber(ARGV[2])
+            -- Pass the score through as a string: tonumber() would be
+            -- formatted back with only 14 significant digits
+            local score = ARGV[2]
 
             -- Store message data
             redis.call('SET', message_key, message_data)
@@ -914,6 +950,66 @@ class RedisMessaging(CleanupMixin):
             return 1
             """
 
+            # Script for atomic enqueue of many messages in one call.
+            # KEYS holds (queue_key, message_key) pairs, ARGV[1] the TTL and
+            # then one (message_data, score) pair per message.
+            enqueue_batch_script = """
+            local ttl = tonumber(ARGV[1])
+
+            for i = 1, #KEYS, 2 do
+                local message_key = KEYS[i + 1]
+                local arg = i + 1
+                redis.call('SET', message_key, ARGV[arg], 'EX', ttl)
+                redis.call('ZADD', KEYS[i], ARGV[arg + 1], message_key)
+            end
+
+            return #KEYS / 2
+            """
+
+            # Script promoting every due delayed message in one call.
+            # ARGV: now score, batch limit, queue key prefix and suffix.
+            # Returns {promoted, dropped, earliest remaining score or nil}.
+            # Unlike enqueue_batch, the target queue keys are only known once
+            # each message is read, so they are built from ARGV rather than
+            # declared in KEYS. On Redis Cluster every queue key must then
+            # hash to the same slot as the delayed key (use a hash tag in
+            # key_prefix), otherwise disable use_lua_scripts.
+            promote_delayed_script = """
+            local delayed_key = KEYS[1]
+            local now = tonumber(ARGV[1])
+            local ready = redis.call(
+                'ZRANGEBYSCORE', delayed_key, '-inf', now,
+                'WITHSCORES', 'LIMIT', 0, tonumber(ARGV[2])
+            )
+
+            local promoted = 0
+            local dropped = 0
+            for i = 1, #ready, 2 do
+                local message_key = ready[i]
+                redis.call('ZREM', delayed_key, message_key)
+                local data = redis.call('GET', message_key)
+                local ok, message = false, nil
+                if data then
+                    ok, message = pcall(cjson.decode, data)
+                end
+                if ok and type(message) == 'table' and message.queue then
+                    -- The delayed score (due time and priority) keeps FIFO
+                    -- order by due time; it is passed back as Redis's string
+                    redis.call(
+                        'ZADD', ARGV[3] .. message.queue .. ARGV[4],
+                        ready[i + 1], message_key
+                    )
+                    promoted = promoted + 1
+                else
+                    -- Expired or unreadable message data
+                    dropped = dropped + 1
+                end
+            end
+
+            local head = redis.call('ZRANGE', delayed_key, 0, 0, 'WITHSCORES')
+            return {promoted, dropped, head[2] or false}
+            """
+
             # Script for atomic dequeue
             dequeue_script = """
             local queue_key = KEYS[1]
@@ -955,7 +1051,13 @@ class RedisMessaging(CleanupMixin):
             # Register scripts
             self._lua_scripts = {
                 "enqueue": await client.script_load(enqueue_script.encode()),
+                "enqueue_batch": await client.script_load(
+                    enqueue_batch_script.encode(),
+                ),
                 "dequeue": await client.script_load(dequeue_script.encode()),
+                "promote_delayed": await client.script_load(
+                    promote_delayed_script.encode(),
+                ),
                 "ack": await client.script_load(ack_script.encode()),
             }
 
@@ -1019,7 +1121,7 @@ class RedisMessaging(CleanupMixin):
                 await asyncio.wait_for(
                     client.evalsha(
                         self._lua_scripts["enqueue"],
-                        3,
+                        2,
                         queue_key.encode(),
                         message_key.encode(),
                         message_data,
@@ -1039,6 +1141,9 @@ class RedisMessaging(CleanupMixin):
                     await pipe.zadd(queue_key.encode(), {message_key.encode(): score})
                     await asyncio.wait_for(pipe.execute(), timeout=timeout)
 
+            if message.delay_seconds > 0:
+                self._delayed_wakeup.set()
+
             self.logger.debug(
                 f"Sent message {message.message_id} to queue {message.queue}",
             )
@@ -1058,6 +1163,114 @@ class RedisMessaging(CleanupMixin):
                 original_error=e,
             ) from e
 
+    async def _send_batch(
+        self,
+        messages: list[QueueMessage],
+        timeout: float | None = None,
+    ) -> list[str]:
+        """Send many messages in one round trip (private implementation).
+
+        All messages go out in a single Lua invocation, or a single
+        transactional pipeline when scripts are unavailable, under one
+        timeout.
+
+        Args:
+            messages: Messages to send
+            timeout: Optional timeout override
+
+        Returns:
+            Message IDs in input order
+
+        Raises:
+            MessagingConnectionError: If not connected
+            MessagingOperationError: If send fails
+            MessagingTimeoutError: If operation times out
+        """
+        if not self._connected:
+            msg = "Not connected to Redis"
+            raise MessagingConnectionError(msg)
+
+        if not messages:
+            return []
+
+        client = await self._ensure_client()
+        timeout = timeout or self._settings.send_timeout
+        now = time.time()
+
+        # (queue_key, message_key, message_data, score) per message
+        entries: list[tuple[bytes, bytes, bytes, float]] = []
+        # Messages sharing a send time and priority would tie and then sort by
+        # their random keys, so each gets the next microsecond to stay FIFO.
+        # Scores near the epoch in microseconds only resolve 0.25, which rules
+        # out sub-microsecond tie-breakers
+        sequence: dict[tuple[float, int], int] = {}
+        for message in messages:
+            # Same scoring and routing as _send()
+            score = (now + message.delay_seconds) * 1_000_000 - message.priority.value
+            tie = sequence.get((score, message.priority.value), 0)
+            sequence[(score, message.priority.value)] = tie + 1
+            score += tie
+            if message.delay_seconds > 0:
+                queue_key = self._delayed_key
+            else:
+                queue_key = self._queue_key.format(topic=message.queue)
+            message_key = self._message_key.format(message_id=message.message_id)
+            entries.append(
+                (
+                    queue_key.encode(),
+                    message_key.encode(),
+                    message.model_dump_json().encode(),
+                    score,
+                ),
+            )
+
+        try:
+            if self._settings.use_lua_scripts and "enqueue_batch" in self._lua_scripts:
+                keys: list[bytes] = []
+                args: list[bytes] = [str(self._settings.message_ttl).encode()]
+                for queue_bytes, key_bytes, message_data, entry_score in entries:
+                    keys.extend((queue_bytes, key_bytes))
+                    args.extend((message_data, str(entry_score).encode()))
+                await asyncio.wait_for(
+                    client.evalsha(
+                        self._lua_scripts["enqueue_batch"],
+                        len(keys),
+                        *keys,
+                        *args,
+                    ),
+                    timeout=timeout,
+                )
+            else:
+                async with client.pipeline() as pipe:
+                    for queue_bytes, key_bytes, message_data, entry_score in entries:
+                        await pipe.set(
+                            key_bytes,
+                            message_data,
+                            ex=self._settings.message_ttl,
+                        )
+                        await pipe.zadd(queue_bytes, {key_bytes: entry_score})
+                    await asyncio.wait_for(pipe.execute(), timeout=timeout)
+
+            if any(message.delay_seconds > 0 for message in messages):
+                self._delayed_wakeup.set()
+
+            self.logger.debug(f"Sent batch of {len(messages)} messages")
+            return [str(message.message_id) for message in messages]
+
+        except TimeoutError as e:
+            msg = f"Batch send timed out after {timeout}s"
+            raise MessagingTimeoutError(
+                msg,
+                original_error=e,
+            ) from e
+        except Exception as e:
+            self.logger.exception(f"Failed to send message batch: {e}")
+            msg = "Failed to send message batch"
+            raise MessagingOperationError(
+                msg,
+                original_error=e,
+            ) from e
+
     async def _receive_with_lua_script(
         self,
         client: t.Any,
@@ -1547,60 +1760,102 @@ class RedisMessaging(CleanupMixin):
     # Background Tasks
     # ========================================================================
 
-    async def _get_ready_delayed_messages(
+    async def _promote_delayed_with_lua(
         self,
         client: t.Any,
         current_time: float,
-    ) -> list[bytes]:
-        """Get delayed messages that are ready to be processed."""
-        return await client.zrangebyscore(
+    ) -> tuple[int, int, float | None]:
+        """Promote due delayed messages server-side in one script call."""
+        queue_prefix, queue_suffix = self._queue_key.split("{topic}")
+        promoted, dropped, earliest = await client.evalsha(
+            self._lua_scripts["promote_delayed"],
+            1,
             self._delayed_key.encode(),
-            b"-inf",
             str(current_time).encode(),
-            start=0,
-            num=self._settings.batch_size,
+            str(self._settings.batch_size).encode(),
+            queue_prefix.encode(),
+            queue_suffix.encode(),
         )
+        return int(promoted), int(dropped), float(earliest) if earliest else None
 
-    async def _move_delayed_message_to_queue(
+    async def _promote_delayed_manually(
         self,
         client: t.Any,
-        message_key: bytes,
-    ) -> None:
-        """Move a single delayed message to its target queue."""
-        try:
-            # Get message data
-            message_data = await client.get(message_key)
-            if not message_data:
-                return
-
-            message = QueueMessage.model_validate_json(message_data)
-
-            # Calculate new score and queue key
-            score = time.time() * 1_000_000 - message.priority.value
-            queue_key = self._queue_key.format(topic=message.queue)
+        current_time: float,
+    ) -> tuple[int, int, float | None]:
+        """Promote due delayed messages with one read and one write pipeline."""
+        delayed_key = self._delayed_key.encode()
+        ready = await client.zrangebyscore(
+            delayed_key,
+            b"-inf",
+            str(current_time).encode(),
+            start=0,
+            num=self._settings.batch_size,
+            withscores=True,
+        )
 
-            # Move atomically
+        promoted = 0
+        if ready:
+            message_data = await client.mget([message_key for message_key, _ in ready])
             async with client.pipeline() as pipe:
-                await pipe.zrem(self._delayed_key.encode(), message_key)
-                await pipe.zadd(queue_key.encode(), {message_key: score})
+                for (message_key, score), data in zip(ready, message_data, strict=True):
+                    await pipe.zrem(delayed_key, message_key)
+                    if not data:
+                        continue
+                    try:
+                        message = QueueMessage.model_validate_json(data)
+                    except ValidationError:
+                        # Unreadable data is dropped, as the Lua script does
+                        continue
+                    queue_key = self._queue_key.format(topic=message.queue)
+                    # The delayed score already orders by due time and priority
+                    await pipe.zadd(queue_key.encode(), {message_key: score})
+                    promoted += 1
                 await pipe.execute()
 
-        except Exception as e:
-            self.logger.warning(f"Failed to process delayed message: {e}")
-
-    async def _process_delayed_batch(self, client: t.Any, current_time: float) -> int:
-        """Process a batch of ready delayed messages. Returns count processed."""
-        messages = await self._get_ready_delayed_messages(client, current_time)
+        head = await client.zrange(delayed_key, 0, 0, withscores=True)
+        earliest = float(head[0][1]) if head else None
+        return promoted, len(ready) - promoted, earliest
 
-        if not messages:
-            return 0
+    async def _process_delayed_batch(
+        self,
+        client: t.Any,
+        current_time: float,
+    ) -> tuple[int, float | None]:
+        """Promote a batch of ready delayed messages to their queues.
 
-        # Move messages to appropriate queues
-        for message_key in messages:
-            await self._move_delayed_message_to_queue(client, message_key)
+        Returns:
+            Number of messages taken off the delayed set, and the score of the
+            earliest message still waiting (None if the set is empty)
+        """
+        if self._settings.use_lua_scripts and "promote_delayed" in self._lua_scripts:
+            promoted, dropped, earliest = await self._promote_delayed_with_lua(
+                client,
+                current_time,
+            )
+        else:
+            promoted, dropped, earliest = await self._promote_delayed_manually(
+                client,
+                current_time,
+            )
 
-        self.logger.debug(f"Processed {len(messages)} delayed messages to queues")
-        return len(messages)
+        if promoted:
+            self.logger.debug(f"Processed {promoted} delayed messages to queues")
+        if dropped:
+            self.logger.warning(
+                f"Dropped {dropped} delayed messages with expired or invalid data",
+            )
+        return promoted + dropped, earliest
+
+    def _delayed_sleep(self, processed: int, earliest: float | None) -> float:
+        """Seconds until the next promotion pass should run."""
+        if processed >= self._settings.batch_size:
+            # A full batch may have left more due messages behind
+            return 0.0
+        interval = self._settings.delayed_poll_interval
+        if earliest is None:
+            return interval
+        return min(interval, max(0.0, earliest / 1_000_000 - time.time()))
 
     async def _process_delayed_messages(self) -> None:
         """Background task to process delayed messages."""
@@ -1611,11 +1866,19 @@ class RedisMessaging(CleanupMixin):
                 client = await self._ensure_client()
                 current_time = time.time() * 1_000_000
 
-                # Process batch of ready delayed messages
-                await self._process_delayed_batch(client, current_time)
+                self._delayed_wakeup.clear()
+                processed, earliest = await self._process_delayed_batch(
+                    client,
+                    current_time,
+                )
 
-                # Sleep before next check
-                await asyncio.sleep(1.0)
+                # Sleep until the earliest remaining message is due, capped by
+                # the poll interval; local delayed enqueues wake us early
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._delayed_wakeup.wait(),
+                        timeout=self._delayed_sleep(processed, earliest),
+                    )
 
             except asyncio.CancelledError:
                 break
@@ -1689,6 +1952,25 @@ class RedisMessaging(CleanupMixin):
         )
         await self._send(queue_msg)
 
+    async def publish_batch(
+        self,
+        messages: list[tuple[str, bytes, dict[str, str] | None]],
+    ) -> None:
+        """Publish multiple messages in one round trip."""
+        from uuid import uuid4
+
+        await self._send_batch(
+            [
+                QueueMessage(
+                    message_id=uuid4(),
+                    queue=topic,
+                    payload=message,
+                    headers=headers or {},
+                )
+                for topic, message, headers in messages
+            ],
+        )
+
     async def subscribe(
         self,
         topic: str,
@@ -1,8 +1,14 @@
+import time
+import weakref
+from contextvars import ContextVar
+
+import asyncio
 import typing as t
 from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
 from pydantic import SecretStr
+from sqlalchemy import event, pool, text
 from sqlalchemy import log as sqlalchemy_log
-from sqlalchemy import pool, text
 from sqlalchemy.engine import URL
 from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 from sqlalchemy_utils import create_database, database_exists
@@ -54,6 +60,13 @@ class SqlBaseSettings(Settings, SSLConfigMixin):
     command_timeout: float | None = 30.0
     pool_timeout: float | None = 30.0
 
+    # Session scoping: "shared" keeps one AsyncSession per adapter, "task"
+    # gives every asyncio task its own session borrowed from the engine pool
+    session_scope: t.Literal["shared", "task"] = "shared"
+    pool_size: int | None = None
+    max_overflow: int | None = None
+    pool_recycle: int | None = None
+
     def _build_ssl_params(self) -> dict[str, t.Any]:
         ssl_params = {}
         if self.ssl_enabled:
@@ -73,6 +86,18 @@ class SqlBaseSettings(Settings, SSLConfigMixin):
 
         return ssl_params
 
+    def _build_pool_params(self) -> dict[str, t.Any]:
+        pool_params: dict[str, t.Any] = {}
+        if self.poolclass in (pool.NullPool, pool.StaticPool):
+            return pool_params
+        if self.pool_size is not None:
+            pool_params["pool_size"] = self.pool_size
+        if self.max_overflow is not None:
+            pool_params["max_overflow"] = self.max_overflow
+        if self.pool_recycle is not None:
+            pool_params["pool_recycle"] = self.pool_recycle
+        return pool_params
+
     @depends.inject
     def __init__(self, config: Inject[Config], **values: t.Any) -> None:
         super().__init__(**values)
@@ -126,6 +151,7 @@ class SqlBaseSettings(Settings, SSLConfigMixin):
                 "poolclass": self.poolclass,
                 "pool_pre_ping": self.pool_pre_ping,
             }
+            | self._build_pool_params()
             | self.engine_kwargs
             | ssl_engine_kwargs
         )
@@ -141,11 +167,40 @@ class SqlProtocol(t.Protocol):
     async def init(self) -> None: ...
 
 
+@dataclass
+class SqlPoolMetrics:
+    """Connection checkout and session counters for a SQL adapter."""
+
+    sessions_created: int = 0
+    sessions_closed: int = 0
+    connections_created: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    checked_out: int = 0
+    peak_checked_out: int = 0
+    total_checkout_time: float = 0.0
+
+    @property
+    def avg_checkout_time(self) -> float:
+        return self.total_checkout_time / self.checkins if self.checkins else 0.0
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return asdict(self) | {"avg_checkout_time": self.avg_checkout_time}
+
+
 class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
     def __init__(self, **kwargs: t.Any) -> None:
         super().__init__(**kwargs)
         self._engine: AsyncEngine | None = None
         self._session: AsyncSession | None = None
+        # Task-scoped sessions are keyed by their owning task so that child
+        # tasks, which inherit a copy of the parent context, never share them
+        self._task_session: ContextVar[tuple[asyncio.Task[t.Any], AsyncSession] | None]
+        self._task_session = ContextVar(f"acb_sql_session_{id(self)}", default=None)
+        self._task_sessions: weakref.WeakSet[AsyncSession] = weakref.WeakSet()
+        self._closing_sessions: set[asyncio.Task[None]] = set()
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_events_engine: AsyncEngine | None = None
 
     async def _create_client(self) -> AsyncEngine:
         self.logger.debug(self.config.sql._async_url)
@@ -159,8 +214,54 @@ class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
 
     async def get_engine(self) -> AsyncEngine:
         engine = await self._ensure_client()
+        if self._pool_events_engine is not engine and isinstance(engine, AsyncEngine):
+            self._register_pool_events(engine)
         return t.cast("AsyncEngine", engine)  # type: ignore[no-any-return]
 
+    def _register_pool_events(self, engine: AsyncEngine) -> None:
+        metrics = self._pool_metrics
+
+        def on_connect(dbapi_conn: t.Any, record: t.Any) -> None:
+            metrics.connections_created += 1
+
+        def on_checkout(dbapi_conn: t.Any, record: t.Any, proxy: t.Any) -> None:
+            record.info["acb_checkout_at"] = time.perf_counter()
+            metrics.checkouts += 1
+            metrics.checked_out += 1
+            metrics.peak_checked_out = max(
+                metrics.peak_checked_out,
+                metrics.checked_out,
+            )
+
+        def on_checkin(dbapi_conn: t.Any, record: t.Any) -> None:
+            started = record.info.pop("acb_checkout_at", None)
+            if started is None:
+                return
+            metrics.checkins += 1
+            metrics.checked_out = max(0, metrics.checked_out - 1)
+            metrics.total_checkout_time += time.perf_counter() - started
+
+        sync_engine = engine.sync_engine
+        event.listen(sync_engine, "connect", on_connect)
+        event.listen(sync_engine, "checkout", on_checkout)
+        event.listen(sync_engine, "checkin", on_checkin)
+        self._pool_events_engine = engine
+
+    def get_pool_metrics(self) -> dict[str, t.Any]:
+        """Return session/checkout counters and the engine pool status."""
+        stats = self._pool_metrics.to_dict()
+        stats["session_scope"] = self._session_scope
+        stats["active_task_sessions"] = len(self._task_sessions)
+        engine = self._pool_events_engine
+        if engine is not None:
+            engine_pool = engine.sync_engine.pool
+            stats["pool_class"] = type(engine_pool).__name__
+            for name in ("size", "checkedin", "checkedout", "overflow"):
+                method = getattr(engine_pool, name, None)
+                if callable(method):
+                    stats[f"pool_{name}"] = method()
+        return stats
+
     @property
     def engine(self) -> AsyncEngine:
         if self._engine is None:
@@ -168,14 +269,61 @@ class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
             raise RuntimeError(msg)
         return self._engine
 
+    @property
+    def _session_scope(self) -> str:
+        scope = getattr(self.config.sql, "session_scope", "shared")
+        return scope if scope in ("shared", "task") else "shared"
+
+    async def _new_session(self) -> AsyncSession:
+        engine = await self.get_engine()
+        self._pool_metrics.sessions_created += 1
+        return AsyncSession(engine, expire_on_commit=False)
+
+    def _current_task_session(self) -> AsyncSession | None:
+        bound = self._task_session.get()
+        if bound is None:
+            return None
+        owner, session = bound
+        return session if owner is asyncio.current_task() else None
+
+    def _close_task_session(self, session: AsyncSession) -> None:
+        self._task_sessions.discard(session)
+        self._pool_metrics.sessions_closed += 1
+        try:
+            closing = asyncio.ensure_future(session.close())
+        except RuntimeError:
+            # Event loop already shut down; the pool is disposed with it
+            return
+        self._closing_sessions.add(closing)
+        closing.add_done_callback(self._closing_sessions.discard)
+
+    async def _ensure_task_session(self) -> AsyncSession:
+        session = self._current_task_session()
+        if session is not None:
+            return session
+        task = asyncio.current_task()
+        session = await self._new_session()
+        self._task_sessions.add(session)
+        if task is not None:
+            self._task_session.set((task, session))
+            task.add_done_callback(lambda _: self._close_task_session(session))
+        return session
+
     async def _ensure_session(self) -> AsyncSession:
+        if self._session_scope == "task":
+            return await self._ensure_task_session()
         if self._session is None:
-            engine = await self.get_engine()
-            self._session = AsyncSession(engine, expire_on_commit=False)
+            self._session = await self._new_session()
         return self._session
 
     @property
     def session(self) -> AsyncSession:
+        if self._session_scope == "task":
+            session = self._current_task_session()
+            if session is None:
+                msg = "No session bound to the current task. Use get_session()."
+                raise RuntimeError(msg)
+            return session
         if self._session is None:
             msg = "Session not initialized. Call _ensure_session() first."
             raise RuntimeError(msg)
@@ -183,9 +331,26 @@ class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
 
     @asynccontextmanager
     async def get_session(self) -> t.AsyncGenerator[AsyncSession]:
-        session = await self._ensure_session()
-        async with session as sess:
-            yield sess
+        if self._session_scope != "task":
+            session = await self._ensure_session()
+            async with session as sess:
+                yield sess
+            return
+        # Nested use within the same task reuses the outer session
+        existing = self._current_task_session()
+        if existing is not None:
+            yield existing
+            return
+        session = await self._new_session()
+        self._task_sessions.add(session)
+        token = self._task_session.set((asyncio.current_task(), session))  # type: ignore[arg-type]
+        try:
+            async with session as sess:
+                yield sess
+        finally:
+            self._task_session.reset(token)
+            self._task_sessions.discard(session)
+            self._pool_metrics.sessions_closed += 1
 
     @asynccontextmanager
     async def get_conn(self) -> t.AsyncGenerator[AsyncConnection]:
@@ -193,6 +358,32 @@ class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
         async with engine.begin() as conn:
             yield conn
 
+    async def execute(
+        self,
+        query: str,
+        parameters: dict[str, t.Any] | list[dict[str, t.Any]] | None = None,
+    ) -> t.Any:
+        """Execute a textual SQL statement on a pooled connection.
+
+        A list of parameter dictionaries is run as an ``executemany``.
+        """
+        async with self.get_conn() as conn:
+            return await conn.execute(text(query), parameters or {})
+
+    async def execute_batch(
+        self,
+        statements: list[tuple[str, dict[str, t.Any] | list[dict[str, t.Any]] | None]],
+    ) -> list[t.Any]:
+        """Execute statements in order on one connection and one transaction.
+
+        Statements whose parameters are a list run as an ``executemany``.
+        """
+        results = []
+        async with self.get_conn() as conn:
+            for query, parameters in statements:
+                results.append(await conn.execute(text(query), parameters or {}))
+        return results
+
     async def _cleanup_resources(self) -> None:
         """Enhanced SQL resource cleanup."""
         errors = []
@@ -206,6 +397,15 @@ class SqlBase(AdapterBase, CleanupMixin):  # type: ignore[misc]
             except Exception as e:
                 errors.append(f"Failed to close session: {e}")
 
+        for session in list(self._task_sessions):
+            try:
+                await session.close()
+            except Exception as e:
+                errors.append(f"Failed to close task session: {e}")
+        self._task_sessions.clear()
+        if self._closing_sessions:
+            await asyncio.gather(*self._closing_sessions, return_exceptions=True)
+
         # Clean up engine
         if self._client is not None:  # Engine is stored in _client
             try:
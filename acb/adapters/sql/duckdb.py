@@ -132,6 +132,8 @@ class SqlSettings(SqlBaseSettings):
     def _configure_engine_kwargs(self) -> None:
         """Configure SQLAlchemy engine keyword arguments."""
         self.engine_kwargs["poolclass"] = NullPool
+        for key in ("pool_size", "max_overflow"):
+            self.engine_kwargs.pop(key, None)
         self.engine_kwargs.setdefault("pool_pre_ping", False)
         connect_args = dict(self.engine_kwargs.get("connect_args", {}))
         if self.read_only:
@@ -104,6 +104,7 @@ from .publisher import (
 
 # Subscriber implementation
 from .subscriber import (
+    BufferOverflowPolicy,
     EventBuffer,
     EventFilter,
     EventRouter,
@@ -116,6 +117,7 @@ from .subscriber import (
 )
 
 __all__ = [
+    "BufferOverflowPolicy",
     # Core event classes
     "Event",
     "EventBuffer",
@@ -20,7 +20,9 @@ import asyncio
 import typing as t
 from contextlib import suppress
 from datetime import datetime
+from msgspec import msgpack
 from pydantic import BaseModel, ConfigDict, Field
+from pydantic_core import to_jsonable_python
 
 from acb.services import ServiceBase, ServiceCapability, ServiceMetadata
 from acb.services.discovery import ServiceStatus
@@ -465,6 +467,22 @@ def create_event(
     )
 
 
+# Reused for every event; payload values msgpack can't encode go through
+# pydantic's JSON conversion, matching model_dump(mode="json")
+_event_encoder = msgpack.Encoder(enc_hook=to_jsonable_python)
+_event_decoder = msgpack.Decoder()
+
+
+def encode_event(event: Event) -> bytes:
+    """Serialize an event to msgpack without an intermediate JSON-mode dump."""
+    return _event_encoder.encode(event.__pydantic_serializer__.to_python(event))
+
+
+def decode_event(data: bytes) -> Event:
+    """Rebuild an event serialized with ``encode_event()``."""
+    return Event.model_validate(_event_decoder.decode(data))
+
+
 def create_subscription(
     handler: EventHandler,
     event_type: str | None = None,
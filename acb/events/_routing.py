@@ -0,0 +1,226 @@
+"""Compiled subscription routing index for the ACB Events System.
+
+Narrows the subscriptions that can match an event without testing each one.
+Every subscription owns a bit; per-dimension tables map event attributes to
+bitsets of subscriptions that accept them, so the candidate set for an event
+is the AND of a few table lookups. Candidates are still checked with the
+subscription's full matching logic, so the index only has to be conservative.
+
+Tables are updated incrementally on add/remove; nothing is rebuilt per event.
+"""
+
+import re
+from functools import lru_cache
+from uuid import UUID
+
+import typing as t
+from dataclasses import dataclass
+
+from ._base import Event, EventPriority
+
+# Ordinal of each priority value, lowest first
+PRIORITY_LEVELS: dict[str, int] = {
+    priority.value: level for level, priority in enumerate(EventPriority)
+}
+
+
+def priority_level(priority: EventPriority | str | None) -> int:
+    """Ordinal of a priority given as an enum member or its value."""
+    value = priority.value if isinstance(priority, EventPriority) else priority
+    return PRIORITY_LEVELS.get(value or "", 0)
+
+
+@lru_cache(maxsize=1024)
+def compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+    """Compile regex patterns once, as a single alternation where possible.
+
+    ``pattern.match(value)`` on the result is equivalent to ``re.match`` with
+    any of the inputs. Patterns with capture groups are kept separate, since
+    joining them would renumber groups and break backreferences.
+    """
+    compiled = tuple(
+        re.compile(pattern)  # REGEX OK: User-provided subscription patterns
+        for pattern in patterns
+    )
+    if len(compiled) < 2 or any(pattern.groups for pattern in compiled):
+        return compiled
+    try:
+        return (re.compile("|".join(f"(?:{pattern})" for pattern in patterns)),)
+    except re.error:
+        # e.g. inline global flags are only valid at the start of a pattern
+        return compiled
+
+
+def matches_any(patterns: tuple[re.Pattern[str], ...], value: str) -> bool:
+    return any(pattern.match(value) for pattern in patterns)
+
+
+@dataclass(frozen=True)
+class RouteKey:
+    """Index dimensions a subscription constrains; ``None`` means any."""
+
+    event_types: frozenset[str] | None = None
+    type_patterns: tuple[re.Pattern[str], ...] | None = None
+    min_priority: int = 0
+    routing_keys: frozenset[str] | None = None
+
+
+def _set_bits(bits: int) -> list[int]:
+    """Return the positions of the set bits, lowest first."""
+    if bits.bit_count() > 64:
+        # Dense sets: one linear pass beats repeated big-int arithmetic
+        digits = bin(bits)[:1:-1]
+        return [index for index, digit in enumerate(digits) if digit == "1"]
+
+    positions = []
+    while bits:
+        lowest = bits & -bits
+        positions.append(lowest.bit_length() - 1)
+        bits ^= lowest
+    return positions
+
+
+class SubscriptionIndex[T]:
+    """Bitset routing tables over a set of subscriptions.
+
+    ``candidates()`` returns subscriptions ordered by ``rank`` and then by
+    insertion, matching the order of the per-category lists it replaces.
+    """
+
+    # Bound on distinct event types whose pattern matches are memoised
+    max_cached_types = 4096
+
+    def __init__(self) -> None:
+        self._items: dict[int, T] = {}
+        self._routes: dict[int, RouteKey] = {}
+        self._order: dict[int, tuple[int, int]] = {}
+        self._slots: dict[UUID, int] = {}
+        self._free_slots: list[int] = []
+        self._next_slot = 0
+        self._sequence = 0
+
+        # Event type: exact lookup, unconstrained, and regex-pattern subscribers
+        self._exact_types: dict[str, int] = {}
+        self._any_type = 0
+        self._pattern_subs = 0
+        self._pattern_matches: dict[str, int] = {}
+
+        # priority level -> subscribers accepting events at that level
+        self._priority = [0] * len(PRIORITY_LEVELS)
+
+        self._routing_keys: dict[str, int] = {}
+        self._any_routing_key = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key: UUID, item: T, route: RouteKey, rank: int = 0) -> None:
+        """Index ``item`` under ``key``, replacing any existing entry."""
+        self.remove(key)
+        slot = self._free_slots.pop() if self._free_slots else self._take_slot()
+        bit = 1 << slot
+        self._sequence += 1
+        self._slots[key] = slot
+        self._items[slot] = item
+        self._routes[slot] = route
+        self._order[slot] = (rank, self._sequence)
+
+        if route.event_types is not None:
+            for event_type in route.event_types:
+                self._exact_types[event_type] = (
+                    self._exact_types.get(event_type, 0) | bit
+                )
+        elif route.type_patterns is not None:
+            self._pattern_subs |= bit
+            for event_type in self._pattern_matches:
+                if matches_any(route.type_patterns, event_type):
+                    self._pattern_matches[event_type] |= bit
+        else:
+            self._any_type |= bit
+
+        for level in range(route.min_priority, len(self._priority)):
+            self._priority[level] |= bit
+
+        if route.routing_keys is None:
+            self._any_routing_key |= bit
+        else:
+            for routing_key in route.routing_keys:
+                self._routing_keys[routing_key] = (
+                    self._routing_keys.get(routing_key, 0) | bit
+                )
+
+    def remove(self, key: UUID) -> T | None:
+        """Drop ``key`` from every table and return its item, if indexed."""
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return None
+        mask = ~(1 << slot)
+        route = self._routes.pop(slot)
+        del self._order[slot]
+
+        if route.event_types is not None:
+            self._clear_bits(self._exact_types, route.event_types, mask)
+        elif route.type_patterns is not None:
+            self._pattern_subs &= mask
+            for event_type, bits in self._pattern_matches.items():
+                self._pattern_matches[event_type] = bits & mask
+        else:
+            self._any_type &= mask
+
+        for level in range(route.min_priority, len(self._priority)):
+            self._priority[level] &= mask
+
+        if route.routing_keys is None:
+            self._any_routing_key &= mask
+        else:
+            self._clear_bits(self._routing_keys, route.routing_keys, mask)
+
+        self._free_slots.append(slot)
+        return self._items.pop(slot)
+
+    def candidates(self, event: Event) -> list[T]:
+        """Return subscriptions the event passes every indexed dimension of."""
+        metadata = event.metadata
+        event_type = metadata.event_type
+        bits = self._any_type | self._exact_types.get(event_type, 0)
+        if self._pattern_subs:
+            bits |= self._type_pattern_bits(event_type)
+        if not bits:
+            return []
+
+        bits &= self._priority[priority_level(metadata.priority)]
+        routing_key = metadata.routing_key
+        if routing_key is None:
+            bits &= self._any_routing_key
+        else:
+            bits &= self._any_routing_key | self._routing_keys.get(routing_key, 0)
+
+        slots = _set_bits(bits)
+        if len(slots) > 1:
+            slots.sort(key=self._order.__getitem__)
+        return [self._items[slot] for slot in slots]
+
+    def _type_pattern_bits(self, event_type: str) -> int:
+        bits = self._pattern_matches.get(event_type)
+        if bits is None:
+            bits = 0
+            for slot in _set_bits(self._pattern_subs):
+                patterns = self._routes[slot].type_patterns
+                if patterns is not None and matches_any(patterns, event_type):
+                    bits |= 1 << slot
+            if len(self._pattern_matches) >= self.max_cached_types:
+                self._pattern_matches.clear()
+            self._pattern_matches[event_type] = bits
+        return bits
+
+    def _take_slot(self) -> int:
+        self._next_slot += 1
+        return self._next_slot - 1
+
+    @staticmethod
+    def _clear_bits(table: dict[str, int], keys: t.Iterable[str], mask: int) -> None:
+        for key in keys:
+            if bits := table.get(key, 0) & mask:
+                table[key] = bits
+            else:
+                table.pop(key, None)
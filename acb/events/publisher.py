@@ -23,6 +23,7 @@ from contextlib import asynccontextmanager, suppress
 from pydantic import BaseModel, Field
 
 from acb.adapters import import_adapter
+from acb.adapters.messaging import MessagePriority
 from acb.depends import depends
 from acb.services import ServiceSettings
 
@@ -31,7 +32,18 @@ from ._base import (
     EventHandlerResult,
     EventPublisherBase,
     EventSubscription,
+    decode_event,
+    encode_event,
 )
+from ._routing import RouteKey, SubscriptionIndex
+
+# Event priority value -> queue message priority
+_QUEUE_PRIORITIES: dict[str, MessagePriority] = {
+    "low": MessagePriority.LOW,
+    "normal": MessagePriority.NORMAL,
+    "high": MessagePriority.HIGH,
+    "critical": MessagePriority.CRITICAL,
+}
 
 
 class _MockSubscription:
@@ -84,6 +96,13 @@ class _MockPubSub:
         """Mock publish method - store for later processing."""
         self._pending_events.append((topic, payload))
 
+    async def publish_batch(
+        self,
+        messages: list[tuple[str, bytes, dict[str, t.Any] | None]],
+    ) -> None:
+        """Mock batch publish method - store for later processing."""
+        self._pending_events.extend((topic, payload) for topic, payload, _ in messages)
+
     def subscribe(self, topic: str) -> _MockSubscription:
         """Subscribe to topic pattern."""
         return _MockSubscription()
@@ -239,9 +258,8 @@ class EventPublisher(EventPublisherBase):
             defaultdict(list)
         )
 
-        # Event routing maps for performance
-        self._type_subscriptions: dict[str, list[EventSubscription]] = defaultdict(list)
-        self._wildcard_subscriptions: list[EventSubscription] = []
+        # Compiled routing index; type-specific subscriptions rank first
+        self._routing_index: SubscriptionIndex[EventSubscription] = SubscriptionIndex()
 
         self._logger: logging.Logger = logging.getLogger(__name__)
 
@@ -362,42 +380,7 @@ class EventPublisher(EventPublisherBase):
             msg = "Publisher is shutting down"
             raise RuntimeError(msg)
 
-        # Apply default settings if not specified
-        if not event.metadata.timeout:
-            event.metadata.timeout = self._settings.default_timeout
-
-        if event.metadata.max_retries == 3:  # Default value
-            event.metadata.max_retries = self._settings.default_max_retries
-
-        if event.metadata.retry_delay == 1.0:  # Default value
-            event.metadata.retry_delay = self._settings.default_retry_delay
-
-        # Serialize event and publish via queue adapter
-        from msgspec import msgpack
-
-        from acb.adapters.messaging import MessagePriority
-
-        # Map event priority to queue priority
-        priority_map = {
-            "low": MessagePriority.LOW,
-            "normal": MessagePriority.NORMAL,
-            "high": MessagePriority.HIGH,
-            "critical": MessagePriority.CRITICAL,
-        }
-        # Handle both EventPriority enum and string (after serialization)
-        priority_value: str = (
-            event.metadata.priority.value
-            if hasattr(event.metadata.priority, "value")
-            else str(event.metadata.priority)
-        )
-        queue_priority = priority_map.get(priority_value, MessagePriority.NORMAL)
-
-        # Create topic from event type
-        topic = f"{self._settings.event_topic_prefix}.{event.metadata.event_type}"
-
-        # Serialize event payload (convert UUIDs to strings for msgpack)
-        event_dict = event.model_dump(mode="json")
-        payload = msgpack.encode(event_dict)
+        topic, payload, queue_priority = self._prepare_event(event)
 
         # Publish to queue (using lazy loader)
         pubsub = self._ensure_pubsub()
@@ -423,6 +406,92 @@ class EventPublisher(EventPublisherBase):
                 event.metadata.priority.value,
             )
 
+    async def publish_batch(self, events: t.Sequence[Event]) -> None:
+        """Publish many events with a single backend batch call.
+
+        Events are grouped by topic and handed to the backend's
+        ``publish_batch()``, which pipelined backends send in a few network
+        writes. Backends without batch support get one ``publish()`` per event.
+
+        Args:
+            events: Events to publish
+        """
+        if self._shutdown_event.is_set():
+            msg = "Publisher is shutting down"
+            raise RuntimeError(msg)
+        if not events:
+            return
+
+        by_topic: dict[str, list[tuple[Event, bytes, MessagePriority]]] = defaultdict(
+            list
+        )
+        for event in events:
+            topic, payload, queue_priority = self._prepare_event(event)
+            by_topic[topic].append((event, payload, queue_priority))
+
+        pubsub = self._ensure_pubsub()
+        if hasattr(pubsub, "publish_batch"):
+            await pubsub.publish_batch(
+                [
+                    (
+                        topic,
+                        payload,
+                        event.metadata.headers
+                        | {"correlation_id": str(event.metadata.event_id)},
+                    )
+                    for topic, batch in by_topic.items()
+                    for event, payload, _ in batch
+                ],
+            )
+        else:
+            for topic, batch in by_topic.items():
+                for event, payload, queue_priority in batch:
+                    await pubsub.publish(
+                        topic=topic,
+                        payload=payload,
+                        priority=queue_priority,
+                        headers=event.metadata.headers,
+                        correlation_id=str(event.metadata.event_id),
+                    )
+
+        for event in events:
+            # For mock pubsub, process events directly to trigger local subscriptions
+            if isinstance(pubsub, _MockPubSub):
+                await self._process_event_for_subscriptions(event)
+            self._metrics.record_event_published()
+
+        if self._settings.log_events:
+            self._logger.debug(
+                "Published %d events across %d topics",
+                len(events),
+                len(by_topic),
+            )
+
+    def _prepare_event(self, event: Event) -> tuple[str, bytes, MessagePriority]:
+        """Apply publisher defaults and serialize an event for the backend.
+
+        Returns:
+            Topic, msgpack payload and queue priority for the event
+        """
+        # Apply default settings if not specified
+        if not event.metadata.timeout:
+            event.metadata.timeout = self._settings.default_timeout
+
+        if event.metadata.max_retries == 3:  # Default value
+            event.metadata.max_retries = self._settings.default_max_retries
+
+        if event.metadata.retry_delay == 1.0:  # Default value
+            event.metadata.retry_delay = self._settings.default_retry_delay
+
+        # Handle both EventPriority enum and string (after serialization)
+        priority = event.metadata.priority
+        priority_value = priority.value if hasattr(priority, "value") else priority
+        queue_priority = _QUEUE_PRIORITIES.get(priority_value, MessagePriority.NORMAL)
+
+        # Create topic from event type
+        topic = f"{self._settings.event_topic_prefix}.{event.metadata.event_type}"
+        return topic, encode_event(event), queue_priority
+
     async def subscribe(self, subscription: EventSubscription) -> None:
         """Add an event subscription.
 
@@ -432,11 +501,17 @@ class EventPublisher(EventPublisherBase):
         async with self._subscription_lock:
             self._subscriptions.append(subscription)
 
-            # Update routing maps for performance
-            if subscription.event_type:
-                self._type_subscriptions[subscription.event_type].append(subscription)
-            else:
-                self._wildcard_subscriptions.append(subscription)
+            # Update routing index for performance
+            self._routing_index.add(
+                subscription.subscription_id,
+                subscription,
+                RouteKey(
+                    event_types=frozenset({subscription.event_type})
+                    if subscription.event_type
+                    else None,
+                ),
+                rank=0 if subscription.event_type else 1,
+            )
 
         if self._settings.log_events:
             self._logger.debug(
@@ -460,8 +535,8 @@ class EventPublisher(EventPublisherBase):
             if not (removed_sub := self._find_and_remove_subscription(subscription_id)):
                 return False
 
-            # Update routing maps
-            self._remove_from_routing_maps(removed_sub)
+            # Update routing index
+            self._routing_index.remove(removed_sub.subscription_id)
 
             # Cancel subscription tasks
             await self._cancel_subscription_tasks(subscription_id)
@@ -481,15 +556,6 @@ class EventPublisher(EventPublisherBase):
                 return self._subscriptions.pop(i)
         return None
 
-    def _remove_from_routing_maps(self, removed_sub: EventSubscription) -> None:
-        """Remove subscription from routing maps."""
-        if removed_sub.event_type:
-            if type_subs := self._type_subscriptions.get(removed_sub.event_type):
-                with suppress(ValueError):
-                    type_subs.remove(removed_sub)
-        elif removed_sub in self._wildcard_subscriptions:
-            self._wildcard_subscriptions.remove(removed_sub)
-
     async def _cancel_subscription_tasks(self, subscription_id: UUID) -> None:
         """Cancel all active tasks for a subscription."""
         if tasks := self._subscription_tasks.get(subscription_id):
@@ -562,12 +628,9 @@ class EventPublisher(EventPublisherBase):
         queue_message: t.Any,
     ) -> None:
         """Process a single queue message containing an event."""
-        from msgspec import msgpack
-
         try:
             # Deserialize event
-            event_data = msgpack.decode(queue_message.payload)
-            event = Event.model_validate(event_data)
+            event = decode_event(queue_message.payload)
 
             # Process the event
             await self._process_event(event)
@@ -757,27 +820,12 @@ class EventPublisher(EventPublisherBase):
         event: Event,
     ) -> list[EventSubscription]:
         """Find all subscriptions that match the given event."""
-        matching = []
-
-        # Check type-specific subscriptions
-        type_subs = self._type_subscriptions.get(event.metadata.event_type, [])
-        for sub in type_subs:
-            if sub.matches(event):
-                matching.append(sub)
-
-        # Check wildcard subscriptions
-        for sub in self._wildcard_subscriptions:
-            if sub.matches(event):
-                matching.append(sub)
-
-        return matching
+        return [
+            sub for sub in self._routing_index.candidates(event) if sub.matches(event)
+        ]
 
     async def _handle_failed_event(self, event: Event) -> None:
         """Handle a failed event (retry or dead letter)."""
-        from msgspec import msgpack
-
-        from acb.adapters.messaging import MessagePriority
-
         self._metrics.record_event_failed()
 
         if event.can_retry():
@@ -792,7 +840,7 @@ class EventPublisher(EventPublisherBase):
 
             # Re-publish with delay for retry
             topic = f"{self._settings.event_topic_prefix}.{event.metadata.event_type}"
-            payload = msgpack.encode(event.model_dump(mode="json"))
+            payload = encode_event(event)
 
             # Only attempt to enqueue for real pubsub systems, not mock
             if not isinstance(self._pubsub, _MockPubSub):
@@ -13,7 +13,9 @@ Features:
 - Subscription health monitoring
 """
 
-from collections import defaultdict, deque
+import os
+import tempfile
+from collections import deque
 from collections.abc import AsyncGenerator
 from enum import Enum
 from uuid import UUID
@@ -31,6 +33,15 @@ from ._base import (
     EventHandler,
     EventHandlerResult,
     EventSubscription,
+    decode_event,
+    encode_event,
+)
+from ._routing import (
+    RouteKey,
+    SubscriptionIndex,
+    compile_patterns,
+    matches_any,
+    priority_level,
 )
 
 
@@ -42,6 +53,15 @@ class SubscriptionMode(Enum):
     HYBRID = "hybrid"  # Mix of push and pull based on conditions
 
 
+class BufferOverflowPolicy(Enum):
+    """What an EventBuffer does with a new event when it is full."""
+
+    BLOCK = "block"  # Producer waits up to put_timeout for space, then drops
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest buffered event
+    DROP_NEWEST = "drop_newest"  # Reject the incoming event
+    SPILL = "spill"  # Write overflow to a temporary file on disk
+
+
 class SubscriberSettings(ServiceSettings):
     """Settings for event subscriber configuration."""
 
@@ -63,6 +83,18 @@ class SubscriberSettings(ServiceSettings):
         description="Maximum events in buffer per subscription",
     )
     buffer_timeout: float = Field(default=5.0, description="Buffer flush timeout")
+    buffer_overflow_policy: BufferOverflowPolicy = Field(
+        default=BufferOverflowPolicy.DROP_OLDEST,
+        description="What to do with new events when a buffer is full",
+    )
+    buffer_put_timeout: float | None = Field(
+        default=None,
+        description="Max producer wait under BLOCK (defaults to buffer_timeout)",
+    )
+    buffer_spill_dir: str | None = Field(
+        default=None,
+        description="Directory for SPILL overflow files (system temp if unset)",
+    )
 
     # Batch processing
     enable_batching: bool = Field(default=False)
@@ -169,61 +201,30 @@ class EventFilter(BaseModel):
 
     def _matches_pattern_filters(self, event: Event) -> bool:
         """Check regex pattern filters for event type and source."""
-        import re
-
-        # Check event type patterns
-        if self.event_type_patterns and not any(
-            re.match(
-                pattern,
-                event.metadata.event_type,
-            )  # REGEX OK: User-provided pattern matching for event filtering
-            for pattern in self.event_type_patterns
+        # Patterns are compiled once per distinct pattern list
+        if self.event_type_patterns and not matches_any(
+            compile_patterns(tuple(self.event_type_patterns)),
+            event.metadata.event_type,
         ):
             return False
 
         # Check source patterns
-        if self.source_patterns and not any(
-            re.match(
-                pattern,
+        return not (
+            self.source_patterns
+            and not matches_any(
+                compile_patterns(tuple(self.source_patterns)),
                 event.metadata.source,
-            )  # REGEX OK: User-provided pattern matching for source filtering
-            for pattern in self.source_patterns
-        ):
-            return False
-
-        return True
+            )
+        )
 
     def _matches_priority_filter(self, event: Event) -> bool:
-        """Check minimum priority filter using match statement."""
+        """Check minimum priority filter."""
         if not self.min_priority:
             return True
 
-        # Use match statement for priority comparison
-        match self.min_priority:
-            case "low":
-                min_level = 0
-            case "normal":
-                min_level = 1
-            case "high":
-                min_level = 2
-            case "critical":
-                min_level = 3
-            case _:
-                min_level = 0
-
-        match event.metadata.priority.value:
-            case "low":
-                event_level = 0
-            case "normal":
-                event_level = 1
-            case "high":
-                event_level = 2
-            case "critical":
-                event_level = 3
-            case _:
-                event_level = 0
-
-        return event_level >= min_level
+        return priority_level(event.metadata.priority) >= priority_level(
+            self.min_priority
+        )
 
     def _matches_routing_keys(self, event: Event) -> bool:
         """Check routing key filters."""
@@ -237,77 +238,182 @@ class EventFilter(BaseModel):
 
 
 class EventBuffer:
-    """Event buffer for subscription event queuing."""
+    """Bounded event buffer for subscription event queuing.
+
+    Holds at most ``max_size`` events in memory. Overflow is handled by
+    ``overflow_policy`` and every dropped, blocked or spilled event is
+    counted, so a full buffer never loses events silently.
+    """
 
-    def __init__(self, max_size: int = 1000, timeout: float = 5.0) -> None:
-        self._buffer: deque[Event] = deque(maxlen=max_size)
+    def __init__(
+        self,
+        max_size: int = 1000,
+        timeout: float = 5.0,
+        overflow_policy: BufferOverflowPolicy = BufferOverflowPolicy.DROP_OLDEST,
+        put_timeout: float | None = None,
+        spill_dir: str | None = None,
+    ) -> None:
+        self._buffer: deque[Event] = deque()
         self._max_size = max_size
         self._timeout = timeout
+        self._overflow_policy = overflow_policy
+        # BLOCK waits are always bounded; default to the get timeout
+        self._put_timeout = timeout if put_timeout is None else put_timeout
+        self._spill_dir = spill_dir
         self._lock = asyncio.Lock()
         self._not_empty = asyncio.Condition(self._lock)
+        self._not_full = asyncio.Condition(self._lock)
+
+        # Spilled events are length-prefixed msgpack records, read back FIFO
+        self._spill_file: t.IO[bytes] | None = None
+        self._spill_read_offset = 0
+        self._spill_count = 0
 
-    async def put(self, event: Event) -> None:
-        """Add event to buffer."""
+        self.dropped_count = 0
+        self.blocked_count = 0
+        self.spilled_count = 0
+
+    @property
+    def overflow_policy(self) -> BufferOverflowPolicy:
+        return self._overflow_policy
+
+    async def put(self, event: Event) -> bool:
+        """Add event to buffer.
+
+        Returns:
+            False if the event was dropped because the buffer was full
+        """
         async with self._lock:
+            if len(self._buffer) < self._max_size and not self._spill_count:
+                self._buffer.append(event)
+                self._not_empty.notify()
+                return True
+            return await self._put_full(event)
+
+    async def _put_full(self, event: Event) -> bool:
+        """Apply the overflow policy; called with the lock held."""
+        policy = self._overflow_policy
+        if policy == BufferOverflowPolicy.SPILL:
+            self._spill(event)
+            self._not_empty.notify()
+            return True
+        if policy == BufferOverflowPolicy.DROP_OLDEST:
+            self._buffer.popleft()
             self._buffer.append(event)
+            self.dropped_count += 1
             self._not_empty.notify()
+            return True
+        if policy == BufferOverflowPolicy.BLOCK:
+            self.blocked_count += 1
+            with suppress(TimeoutError):
+                await asyncio.wait_for(
+                    self._not_full.wait_for(lambda: len(self._buffer) < self._max_size),
+                    timeout=self._put_timeout,
+                )
+                self._buffer.append(event)
+                self._not_empty.notify()
+                return True
+        self.dropped_count += 1
+        return False
 
     async def get(self, timeout: float | None = None) -> Event | None:
         """Get next event from buffer."""
-        async with self._not_empty:
-            while not self._buffer:
-                try:
-                    await asyncio.wait_for(
-                        self._not_empty.wait(),
-                        timeout=timeout or self._timeout,
-                    )
-                except TimeoutError:
-                    return None
-
-            return self._buffer.popleft()
+        events = await self.get_batch(1, timeout)
+        return events[0] if events else None
 
     async def get_batch(
         self,
         batch_size: int,
         timeout: float | None = None,
     ) -> list[Event]:
-        """Get a batch of events from buffer."""
-        events = []
-        batch_timeout = timeout or self._timeout
+        """Get a batch of events from buffer.
 
-        # Get first event (wait if necessary)
-        first_event = await self.get(batch_timeout)
-        if first_event:
-            events.append(first_event)
+        Waits up to ``timeout`` for the first event, then drains whatever is
+        available (up to ``batch_size``) under a single lock acquisition.
+        """
+        async with self._lock:
+            if not self._buffer:
+                try:
+                    await asyncio.wait_for(
+                        self._not_empty.wait_for(lambda: bool(self._buffer)),
+                        timeout=timeout or self._timeout,
+                    )
+                except TimeoutError:
+                    return []
 
-        # Get remaining events (non-blocking)
-        for _ in range(batch_size - 1):
-            try:
-                event = await asyncio.wait_for(self.get(0.01), timeout=0.01)
-                if event:
-                    events.append(event)
-                else:
-                    break
-            except TimeoutError:
-                break
+            count = min(batch_size, len(self._buffer))
+            events = [self._buffer.popleft() for _ in range(count)]
+            self._refill_from_spill()
+            self._not_full.notify(count)
+            return events
 
-        return events
+    def _spill(self, event: Event) -> None:
+        if self._spill_file is None:
+            # Lives as long as the buffer; close() releases it
+            self._spill_file = tempfile.TemporaryFile(dir=self._spill_dir)  # noqa: SIM115
+        data = encode_event(event)
+        self._spill_file.seek(0, os.SEEK_END)
+        self._spill_file.write(len(data).to_bytes(4, "big") + data)
+        self._spill_count += 1
+        self.spilled_count += 1
+
+    def _refill_from_spill(self) -> None:
+        """Move spilled events back into memory while there is room."""
+        if not self._spill_count or self._spill_file is None:
+            return
+        spill = self._spill_file
+        spill.seek(self._spill_read_offset)
+        while self._spill_count and len(self._buffer) < self._max_size:
+            size = int.from_bytes(spill.read(4), "big")
+            self._buffer.append(decode_event(spill.read(size)))
+            self._spill_count -= 1
+        self._spill_read_offset = spill.tell()
+        if not self._spill_count:
+            # Reuse the file from the start once it is fully drained
+            spill.seek(0)
+            spill.truncate()
+            self._spill_read_offset = 0
 
     def size(self) -> int:
-        """Get current buffer size."""
-        return len(self._buffer)
+        """Get current buffer size, including spilled events."""
+        return len(self._buffer) + self._spill_count
 
     def is_full(self) -> bool:
-        """Check if buffer is full."""
+        """Check if the in-memory buffer is full."""
         return len(self._buffer) >= self._max_size
 
+    def get_stats(self) -> dict[str, t.Any]:
+        """Get buffer occupancy and overflow counters."""
+        return {
+            "size": self.size(),
+            "max_size": self._max_size,
+            "overflow_policy": self._overflow_policy.value,
+            "dropped": self.dropped_count,
+            "blocked": self.blocked_count,
+            "spilled": self.spilled_count,
+            "spilled_pending": self._spill_count,
+        }
+
     async def clear(self) -> list[Event]:
         """Clear buffer and return all events."""
         async with self._lock:
             events = list(self._buffer)
             self._buffer.clear()
+            while self._spill_count:
+                self._refill_from_spill()
+                events.extend(self._buffer)
+                self._buffer.clear()
+            self._not_full.notify_all()
             return events
 
+    def close(self) -> None:
+        """Release the spill file, discarding any events still on disk."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self._spill_read_offset = 0
+        self._spill_count = 0
+
 
 class ManagedSubscription(BaseModel):
     """Managed subscription with routing and health tracking."""
@@ -368,66 +474,75 @@ class ManagedSubscription(BaseModel):
 
 
 class EventRouter:
-    """Event routing engine for subscriptions."""
+    """Event routing engine for subscriptions.
+
+    Subscriptions are kept in a compiled routing index, so finding the
+    subscribers of an event costs a few bitset operations plus a full match
+    check on the candidates only.
+    """
+
+    # Candidate ordering: type-specific, then filtered, then wildcard routes
+    _TYPE_RANK = 0
+    _FILTERED_RANK = 1
+    _WILDCARD_RANK = 2
 
     def __init__(self) -> None:
-        self._type_routes: dict[str, list[ManagedSubscription]] = defaultdict(list)
-        self._wildcard_routes: list[ManagedSubscription] = []
-        self._filtered_routes: list[ManagedSubscription] = []
+        self._index: SubscriptionIndex[ManagedSubscription] = SubscriptionIndex()
 
     def add_subscription(self, managed_sub: ManagedSubscription) -> None:
         """Add subscription to routing tables."""
         if managed_sub.subscription.event_type:
-            self._type_routes[managed_sub.subscription.event_type].append(managed_sub)
+            rank = self._TYPE_RANK
         elif managed_sub.filter:
-            self._filtered_routes.append(managed_sub)
+            rank = self._FILTERED_RANK
         else:
-            self._wildcard_routes.append(managed_sub)
+            rank = self._WILDCARD_RANK
+        self._index.add(
+            managed_sub.subscription.subscription_id,
+            managed_sub,
+            self._route_key(managed_sub),
+            rank,
+        )
 
     def remove_subscription(self, subscription_id: UUID) -> bool:
         """Remove subscription from routing tables."""
-        # Check type routes
-        for subs in self._type_routes.values():
-            for i, managed_sub in enumerate(subs):
-                if managed_sub.subscription.subscription_id == subscription_id:
-                    subs.pop(i)
-                    return True
-
-        # Check wildcard routes
-        for i, managed_sub in enumerate(self._wildcard_routes):
-            if managed_sub.subscription.subscription_id == subscription_id:
-                self._wildcard_routes.pop(i)
-                return True
-
-        # Check filtered routes
-        for i, managed_sub in enumerate(self._filtered_routes):
-            if managed_sub.subscription.subscription_id == subscription_id:
-                self._filtered_routes.pop(i)
-                return True
-
-        return False
+        return self._index.remove(subscription_id) is not None
 
     def find_matching_subscriptions(self, event: Event) -> list[ManagedSubscription]:
         """Find all subscriptions that should receive this event."""
-        matching = []
-
-        # Check type-specific routes
-        type_subs = self._type_routes.get(event.metadata.event_type, [])
-        for managed_sub in type_subs:
-            if self._subscription_matches(managed_sub, event):
-                matching.append(managed_sub)
-
-        # Check filtered routes
-        for managed_sub in self._filtered_routes:
-            if self._subscription_matches(managed_sub, event):
-                matching.append(managed_sub)
-
-        # Check wildcard routes
-        for managed_sub in self._wildcard_routes:
-            if self._subscription_matches(managed_sub, event):
-                matching.append(managed_sub)
+        return [
+            managed_sub
+            for managed_sub in self._index.candidates(event)
+            if self._subscription_matches(managed_sub, event)
+        ]
 
-        return matching
+    @staticmethod
+    def _route_key(managed_sub: ManagedSubscription) -> RouteKey:
+        """Derive the indexed constraints of a subscription and its filter."""
+        event_type = managed_sub.subscription.event_type
+        event_filter = managed_sub.filter
+        if event_filter is None:
+            return RouteKey(event_types=frozenset({event_type}) if event_type else None)
+
+        event_types = None
+        type_patterns = None
+        if event_type:
+            event_types = frozenset({event_type})
+        elif event_filter.event_types:
+            event_types = frozenset(event_filter.event_types)
+        elif event_filter.event_type_patterns:
+            type_patterns = compile_patterns(tuple(event_filter.event_type_patterns))
+
+        return RouteKey(
+            event_types=event_types,
+            type_patterns=type_patterns,
+            min_priority=priority_level(event_filter.min_priority),
+            routing_keys=(
+                frozenset(event_filter.routing_keys)
+                if event_filter.routing_keys
+                else None
+            ),
+        )
 
     def _subscription_matches(
         self,
@@ -537,6 +652,9 @@ class EventSubscriber(ServiceBase):
             buffer = EventBuffer(
                 max_size=self._settings.buffer_size,
                 timeout=self._settings.buffer_timeout,
+                overflow_policy=self._settings.buffer_overflow_policy,
+                put_timeout=self._settings.buffer_put_timeout,
+                spill_dir=self._settings.buffer_spill_dir,
             )
 
         # Create managed subscription
@@ -581,6 +699,7 @@ class EventSubscriber(ServiceBase):
         # Clear buffer if exists
         if managed_sub.buffer:
             await managed_sub.buffer.clear()
+            managed_sub.buffer.close()
 
         self.logger.debug("Removed subscription: %s", subscription_id)
         return True
@@ -775,6 +894,7 @@ class EventSubscriber(ServiceBase):
             "avg_processing_time": managed_sub.avg_processing_time,
             "health_score": managed_sub.get_health_score(),
             "buffer_size": managed_sub.buffer.size() if managed_sub.buffer else 0,
+            "buffer": managed_sub.buffer.get_stats() if managed_sub.buffer else None,
         }
 
     async def get_all_subscription_stats(self) -> list[dict[str, t.Any]]:
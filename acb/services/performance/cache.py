@@ -4,9 +4,12 @@ Provides intelligent cache optimization strategies and management
 with integration to ACB's cache adapters.
 """
 
+import math
+import random
 import time
+from collections import OrderedDict
 from enum import Enum
-from operator import itemgetter
+from itertools import islice
 
 import asyncio
 import contextlib
@@ -19,6 +22,8 @@ from acb.config import Config
 from acb.depends import Inject, depends
 from acb.services._base import ServiceBase, ServiceConfig, ServiceSettings
 
+from .eviction import LFUIndex, SegmentedLRU
+
 # Service metadata for discovery system
 SERVICE_METADATA: t.Any = None
 
@@ -80,6 +85,9 @@ class CacheStats:
     average_response_time: float = 0.0
     evictions: int = 0
     memory_usage_bytes: int = 0
+    coalesced_requests: int = 0
+    early_refreshes: int = 0
+    stale_hits: int = 0
 
 
 class CacheOptimizerSettings(ServiceSettings):
@@ -100,6 +108,16 @@ class CacheOptimizerSettings(ServiceSettings):
     usage_threshold_for_promotion: int = 10
     time_window_for_analysis_seconds: int = 3600
 
+    # Eviction
+    max_tracked_keys: int = 100_000
+    eviction_fraction: float = 0.2
+    eviction_batch_size: int = 500
+
+    # Stampede protection
+    single_flight_enabled: bool = True
+    early_refresh_beta: float = 0.0  # XFetch beta, 0 disables early refresh
+    stale_while_revalidate_seconds: int = 0
+
     @depends.inject
     def __init__(self, config: Inject[Config], **values: t.Any) -> None:
         super().__init__(**values)
@@ -132,7 +150,18 @@ class CacheOptimizer(ServiceBase):
         self._cache_adapter: t.Any = None
         self._stats = CacheStats()
         self._optimization_task: asyncio.Task[t.Any] | None = None
-        self._usage_patterns: dict[str, dict[str, t.Any]] = {}
+        # Per-key usage, kept in least to most recently used order
+        self._usage_patterns: OrderedDict[str, dict[str, t.Any]] = OrderedDict()
+        self._eviction_index: SegmentedLRU | LFUIndex | None = None
+        if self._settings.strategy == CacheStrategy.ADAPTIVE:
+            self._eviction_index = SegmentedLRU(
+                int(self._settings.max_tracked_keys * 0.8),
+            )
+        elif self._settings.strategy == CacheStrategy.LFU:
+            self._eviction_index = LFUIndex()
+        self._in_flight: dict[str, asyncio.Task[t.Any]] = {}
+        # key -> (logical expiry timestamp, last fetch duration in seconds)
+        self._refresh_meta: dict[str, tuple[float, float]] = {}
 
     async def _initialize(self) -> None:
         """Initialize the cache optimizer."""
@@ -156,6 +185,9 @@ class CacheOptimizer(ServiceBase):
             with contextlib.suppress(asyncio.CancelledError):
                 await self._optimization_task
 
+        for task in list(self._in_flight.values()):
+            task.cancel()
+
     async def _health_check(self) -> dict[str, t.Any]:
         """Health check for cache optimizer."""
         return {
@@ -178,6 +210,11 @@ class CacheOptimizer(ServiceBase):
     ) -> t.Any:
         """Get value with intelligent optimization.
 
+        Concurrent misses for the same key share a single ``fetch_function``
+        call. Hits may trigger a background refresh, either probabilistically
+        shortly before expiry (``early_refresh_beta``) or when a stale value is
+        served (``stale_while_revalidate_seconds``).
+
         Args:
             key: Cache key
             fetch_function: Function to fetch value on cache miss
@@ -197,6 +234,8 @@ class CacheOptimizer(ServiceBase):
                 # Cache hit
                 self._stats.hits += 1
                 self._update_usage_pattern(key, "hit", tags)
+                if key not in self._in_flight and self._should_refresh(key):
+                    self._start_fetch(key, fetch_function, ttl)
 
                 duration = (time.perf_counter() - start_time) * 1000
                 self._update_stats(duration)
@@ -205,13 +244,15 @@ class CacheOptimizer(ServiceBase):
 
             # Cache miss - fetch and store
             self._stats.misses += 1
-            value = await fetch_function()
-
-            # Determine optimal TTL
-            optimal_ttl = self._calculate_optimal_ttl(key, ttl)
-
-            # Store with optimization
-            await self._cache_adapter.set(key, value, ttl=optimal_ttl)
+            if not self._settings.single_flight_enabled:
+                value = await self._fetch_and_store(key, fetch_function, ttl)
+            elif key in self._in_flight:
+                self._stats.coalesced_requests += 1
+                value = await asyncio.shield(self._in_flight[key])
+            else:
+                value = await asyncio.shield(
+                    self._start_fetch(key, fetch_function, ttl),
+                )
 
             self._update_usage_pattern(key, "miss", tags)
 
@@ -225,6 +266,77 @@ class CacheOptimizer(ServiceBase):
             # Fallback to direct fetch
             return await fetch_function()
 
+    async def _fetch_and_store(
+        self,
+        key: str,
+        fetch_function: t.Callable[[], t.Awaitable[t.Any]],
+        ttl: int | None,
+    ) -> t.Any:
+        """Fetch a value and store it with its optimal TTL."""
+        started = time.perf_counter()
+        value = await fetch_function()
+        fetch_time = time.perf_counter() - started
+
+        optimal_ttl = self._calculate_optimal_ttl(key, ttl)
+        stale_ttl = self._settings.stale_while_revalidate_seconds
+        await self._cache_adapter.set(key, value, ttl=optimal_ttl + stale_ttl)
+
+        if stale_ttl or self._settings.early_refresh_beta > 0:
+            self._refresh_meta[key] = (time.time() + optimal_ttl, fetch_time)
+        return value
+
+    def _start_fetch(
+        self,
+        key: str,
+        fetch_function: t.Callable[[], t.Awaitable[t.Any]],
+        ttl: int | None,
+    ) -> asyncio.Task[t.Any]:
+        """Start the single in-flight fetch for a key.
+
+        The fetch runs as its own task so that a cancelled caller does not
+        cancel it for the other waiters.
+        """
+        task = asyncio.create_task(self._fetch_and_store(key, fetch_function, ttl))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._finish_fetch(key, done))
+        return task
+
+    def _finish_fetch(self, key: str, task: asyncio.Task[t.Any]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Retrieve the exception so background refresh failures are not
+        # reported as never retrieved; callers awaiting the task still see it
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.debug(f"Cache fetch failed for key {key}: {task.exception()}")
+
+    def _should_refresh(self, key: str) -> bool:
+        """Decide whether a cache hit should trigger a background refresh.
+
+        Stale values (past their logical expiry but still inside the
+        stale-while-revalidate window) always refresh. Fresh values refresh
+        early with the XFetch probability, which rises as expiry approaches
+        and scales with how long the last fetch took.
+        """
+        meta = self._refresh_meta.get(key)
+        if meta is None:
+            return False
+
+        expires_at, fetch_time = meta
+        now = time.time()
+        if now >= expires_at:
+            self._stats.stale_hits += 1
+            return True
+
+        beta = self._settings.early_refresh_beta
+        if beta <= 0:
+            return False
+        # 1 - random() lies in (0, 1], so the log is defined and <= 0
+        jitter = -fetch_time * beta * math.log(1.0 - random.random())  # nosec B311
+        if now + jitter >= expires_at:
+            self._stats.early_refreshes += 1
+            return True
+        return False
+
     async def preload_cache(self, patterns: list[str] | None = None) -> int:
         """Preload cache with common patterns.
 
@@ -302,6 +414,10 @@ class CacheOptimizer(ServiceBase):
                 evicted = await self._lru_eviction()
                 optimization_results["keys_evicted"] = evicted
 
+            elif self._settings.strategy == CacheStrategy.LFU:
+                evicted = await self._lfu_eviction()
+                optimization_results["keys_evicted"] = evicted
+
             elif self._settings.strategy == CacheStrategy.TTL:
                 # Clear expired entries
                 evicted = await self.clear_expired()
@@ -372,16 +488,21 @@ class CacheOptimizer(ServiceBase):
             operation: Operation type (hit/miss)
             tags: Optional tags
         """
-        if key not in self._usage_patterns:
-            self._usage_patterns[key] = {
+        pattern = self._usage_patterns.get(key)
+        if pattern is None:
+            pattern = self._usage_patterns[key] = {
                 "access_count": 0,
                 "hit_count": 0,
                 "miss_count": 0,
                 "last_accessed": time.time(),
                 "tags": tags or [],
             }
+            # Bound tracking memory by forgetting the least recently used key
+            if len(self._usage_patterns) > self._settings.max_tracked_keys:
+                self._forget_key(next(iter(self._usage_patterns)))
+        else:
+            self._usage_patterns.move_to_end(key)
 
-        pattern = self._usage_patterns[key]
         pattern["access_count"] += 1
         pattern["last_accessed"] = time.time()
 
@@ -390,6 +511,16 @@ class CacheOptimizer(ServiceBase):
         else:
             pattern["miss_count"] += 1
 
+        if self._eviction_index is not None:
+            self._eviction_index.touch(key)
+
+    def _forget_key(self, key: str) -> None:
+        """Stop tracking a key."""
+        self._usage_patterns.pop(key, None)
+        self._refresh_meta.pop(key, None)
+        if self._eviction_index is not None:
+            self._eviction_index.discard(key)
+
     def _update_stats(self, response_time_ms: float) -> None:
         """Update cache statistics.
 
@@ -406,42 +537,34 @@ class CacheOptimizer(ServiceBase):
                 + (1 - alpha) * self._stats.average_response_time
             )
 
+    def _eviction_count(self) -> int:
+        if not self._usage_patterns:
+            return 0
+        return max(1, int(len(self._usage_patterns) * self._settings.eviction_fraction))
+
     async def _adaptive_eviction(self) -> int:
-        """Perform adaptive cache eviction based on usage patterns.
+        """Perform adaptive cache eviction using the segmented LRU index.
 
         Returns:
             Number of keys evicted
         """
-        # Find least valuable keys based on patterns
-        candidates_for_eviction = []
-        current_time = time.time()
-
-        for key, pattern in self._usage_patterns.items():
-            # Calculate value score based on access frequency and recency
-            access_frequency = pattern["access_count"]
-            time_since_access = current_time - pattern["last_accessed"]
-            hit_rate = pattern["hit_count"] / max(pattern["access_count"], 1)
-
-            # Lower score = higher priority for eviction
-            value_score = (access_frequency * hit_rate) / (time_since_access + 1)
-            candidates_for_eviction.append((key, value_score))
-
-        # Sort by value score (lowest first)
-        candidates_for_eviction.sort(key=itemgetter(1))
-
-        # Evict bottom 20% of keys
-        evict_count = max(1, len(candidates_for_eviction) // 5)
-        evicted = 0
+        if not isinstance(self._eviction_index, SegmentedLRU):
+            return await self._lru_eviction()
+        return await self._evict_keys(
+            self._eviction_index.victims(self._eviction_count()),
+        )
 
-        for key, _ in candidates_for_eviction[:evict_count]:
-            try:
-                await self._cache_adapter.delete(key)
-                del self._usage_patterns[key]
-                evicted += 1
-            except Exception as e:
-                self.logger.warning(f"Failed to evict key {key}: {e}")
+    async def _lfu_eviction(self) -> int:
+        """Perform LFU-based cache eviction.
 
-        return evicted
+        Returns:
+            Number of keys evicted
+        """
+        if not isinstance(self._eviction_index, LFUIndex):
+            return await self._lru_eviction()
+        return await self._evict_keys(
+            self._eviction_index.victims(self._eviction_count()),
+        )
 
     async def _lru_eviction(self) -> int:
         """Perform LRU-based cache eviction.
@@ -449,24 +572,38 @@ class CacheOptimizer(ServiceBase):
         Returns:
             Number of keys evicted
         """
-        # Sort by last accessed time
-        sorted_patterns = sorted(
-            self._usage_patterns.items(),
-            key=lambda x: x[1]["last_accessed"],
+        return await self._evict_keys(
+            list(islice(self._usage_patterns, self._eviction_count())),
         )
 
-        # Evict oldest 20%
-        evict_count = max(1, len(sorted_patterns) // 5)
+    async def _evict_keys(self, keys: list[str]) -> int:
+        """Delete keys from the cache in batches and stop tracking them.
+
+        Returns:
+            Number of keys evicted
+        """
+        delete_many = getattr(self._cache_adapter, "delete_many", None)
+        batch_size = self._settings.eviction_batch_size
         evicted = 0
 
-        for key, _ in sorted_patterns[:evict_count]:
+        for start in range(0, len(keys), batch_size):
+            batch = keys[start : start + batch_size]
             try:
-                await self._cache_adapter.delete(key)
-                del self._usage_patterns[key]
-                evicted += 1
+                if delete_many is not None:
+                    await delete_many(batch)
+                else:
+                    await asyncio.gather(
+                        *(self._cache_adapter.delete(key) for key in batch),
+                    )
             except Exception as e:
-                self.logger.warning(f"Failed to evict key {key}: {e}")
+                self.logger.warning(f"Failed to evict {len(batch)} keys: {e}")
+                continue
+
+            for key in batch:
+                self._forget_key(key)
+            evicted += len(batch)
 
+        self._stats.evictions += evicted
         return evicted
 
     async def _optimization_loop(self) -> None:
@@ -0,0 +1,101 @@
+"""Incremental eviction indexes for the cache optimizer.
+
+Each index is updated in O(1) on every cache access, so choosing eviction
+victims never requires sorting the full set of tracked keys.
+"""
+
+from collections import OrderedDict
+from itertools import islice
+
+
+class SegmentedLRU:
+    """Segmented LRU with a probation and a protected segment.
+
+    New keys enter probation; a second access promotes them to the protected
+    segment. When the protected segment is full its least recently used key
+    is demoted back to probation. Victims are taken from the cold end of
+    probation first, so one-off keys are evicted before reused ones.
+    """
+
+    def __init__(self, protected_capacity: int) -> None:
+        self.protected_capacity = max(1, protected_capacity)
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._probation) + len(self._protected)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._probation or key in self._protected
+
+    def touch(self, key: str) -> None:
+        if key in self._protected:
+            self._protected.move_to_end(key)
+            return
+        if key not in self._probation:
+            self._probation[key] = None
+            return
+
+        del self._probation[key]
+        self._protected[key] = None
+        if len(self._protected) > self.protected_capacity:
+            demoted, _ = self._protected.popitem(last=False)
+            self._probation[demoted] = None
+
+    def discard(self, key: str) -> None:
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    def victims(self, count: int) -> list[str]:
+        victims = list(islice(self._probation, count))
+        if len(victims) < count:
+            victims.extend(islice(self._protected, count - len(victims)))
+        return victims
+
+
+class LFUIndex:
+    """Least frequently used index built on per-frequency LRU buckets.
+
+    Keys with equal access counts are ordered by recency, so ties are
+    evicted least recently used first.
+    """
+
+    def __init__(self) -> None:
+        self._frequencies: dict[str, int] = {}
+        self._buckets: dict[int, OrderedDict[str, None]] = {}
+
+    def __len__(self) -> int:
+        return len(self._frequencies)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._frequencies
+
+    def frequency(self, key: str) -> int:
+        return self._frequencies.get(key, 0)
+
+    def touch(self, key: str) -> None:
+        frequency = self._frequencies.get(key, 0)
+        if frequency:
+            self._remove_from_bucket(key, frequency)
+        self._frequencies[key] = frequency + 1
+        self._buckets.setdefault(frequency + 1, OrderedDict())[key] = None
+
+    def discard(self, key: str) -> None:
+        frequency = self._frequencies.pop(key, None)
+        if frequency is not None:
+            self._remove_from_bucket(key, frequency)
+
+    def victims(self, count: int) -> list[str]:
+        victims: list[str] = []
+        # Sorting walks distinct access counts, not keys
+        for frequency in sorted(self._buckets):
+            victims.extend(islice(self._buckets[frequency], count - len(victims)))
+            if len(victims) >= count:
+                break
+        return victims
+
+    def _remove_from_bucket(self, key: str, frequency: int) -> None:
+        bucket = self._buckets[frequency]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[frequency]
@@ -113,6 +113,7 @@ class QueryOptimizerSettings(ServiceSettings):
     connection_pooling_enabled: bool = True
     query_caching_enabled: bool = True
     batch_optimization_enabled: bool = True
+    batch_max_concurrency: int = 4  # Query groups executed in parallel
 
     # Analysis parameters
     minimum_executions_for_analysis: int = 5
@@ -251,9 +252,9 @@ class QueryOptimizer(ServiceBase):
         Returns:
             List of query results
         """
+        results: list[t.Any] = []
         if not self._settings.batch_optimization_enabled:
             # Execute individually if batch optimization is disabled
-            results = []
             for i, query in enumerate(queries):
                 params = parameters_list[i] if parameters_list else None
                 result = await self.execute_optimized_query(query, params)
@@ -265,16 +266,34 @@ class QueryOptimizer(ServiceBase):
         try:
             # Group similar queries for batch execution
             grouped_queries = self._group_similar_queries(queries, parameters_list)
-            results = []
-
-            for query_group in grouped_queries:
-                # Execute each group as a batch
-                group_results = await self._execute_query_group(query_group)
-                results.extend(group_results)
+            results = [None] * len(queries)
+            semaphore = asyncio.Semaphore(max(1, self._settings.batch_max_concurrency))
+
+            async def run_group(query_group: dict[str, t.Any]) -> None:
+                async with semaphore:
+                    group_results = await self._execute_query_group(query_group)
+                for execution, result in zip(
+                    query_group["executions"],
+                    group_results,
+                    strict=True,
+                ):
+                    results[execution["index"]] = result
+
+            # Consecutive read-only groups run in parallel, each on its own
+            # connection; groups that write run alone, in input order
+            waves: list[list[dict[str, t.Any]]] = []
+            for group in grouped_queries:
+                if group["read_only"] and waves and waves[-1][0]["read_only"]:
+                    waves[-1].append(group)
+                else:
+                    waves.append([group])
+            for wave in waves:
+                await asyncio.gather(*(run_group(group) for group in wave))
 
             execution_time = (time.perf_counter() - start_time) * 1000
             self.set_custom_metric("batch_execution_time", execution_time)
             self.set_custom_metric("queries_in_batch", len(queries))
+            self.set_custom_metric("query_groups_in_batch", len(grouped_queries))
 
             return results
 
@@ -457,41 +476,110 @@ class QueryOptimizer(ServiceBase):
             queries: List of queries
             parameters_list: List of parameter dictionaries
 
+        Queries are only grouped across other queries when neither side
+        writes, so no statement is moved past a write it follows or precedes.
+
         Returns:
-            List of query groups
+            List of query groups in order of their first query
         """
-        groups: dict[str, dict[str, t.Any]] = {}
+        groups: list[dict[str, t.Any]] = []
+        open_groups: dict[str, dict[str, t.Any]] = {}
 
         for i, query in enumerate(queries):
             query_hash = self._hash_query(query)
             params = parameters_list[i] if parameters_list else None
+            read_only = self._classify_query(query) == QueryType.SELECT
 
-            if query_hash not in groups:
-                groups[query_hash] = {
+            for other_hash, other in list(open_groups.items()):
+                if other_hash != query_hash and not (read_only and other["read_only"]):
+                    del open_groups[other_hash]
+
+            group = open_groups.get(query_hash)
+            if group is None:
+                group = {
                     "template_query": query,
                     "query_hash": query_hash,
+                    "read_only": read_only,
                     "executions": [],
                 }
+                open_groups[query_hash] = group
+                groups.append(group)
 
-            groups[query_hash]["executions"].append(
+            group["executions"].append(
                 {"query": query, "parameters": params, "index": i},
             )
 
-        return list(groups.values())
+        return groups
+
+    def _plan_group_statements(
+        self,
+        query_group: dict[str, t.Any],
+    ) -> list[tuple[str, t.Any, list[int]]]:
+        """Collapse a query group into the statements to send.
+
+        Identical parameterised INSERT/UPDATE/DELETE statements are merged into
+        one statement with a parameter list, which SQLAlchemy runs as an
+        ``executemany`` (multi-row ``VALUES`` for inserts). Everything else is
+        sent as its own statement.
+
+        Returns:
+            List of (query, parameters, positions in the group) tuples
+        """
+        statements: list[tuple[str, t.Any, list[int]]] = []
+        mergeable: dict[str, int] = {}
+
+        for position, execution in enumerate(query_group["executions"]):
+            query = execution["query"]
+            parameters = execution["parameters"]
+            if parameters and self._classify_query(query) in (
+                QueryType.INSERT,
+                QueryType.UPDATE,
+                QueryType.DELETE,
+            ):
+                if query in mergeable:
+                    _, params_list, positions = statements[mergeable[query]]
+                    params_list.append(parameters)
+                    positions.append(position)
+                    continue
+                mergeable[query] = len(statements)
+                statements.append((query, [parameters], [position]))
+            else:
+                statements.append((query, parameters, [position]))
+
+        return statements
 
     async def _execute_query_group(self, query_group: dict[str, t.Any]) -> list[t.Any]:
         """Execute a group of similar queries.
 
+        When the SQL adapter provides ``execute_batch`` the whole group runs on
+        a single connection, with matching DML statements merged into one
+        ``executemany``. Merged executions all receive the batch result.
+
         Args:
             query_group: Group of similar queries
 
         Returns:
             List of results in original order
         """
-        results = []
+        statements = self._plan_group_statements(query_group)
+        execute_batch = getattr(self._sql_adapter, "execute_batch", None)
+        results: list[t.Any] = []
+
+        if execute_batch is not None:
+            statement_results = await execute_batch(
+                [(query, parameters) for query, parameters, _ in statements],
+            )
+            results = [None] * len(query_group["executions"])
+            for (_, _, positions), result in zip(
+                statements,
+                statement_results,
+                strict=True,
+            ):
+                for position in positions:
+                    results[position] = result
+            return results
 
-        # For now, execute each query individually
-        # This could be enhanced with actual batch execution for supported databases
+        # Adapter without batch support: execute each query individually
         for execution in query_group["executions"]:
             query = execution["query"]
             parameters = execution["parameters"]
@@ -11,7 +11,8 @@ This module provides a comprehensive repository pattern implementation with:
 Phase 1 Component: Essential data access patterns for the ACB framework.
 """
 
-from ._base import RepositoryBase, RepositoryError, RepositorySettings
+from ._base import BatchResult, RepositoryBase, RepositoryError, RepositorySettings
+from .bulk import NoSqlBulkOperationsMixin, SqlBulkOperationsMixin
 from .cache import CachedRepository, RepositoryCacheSettings
 from .coordinator import MultiDatabaseCoordinator
 from .query_builder import QueryBuilder, QueryResult
@@ -27,8 +28,10 @@ from .unit_of_work import UnitOfWork, UnitOfWorkManager
 
 __all__ = [
     "AndSpecification",
+    "BatchResult",
     "CachedRepository",
     "MultiDatabaseCoordinator",
+    "NoSqlBulkOperationsMixin",
     "NotSpecification",
     "OrSpecification",
     "QueryBuilder",
@@ -40,6 +43,7 @@ __all__ = [
     "RepositoryService",
     "RepositorySettings",
     "Specification",
+    "SqlBulkOperationsMixin",
     "UnitOfWork",
     "UnitOfWorkManager",
 ]
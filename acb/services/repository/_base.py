@@ -8,11 +8,13 @@ Provides foundational repository pattern implementation with:
 """
 
 import builtins
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
 
 import typing as t
-from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from pydantic import Field, field_validator
 from typing import Any, TypeVar
 
@@ -108,6 +110,36 @@ class PaginationInfo:
         return self.page > 1
 
 
+@dataclass
+class BatchResult:
+    """Outcome of a chunked batch operation."""
+
+    operation: str
+    total: int = 0
+    affected: int = 0
+    chunk_size: int = 0
+    chunk_timings: builtins.list[float] = field(default_factory=builtins.list)
+
+    @property
+    def chunks(self) -> int:
+        return len(self.chunk_timings)
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.chunk_timings)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "operation": self.operation,
+            "total": self.total,
+            "affected": self.affected,
+            "chunk_size": self.chunk_size,
+            "chunks": self.chunks,
+            "chunk_timings": self.chunk_timings.copy(),
+            "total_time": self.total_time,
+        }
+
+
 class RepositorySettings(Settings):
     """Repository configuration settings."""
 
@@ -205,6 +237,7 @@ class RepositoryBase[EntityType, IDType](CleanupMixin, ABC):
         self._cache = None
         self._metrics: dict[str, t.Any] = {}
         self._logger: t.Any = None
+        self.last_batch_result: BatchResult | None = None
 
     async def _async_init(self) -> None:
         """Async initialization of repository dependencies."""
@@ -313,6 +346,31 @@ class RepositoryBase[EntityType, IDType](CleanupMixin, ABC):
             raise EntityNotFoundError(self.entity_name, entity_id)
         return entity
 
+    def get_entity_id(self, entity: EntityType) -> IDType | None:
+        """Return an entity's ID.
+
+        Backends whose primary key is not an ``id`` attribute override this.
+        """
+        return getattr(entity, "id", None)
+
+    async def get_many_by_ids(
+        self,
+        entity_ids: builtins.list[IDType],
+    ) -> builtins.list[EntityType]:
+        """Get several entities by ID.
+
+        Backends override this with a single set-based query; the default
+        looks each ID up individually.
+
+        Args:
+            entity_ids: List of entity IDs to fetch
+
+        Returns:
+            Found entities in the order of ``entity_ids``; missing IDs are skipped
+        """
+        entities = [await self.get_by_id(entity_id) for entity_id in entity_ids]
+        return [entity for entity in entities if entity is not None]
+
     @abstractmethod
     async def update(self, entity: EntityType) -> EntityType:
         """Update an existing entity.
@@ -431,48 +489,141 @@ class RepositoryBase[EntityType, IDType](CleanupMixin, ABC):
 
         return entities, pagination
 
+    @asynccontextmanager
+    async def _batch_transaction(self) -> t.AsyncIterator[Any]:
+        """Open the transaction a batch operation runs in.
+
+        The yielded handle is passed to the ``_bulk_*`` hooks. The default
+        yields ``None``; backend repositories open a session or transaction.
+        """
+        yield None
+
+    async def _bulk_create(
+        self,
+        entities: builtins.list[EntityType],
+        transaction: Any,
+    ) -> builtins.list[EntityType]:
+        """Create one chunk of entities. Override with a set-based insert."""
+        return [await self.create(entity) for entity in entities]
+
+    async def _bulk_update(
+        self,
+        entities: builtins.list[EntityType],
+        transaction: Any,
+    ) -> builtins.list[EntityType]:
+        """Update one chunk of entities. Override with a set-based update."""
+        return [await self.update(entity) for entity in entities]
+
+    async def _bulk_delete(
+        self,
+        entity_ids: builtins.list[IDType],
+        transaction: Any,
+    ) -> int:
+        """Delete one chunk of IDs. Override with ``DELETE ... WHERE id IN``."""
+        deleted_count = 0
+        for entity_id in entity_ids:
+            if await self.delete(entity_id):
+                deleted_count += 1
+        return deleted_count
+
+    async def _run_batch(
+        self,
+        operation: str,
+        items: builtins.list[Any],
+        handler: t.Callable[[builtins.list[Any], Any], t.Awaitable[Any]],
+        chunk_size: int | None,
+    ) -> tuple[builtins.list[Any], BatchResult]:
+        size = max(1, chunk_size or self.settings.batch_size)
+        result = BatchResult(operation=operation, total=len(items), chunk_size=size)
+        outputs: builtins.list[Any] = []
+        try:
+            async with self._batch_transaction() as transaction:
+                for start in range(0, len(items), size):
+                    chunk_start = time.perf_counter()
+                    outputs.append(
+                        await handler(items[start : start + size], transaction),
+                    )
+                    result.chunk_timings.append(time.perf_counter() - chunk_start)
+        except Exception as e:
+            await self._handle_error(e, operation)
+        self.last_batch_result = result
+        await self._increment_metric(operation, success=True)
+        return outputs, result
+
     async def batch_create(
         self,
         entities: builtins.list[EntityType],
+        chunk_size: int | None = None,
     ) -> builtins.list[EntityType]:
         """Create multiple entities in batch.
 
+        Entities are written in chunks of ``chunk_size`` (defaults to
+        ``settings.batch_size``) inside a single transaction. Per-chunk timings
+        are recorded in ``last_batch_result``.
+
         Args:
             entities: List of entities to create
+            chunk_size: Number of entities per chunk
 
         Returns:
             List of created entities
         """
-        return [await self.create(entity) for entity in entities]
+        chunks, result = await self._run_batch(
+            "batch_create",
+            entities,
+            self._bulk_create,
+            chunk_size,
+        )
+        created = [entity for chunk in chunks for entity in chunk]
+        result.affected = len(created)
+        return created
 
     async def batch_update(
         self,
         entities: builtins.list[EntityType],
+        chunk_size: int | None = None,
     ) -> builtins.list[EntityType]:
         """Update multiple entities in batch.
 
         Args:
             entities: List of entities to update
+            chunk_size: Number of entities per chunk
 
         Returns:
             List of updated entities
         """
-        return [await self.update(entity) for entity in entities]
+        chunks, result = await self._run_batch(
+            "batch_update",
+            entities,
+            self._bulk_update,
+            chunk_size,
+        )
+        updated = [entity for chunk in chunks for entity in chunk]
+        result.affected = len(updated)
+        return updated
 
-    async def batch_delete(self, entity_ids: builtins.list[IDType]) -> int:
+    async def batch_delete(
+        self,
+        entity_ids: builtins.list[IDType],
+        chunk_size: int | None = None,
+    ) -> int:
         """Delete multiple entities by ID.
 
         Args:
             entity_ids: List of entity IDs to delete
+            chunk_size: Number of IDs per chunk
 
         Returns:
             Number of entities deleted
         """
-        deleted_count = 0
-        for entity_id in entity_ids:
-            if await self.delete(entity_id):
-                deleted_count += 1
-        return deleted_count
+        counts, result = await self._run_batch(
+            "batch_delete",
+            entity_ids,
+            self._bulk_delete,
+            chunk_size,
+        )
+        result.affected = sum(counts)
+        return result.affected
 
     async def get_metrics(self) -> dict[str, Any]:
         """Get repository performance metrics.
@@ -484,6 +635,9 @@ class RepositoryBase[EntityType, IDType](CleanupMixin, ABC):
             "entity_type": self.entity_name,
             "cache_enabled": self.settings.cache_enabled,
             "operations": self._metrics.copy(),
+            "last_batch": self.last_batch_result.to_dict()
+            if self.last_batch_result
+            else None,
             "settings": {
                 "default_page_size": self.settings.default_page_size,
                 "max_page_size": self.settings.max_page_size,
@@ -0,0 +1,261 @@
+"""Set-based batch operations for backend repositories.
+
+Mixins that replace the per-entity fallbacks of ``RepositoryBase`` batch
+operations with set-based statements:
+- SQL: ORM bulk INSERT (multi-row ``VALUES``), bulk UPDATE by primary key
+  (``executemany``) and ``DELETE ... WHERE id IN (...)``
+- NoSQL: ``insert_many`` and ``delete_many`` with an ``$in`` filter
+
+Both run every chunk of a batch inside one transaction. Both also implement
+``execute_query`` so ``QueryBuilder`` queries run as one server-side statement.
+"""
+
+from collections.abc import AsyncIterator
+
+from contextlib import asynccontextmanager
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+from acb.depends import depends
+
+from .query_builder import CompiledQuery, QueryType
+
+
+def _entity_to_dict(entity: Any) -> dict[str, Any]:
+    if hasattr(entity, "model_dump"):
+        return entity.model_dump()
+    if is_dataclass(entity) and not isinstance(entity, type):
+        return asdict(entity)
+    return {k: v for k, v in vars(entity).items() if not k.startswith("_")}
+
+
+class SqlBulkOperationsMixin:
+    """Set-based batch operations for repositories of SQLModel entities.
+
+    Combine with ``RepositoryBase``::
+
+        class UserRepository(SqlBulkOperationsMixin, RepositoryBase[User, int]): ...
+    """
+
+    entity_type: type[Any]
+    _sql_adapter: Any = None
+
+    async def _get_sql_adapter(self) -> Any:
+        if self._sql_adapter is None:
+            from acb.adapters import import_adapter
+
+            Sql = import_adapter("sql")
+            self._sql_adapter = await depends.get(Sql)
+        return self._sql_adapter
+
+    def _primary_key_columns(self) -> list[Any]:
+        from sqlalchemy import inspect
+
+        return list(inspect(self.entity_type).primary_key)
+
+    def get_entity_id(self, entity: Any) -> Any:
+        """Return the entity's mapped primary key value."""
+        (pk,) = self._primary_key_columns()
+        return getattr(entity, pk.key, None)
+
+    @asynccontextmanager
+    async def _batch_transaction(self) -> AsyncIterator[Any]:
+        sql = await self._get_sql_adapter()
+        async with sql.get_session() as session, session.begin():
+            yield session
+
+    async def _bulk_create(
+        self,
+        entities: list[Any],
+        transaction: Any,
+    ) -> list[Any]:
+        # A flush of many pending objects is emitted as batched multi-row
+        # INSERT ... VALUES and still populates generated primary keys
+        transaction.add_all(entities)
+        await transaction.flush()
+        return entities
+
+    async def _bulk_update(
+        self,
+        entities: list[Any],
+        transaction: Any,
+    ) -> list[Any]:
+        from sqlalchemy import update
+
+        rows = [_entity_to_dict(entity) for entity in entities]
+        # ORM bulk UPDATE by primary key runs as a single executemany
+        await transaction.execute(update(self.entity_type), rows)
+        return entities
+
+    async def _bulk_delete(
+        self,
+        entity_ids: list[Any],
+        transaction: Any,
+    ) -> int:
+        from sqlalchemy import delete
+
+        (pk,) = self._primary_key_columns()
+        result = await transaction.execute(
+            delete(self.entity_type).where(pk.in_(entity_ids)),
+        )
+        return int(getattr(result, "rowcount", 0) or 0)
+
+    async def get_many_by_ids(self, entity_ids: list[Any]) -> list[Any]:
+        """Fetch entities with one ``SELECT ... WHERE id IN (...)``."""
+        from sqlalchemy import select
+
+        if not entity_ids:
+            return []
+        (pk,) = self._primary_key_columns()
+        sql = await self._get_sql_adapter()
+        async with sql.get_session() as session:
+            result = await session.execute(
+                select(self.entity_type).where(pk.in_(entity_ids)),
+            )
+            by_id = {getattr(entity, pk.key): entity for entity in result.scalars()}
+        return [by_id[entity_id] for entity_id in entity_ids if entity_id in by_id]
+
+    async def execute_query(self, query: CompiledQuery) -> Any:
+        """Run a compiled ``QueryBuilder`` query as a single SQL statement."""
+        from sqlalchemy import select, text
+
+        statement = text(query.sql).bindparams(**query.params)
+        sql = await self._get_sql_adapter()
+        async with sql.get_session() as session:
+            if query.query_type == QueryType.SELECT and not query.fields:
+                result = await session.execute(
+                    select(self.entity_type).from_statement(statement),
+                )
+                return list(result.scalars().all())
+            result = await session.execute(statement)
+            if query.query_type == QueryType.COUNT:
+                return int(result.scalar_one())
+            if query.query_type == QueryType.EXISTS:
+                return result.first() is not None
+            rows = [dict(row._mapping) for row in result]
+            if query.query_type == QueryType.AGGREGATE and not query.group_by:
+                return rows[0] if rows else {}
+            return rows
+
+
+class NoSqlBulkOperationsMixin:
+    """Set-based batch operations for repositories backed by the NoSQL adapter.
+
+    ``collection_name`` defaults to the lower-cased entity name and
+    ``id_field`` to ``"_id"``.
+    """
+
+    entity_type: type[Any]
+    entity_name: str
+    collection_name: str | None = None
+    id_field: str = "_id"
+    _nosql_adapter: Any = None
+
+    async def _get_nosql_adapter(self) -> Any:
+        if self._nosql_adapter is None:
+            from acb.adapters import import_adapter
+
+            Nosql = import_adapter("nosql")
+            self._nosql_adapter = await depends.get(Nosql)
+        return self._nosql_adapter
+
+    @property
+    def _collection(self) -> str:
+        return self.collection_name or self.entity_name.lower()
+
+    def _from_document(self, document: dict[str, Any]) -> Any:
+        data = dict(document)
+        if self.id_field != "id" and self.id_field in data:
+            data["id"] = data.pop(self.id_field)
+        return self.entity_type(**data)
+
+    def _to_document(self, entity: Any) -> dict[str, Any]:
+        document = _entity_to_dict(entity)
+        if self.id_field != "id" and "id" in document and self.id_field not in document:
+            document[self.id_field] = document.pop("id")
+        return document
+
+    @asynccontextmanager
+    async def _batch_transaction(self) -> AsyncIterator[Any]:
+        nosql = await self._get_nosql_adapter()
+        transaction = getattr(nosql, "transaction", None)
+        if transaction is None:
+            yield nosql
+            return
+        async with transaction():
+            yield nosql
+
+    async def _bulk_create(
+        self,
+        entities: list[Any],
+        transaction: Any,
+    ) -> list[Any]:
+        documents = [self._to_document(entity) for entity in entities]
+        await transaction.insert_many(self._collection, documents)
+        return entities
+
+    async def _bulk_update(
+        self,
+        entities: list[Any],
+        transaction: Any,
+    ) -> list[Any]:
+        documents = [self._to_document(entity) for entity in entities]
+        # The adapter protocol has no bulk write, and a transaction session
+        # must not be used concurrently, so updates run one after another
+        for document in documents:
+            await transaction.update_one(
+                self._collection,
+                {self.id_field: document[self.id_field]},
+                {"$set": document},
+            )
+        return entities
+
+    async def _bulk_delete(
+        self,
+        entity_ids: list[Any],
+        transaction: Any,
+    ) -> int:
+        result: Any = await transaction.delete_many(
+            self._collection,
+            {self.id_field: {"$in": entity_ids}},
+        )
+        # Adapters return a driver result (Mongo's DeleteResult), a
+        # {"deleted_count": n} dict or a plain count
+        if isinstance(result, dict):
+            return int(result.get("deleted_count", 0))
+        return int(getattr(result, "deleted_count", result) or 0)
+
+    async def get_many_by_ids(self, entity_ids: list[Any]) -> list[Any]:
+        """Fetch entities with one ``find`` using an ``$in`` filter."""
+        if not entity_ids:
+            return []
+        nosql = await self._get_nosql_adapter()
+        documents = await nosql.find(
+            self._collection,
+            {self.id_field: {"$in": entity_ids}},
+        )
+        by_id = {document[self.id_field]: document for document in documents}
+        return [
+            self._from_document(by_id[entity_id])
+            for entity_id in entity_ids
+            if entity_id in by_id
+        ]
+
+    async def execute_query(self, query: CompiledQuery) -> Any:
+        """Run a compiled ``QueryBuilder`` query as one find/count/aggregate."""
+        nosql = await self._get_nosql_adapter()
+        if query.query_type == QueryType.AGGREGATE:
+            rows = await nosql.aggregate(self._collection, query.nosql["pipeline"])
+            if not query.group_by:
+                return rows[0] if rows else {}
+            return rows
+        if query.query_type in (QueryType.COUNT, QueryType.EXISTS):
+            count = await nosql.count(self._collection, query.nosql["filter"])
+            return count > 0 if query.query_type == QueryType.EXISTS else int(count)
+        find_args = dict(query.nosql)
+        documents = await nosql.find(
+            self._collection, find_args.pop("filter"), **find_args
+        )
+        if query.fields:
+            return documents
+        return [self._from_document(document) for document in documents]
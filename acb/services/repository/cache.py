@@ -133,6 +133,12 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
         self._metrics: CacheMetrics = CacheMetrics()  # type: ignore[assignment]
         self._query_cache: dict[str, tuple[Any, datetime]] = {}
 
+    async def _increment_metric(self, operation: str, success: bool = True) -> None:
+        """Operation metrics are recorded by the wrapped repository.
+
+        ``_metrics`` holds cache metrics here, not the base operation counters.
+        """
+
     async def _ensure_cache(self) -> Any | None:
         """Ensure cache adapter is available."""
         if self._cache is None:
@@ -213,6 +219,54 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
             self._metrics.errors += 1
             return False
 
+    async def _get_many_from_cache(self, keys: list[str]) -> list[Any]:
+        """Get several values from cache in one round trip.
+
+        Returns:
+            Values in the order of ``keys``, ``None`` for misses
+        """
+        cache = await self._ensure_cache()
+        if not cache or not keys:
+            return [None] * len(keys)
+
+        try:
+            get_many = getattr(cache, "get_many", None)
+            if get_many is not None:
+                values = list(await get_many(keys))
+            else:
+                values = [await cache.get(key) for key in keys]
+        except Exception:
+            self._metrics.errors += 1
+            return [None] * len(keys)
+
+        hits = sum(value is not None for value in values)
+        self._metrics.hits += hits
+        self._metrics.misses += len(keys) - hits
+        return values
+
+    async def _set_many_in_cache(self, items: dict[str, Any], ttl: int) -> bool:
+        """Set several values in cache in one round trip.
+
+        Returns:
+            True if successful, False otherwise
+        """
+        cache = await self._ensure_cache()
+        if not cache or not items:
+            return False
+
+        try:
+            set_many = getattr(cache, "set_many", None)
+            if set_many is not None:
+                await set_many(items, ttl=ttl)
+            else:
+                for key, value in items.items():
+                    await cache.set(key, value, ttl=ttl)
+            self._metrics.writes += len(items)
+            return True
+        except Exception:
+            self._metrics.errors += 1
+            return False
+
     async def _invalidate_cache_key(self, key: str) -> bool:
         """Invalidate cache key.
 
@@ -231,6 +285,25 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
             self._metrics.errors += 1
             return False
 
+    async def _invalidate_cache_pattern(self, pattern: str) -> int:
+        """Invalidate all cache keys matching a glob-style pattern.
+
+        Returns:
+            Number of keys invalidated, 0 if the backend has no pattern deletion
+        """
+        cache = await self._ensure_cache()
+        delete_pattern = getattr(cache, "delete_pattern", None)
+        if delete_pattern is None:
+            return 0
+
+        try:
+            deleted = int(await delete_pattern(pattern) or 0)
+            self._metrics.invalidations += deleted
+            return deleted
+        except Exception:
+            self._metrics.errors += 1
+            return 0
+
     async def _invalidate_entity_cache(self, entity_id: IDType) -> None:
         """Invalidate cache entries for an entity."""
         if self.cache_settings.invalidation == InvalidationStrategy.TTL_ONLY:
@@ -317,6 +390,57 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
             await self._increment_metric("get_by_id", False)
             raise
 
+    def get_entity_id(self, entity: EntityType) -> IDType | None:
+        return self.wrapped.get_entity_id(entity)
+
+    async def get_many_by_ids(
+        self,
+        entity_ids: builtins.list[IDType],
+    ) -> builtins.list[EntityType]:
+        """Get several entities by ID with one cache read and one backend query."""
+        try:
+            entities: dict[IDType, EntityType] = {}
+            missing = list(entity_ids)
+
+            if self.cache_settings.strategy == CacheStrategy.CACHE_ASIDE:
+                keys = [self._build_entity_key(entity_id) for entity_id in entity_ids]
+                cached = await self._get_many_from_cache(keys)
+                missing = []
+                for entity_id, value in zip(entity_ids, cached, strict=True):
+                    if value is None:
+                        missing.append(entity_id)
+                    else:
+                        entities[entity_id] = value
+
+            if missing:
+                fetched = await self.wrapped.get_many_by_ids(missing)
+                found = {
+                    self.wrapped.get_entity_id(entity): entity for entity in fetched
+                }
+                entities.update(
+                    (entity_id, found[entity_id])
+                    for entity_id in missing
+                    if entity_id in found
+                )
+                if self.cache_settings.strategy != CacheStrategy.WRITE_BEHIND:
+                    await self._set_many_in_cache(
+                        {
+                            self._build_entity_key(entity_id): found[entity_id]
+                            for entity_id in missing
+                            if entity_id in found
+                        },
+                        self.cache_settings.entity_ttl,
+                    )
+            await self._increment_metric("get_many_by_ids", True)
+
+            return [
+                entities[entity_id] for entity_id in entity_ids if entity_id in entities
+            ]
+
+        except Exception:
+            await self._increment_metric("get_many_by_ids", False)
+            raise
+
     async def update(self, entity: EntityType) -> EntityType:
         """Update entity with cache handling."""
         try:
@@ -437,16 +561,13 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
         Returns:
             Number of entities successfully cached
         """
-        warmed = 0
-        for entity_id in entity_ids:
-            try:
-                entity = await self.get_by_id(entity_id)
-                if entity:
-                    warmed += 1
-            except Exception as e:
-                self.logger.debug(f"Failed to warm cache for entity {entity_id}: {e}")
-                continue
-        return warmed
+        try:
+            return len(await self.get_many_by_ids(entity_ids))
+        except Exception as e:
+            self.logger.debug(
+                f"Failed to warm cache for {len(entity_ids)} entities: {e}"
+            )
+            return 0
 
     async def invalidate_all(self) -> None:
         """Invalidate all cache entries for this repository."""
@@ -457,17 +578,14 @@ class CachedRepository(RepositoryBase[EntityType, IDType]):
         # Clear in-memory query cache
         self._query_cache.clear()
 
-        # Try to clear cache entries by pattern
         patterns = [
             f"{self.cache_settings.key_prefix}:entity:{self.entity_name.lower()}:*",
             f"{self.cache_settings.key_prefix}:query:{self.entity_name.lower()}:*",
             f"{self.cache_settings.key_prefix}:count:{self.entity_name.lower()}:*",
         ]
 
-        for _pattern in patterns:
-            # Note: Not all cache backends support pattern deletion
-            # This would need to be implemented per cache type
-            pass
+        for pattern in patterns:
+            await self._invalidate_cache_pattern(pattern)
 
     async def get_cache_metrics(self) -> dict[str, Any]:
         """Get cache performance metrics.
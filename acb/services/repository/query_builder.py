@@ -5,16 +5,29 @@ Provides fluent query building interface:
 - Dynamic query construction
 - SQL and NoSQL query generation
 - Performance optimization hints
+
+Repositories that implement ``execute_query(compiled)`` receive the whole query
+(filters, projection, grouping, aggregates, ordering and paging) compiled into
+one server-side statement. Other repositories fall back to ``list``/``count``.
 """
 
+import re
 from enum import Enum
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, TypeVar
 
 from ._base import PaginationInfo, RepositoryBase, SortCriteria, SortDirection
-from .specifications import ComparisonOperator, FieldSpecification, Specification
+from .specifications import (
+    AndSpecification,
+    ComparisonOperator,
+    FieldSpecification,
+    NotSpecification,
+    OrSpecification,
+    Specification,
+    SpecificationContext,
+)
 
 EntityType = TypeVar("EntityType")
 
@@ -66,7 +79,71 @@ class AggregateSpec:
     @property
     def name(self) -> str:
         """Get aggregate name."""
-        return self.alias or f"{self.function.value}_{self.field}"
+        field = "all" if self.field == "*" else self.field
+        return self.alias or f"{self.function.value}_{field}"
+
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*(\.[A-Za-z_][A-Za-z0-9_]*)?$")
+
+_UNBOUNDED_LIMIT = 2**63 - 1
+
+_SQL_AGGREGATES = {
+    AggregateFunction.SUM: "SUM({})",
+    AggregateFunction.AVG: "AVG({})",
+    AggregateFunction.MIN: "MIN({})",
+    AggregateFunction.MAX: "MAX({})",
+    AggregateFunction.COUNT: "COUNT({})",
+    AggregateFunction.COUNT_DISTINCT: "COUNT(DISTINCT {})",
+}
+
+_NOSQL_ACCUMULATORS = {
+    AggregateFunction.SUM: "$sum",
+    AggregateFunction.AVG: "$avg",
+    AggregateFunction.MIN: "$min",
+    AggregateFunction.MAX: "$max",
+}
+
+
+def _check_identifier(name: str) -> str:
+    if name != "*" and not _IDENTIFIER_PATTERN.match(name):
+        msg = f"Invalid field name in query: {name!r}"
+        raise ValueError(msg)
+    return name
+
+
+def _check_specification_fields(specification: Specification) -> None:
+    """Validate the field names of a specification tree before compiling it."""
+    if isinstance(specification, FieldSpecification):
+        _check_identifier(specification.field)
+    elif isinstance(specification, AndSpecification | OrSpecification):
+        for child in specification.specifications:
+            _check_specification_fields(child)
+    elif isinstance(specification, NotSpecification):
+        _check_specification_fields(specification.specification)
+
+
+@dataclass
+class CompiledQuery:
+    """A query compiled for server-side execution.
+
+    ``sql``/``params`` hold a complete parameterised SQL statement.
+    ``nosql`` holds the equivalent ``find`` arguments (``filter``,
+    ``projection``, ``sort``, ``skip``, ``limit``) or, for aggregates, an
+    aggregation ``pipeline``.
+
+    Executors return entities for SELECT (or dicts when ``fields`` is set), an
+    int for COUNT, a bool for EXISTS, and for AGGREGATE a dict of aggregate
+    values, or a list of such dicts when ``group_by`` is set.
+    """
+
+    query_type: QueryType
+    table: str
+    sql: str
+    params: dict[str, Any]
+    nosql: dict[str, Any]
+    fields: list[str] = field(default_factory=list)
+    group_by: list[str] = field(default_factory=list)
+    aggregates: list[AggregateSpec] = field(default_factory=list)
 
 
 class QueryBuilder:
@@ -497,6 +574,9 @@ class QueryBuilder:
         Returns:
             Total count of matching records
         """
+        executor = self._query_executor()
+        if executor is not None:
+            return int(await executor(self.compile(QueryType.COUNT)) or 0)
         # Convert specifications to filters for count
         filters = self._build_filters()
         return await self.repository.count(filters)
@@ -507,6 +587,9 @@ class QueryBuilder:
         Returns:
             True if any records match, False otherwise
         """
+        executor = self._query_executor()
+        if executor is not None:
+            return bool(await executor(self.compile(QueryType.EXISTS)))
         count = await self.count_only()
         return count > 0
 
@@ -521,8 +604,16 @@ class QueryBuilder:
             return result.data
         return [result.data] if result.data else []
 
+    def _query_executor(self) -> Any:
+        """Return the repository's compiled-query executor, if it has one."""
+        return getattr(self.repository, "execute_query", None)
+
     async def _execute_select(self) -> list[EntityType]:
         """Execute SELECT query."""
+        executor = self._query_executor()
+        if executor is not None:
+            return await executor(self.compile(QueryType.SELECT))
+
         filters = self._build_filters()
         sort_criteria = self._sort_criteria or None
         pagination = self._pagination
@@ -537,10 +628,13 @@ class QueryBuilder:
 
         return await self.repository.list(filters, sort_criteria, pagination)  # type: ignore[return-value]
 
-    async def _execute_aggregate(self) -> dict[str, Any]:
+    async def _execute_aggregate(self) -> dict[str, Any] | list[dict[str, Any]]:
         """Execute aggregate query."""
-        # For now, implement basic aggregates using repository methods
-        # In a full implementation, this would generate appropriate SQL/NoSQL queries
+        executor = self._query_executor()
+        if executor is not None:
+            return await executor(self.compile(QueryType.AGGREGATE))
+
+        # Without a compiling repository only COUNT can be answered
         filters = self._build_filters()
 
         results: dict[str, int | None] = {}
@@ -554,31 +648,226 @@ class QueryBuilder:
             for agg in count_aggregates:
                 results[agg.name] = total_count
 
-        # For other aggregates, we'd need to execute custom queries
-        # This is a simplified implementation
         for agg in self._aggregates:
             if agg.function != AggregateFunction.COUNT:
-                results[agg.name] = None  # Would implement actual aggregation
+                results[agg.name] = None
 
         return results
 
     def _build_filters(self) -> dict[str, Any] | None:
-        """Build filters dictionary from specifications."""
+        """Build filters dictionary from specifications.
+
+        Only equality filters can be expressed as a plain filter dictionary;
+        repositories implementing ``execute_query`` receive the full
+        specification tree instead.
+        """
         if not self._specifications:
             return None
 
-        # This is a simplified implementation
-        # In a full implementation, we'd convert specifications to filters
         filters = {}
 
         for spec in self._specifications:
             if isinstance(spec, FieldSpecification):
                 if spec.operator == ComparisonOperator.EQUALS:
                     filters[spec.field] = spec.value
-                # Add more operators as needed
 
         return filters or None
 
+    # Query compilation
+
+    def _table_name(self) -> str:
+        entity_type = self.repository.entity_type
+        table = getattr(entity_type, "__tablename__", None)
+        if not isinstance(table, str):
+            table = self.repository.entity_name.lower()
+        return _check_identifier(table)
+
+    def _combined_specification(
+        self,
+        specifications: list[Specification],
+    ) -> Specification | None:
+        if not specifications:
+            return None
+        if len(specifications) == 1:
+            return specifications[0]
+        return AndSpecification(specifications)
+
+    def _paging(self) -> tuple[int | None, int | None]:
+        """Return the effective (limit, offset) pair."""
+        if self._pagination is not None:
+            return self._pagination.page_size, self._pagination.offset or None
+        return self._limit, self._offset
+
+    def _sql_aggregate(self, agg: AggregateSpec) -> str:
+        return _SQL_AGGREGATES[agg.function].format(_check_identifier(agg.field))
+
+    def compile(self, query_type: QueryType | None = None) -> CompiledQuery:
+        """Compile the query for server-side execution.
+
+        Args:
+            query_type: Query type to compile; inferred when omitted
+
+        Returns:
+            Compiled SQL statement and NoSQL arguments
+        """
+        if query_type is None:
+            query_type = QueryType.AGGREGATE if self._aggregates else QueryType.SELECT
+        context = SpecificationContext(entity_type=self.repository.entity_type)
+        for specification in self._specifications + self._having_specs:
+            _check_specification_fields(specification)
+        where = self._combined_specification(self._specifications)
+        table = self._table_name()
+        sql, params = self._compile_sql(query_type, table, context, where)
+        return CompiledQuery(
+            query_type=query_type,
+            table=table,
+            sql=sql,
+            params=params,
+            nosql=self._compile_nosql(query_type, context, where),
+            fields=self._selected_fields.copy(),
+            group_by=self._group_by_fields.copy(),
+            aggregates=self._aggregates.copy(),
+        )
+
+    def _compile_sql(
+        self,
+        query_type: QueryType,
+        table: str,
+        context: SpecificationContext,
+        where: Specification | None,
+    ) -> tuple[str, dict[str, Any]]:
+        params: dict[str, Any] = {}
+        group_by = [_check_identifier(f) for f in self._group_by_fields]
+
+        if query_type == QueryType.COUNT:
+            columns = "COUNT(*)"
+        elif query_type == QueryType.EXISTS:
+            columns = "1"
+        elif query_type == QueryType.AGGREGATE:
+            columns = ", ".join(
+                group_by
+                + [
+                    f"{self._sql_aggregate(agg)} AS {_check_identifier(agg.name)}"
+                    for agg in self._aggregates
+                ],
+            )
+        else:
+            selected = [_check_identifier(f) for f in self._selected_fields]
+            columns = ", ".join(selected) if selected else "*"
+
+        distinct = (
+            "DISTINCT " if self._distinct and query_type == QueryType.SELECT else ""
+        )
+        parts = [f"SELECT {distinct}{columns} FROM {table}"]
+
+        if where is not None:
+            clause, where_params = where.to_sql_where(context)
+            parts.append(f"WHERE {clause}")
+            params.update(where_params)
+
+        if query_type in (QueryType.COUNT, QueryType.EXISTS):
+            if query_type == QueryType.EXISTS:
+                parts.append("LIMIT 1")
+            return " ".join(parts), params
+
+        if query_type == QueryType.AGGREGATE:
+            if group_by:
+                parts.append(f"GROUP BY {', '.join(group_by)}")
+            # Without GROUP BY, HAVING filters the single whole-table group
+            having = self._combined_specification(self._having_specs)
+            if having is not None:
+                # Aggregate aliases are not portable inside HAVING, so map
+                # them back to their expressions
+                having_context = SpecificationContext(
+                    entity_type=self.repository.entity_type,
+                    field_mappings={
+                        agg.name: self._sql_aggregate(agg) for agg in self._aggregates
+                    },
+                )
+                clause, having_params = having.to_sql_where(having_context)
+                parts.append(f"HAVING {clause}")
+                params.update(having_params)
+
+        if self._sort_criteria:
+            order = ", ".join(
+                f"{_check_identifier(c.field)} {c.direction.value.upper()}"
+                for c in self._sort_criteria
+            )
+            parts.append(f"ORDER BY {order}")
+
+        limit, offset = self._paging()
+        if limit is not None:
+            parts.append("LIMIT :_limit")
+            params["_limit"] = limit
+        if offset:
+            if limit is None:
+                # SQLite and MySQL only accept OFFSET after a LIMIT
+                parts.append(f"LIMIT {_UNBOUNDED_LIMIT}")
+            parts.append("OFFSET :_offset")
+            params["_offset"] = offset
+
+        return " ".join(parts), params
+
+    def _compile_nosql(
+        self,
+        query_type: QueryType,
+        context: SpecificationContext,
+        where: Specification | None,
+    ) -> dict[str, Any]:
+        match_filter = where.to_nosql_filter(context) if where is not None else {}
+        limit, offset = self._paging()
+
+        if query_type in (QueryType.COUNT, QueryType.EXISTS):
+            return {"filter": match_filter}
+
+        sort = [
+            (c.field, 1 if c.direction == SortDirection.ASC else -1)
+            for c in self._sort_criteria
+        ]
+
+        if query_type == QueryType.SELECT:
+            find: dict[str, Any] = {"filter": match_filter}
+            if self._selected_fields:
+                find["projection"] = dict.fromkeys(self._selected_fields, 1)
+            if sort:
+                find["sort"] = sort
+            if offset:
+                find["skip"] = offset
+            if limit is not None:
+                find["limit"] = limit
+            return find
+
+        pipeline: list[dict[str, Any]] = []
+        if match_filter:
+            pipeline.append({"$match": match_filter})
+        group: dict[str, Any] = {
+            "_id": {f: f"${f}" for f in self._group_by_fields} or None,
+        }
+        project: dict[str, Any] = {"_id": 0}
+        project.update({f: f"$_id.{f}" for f in self._group_by_fields})
+        for agg in self._aggregates:
+            if agg.function == AggregateFunction.COUNT:
+                group[agg.name] = {"$sum": 1}
+                project[agg.name] = 1
+            elif agg.function == AggregateFunction.COUNT_DISTINCT:
+                group[agg.name] = {"$addToSet": f"${agg.field}"}
+                project[agg.name] = {"$size": f"${agg.name}"}
+            else:
+                accumulator = _NOSQL_ACCUMULATORS[agg.function]
+                group[agg.name] = {accumulator: f"${agg.field}"}
+                project[agg.name] = 1
+        pipeline.extend(({"$group": group}, {"$project": project}))
+        having = self._combined_specification(self._having_specs)
+        if having is not None:
+            pipeline.append({"$match": having.to_nosql_filter(context)})
+        if sort:
+            pipeline.append({"$sort": dict(sort)})
+        if offset:
+            pipeline.append({"$skip": offset})
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        return {"pipeline": pipeline}
+
     def clone(self) -> "QueryBuilder":
         """Create a copy of this query builder.
 
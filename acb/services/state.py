@@ -12,12 +12,18 @@ Features:
 - Thread-safe state operations using asyncio locks
 """
 
-from collections import defaultdict
+import copy
+import hashlib
+import heapq
+import json
+import time
+from collections import OrderedDict, defaultdict
 from enum import Enum
 
 import asyncio
 import typing as t
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pydantic import BaseModel, Field
 
@@ -64,6 +70,7 @@ class StateEntry(BaseModel):
     updated_at: datetime
     expires_at: datetime | None = None
     version: int = 1
+    value_hash: str | None = None
     metadata: dict[str, t.Any] = Field(default_factory=dict)
 
     def is_expired(self) -> bool:
@@ -75,9 +82,25 @@ class StateEntry(BaseModel):
     def update_value(self, value: t.Any) -> None:
         """Update state value with version increment."""
         self.value = value
+        self.value_hash = None
         self.updated_at = datetime.now()
         self.version += 1
 
+    def content_hash(self) -> str:
+        """Hash of the value, cached in ``value_hash`` until the value changes."""
+        if self.value_hash is None:
+            self.value_hash = hash_state_value(self.value)
+        return self.value_hash
+
+
+def hash_state_value(value: t.Any) -> str:
+    """Stable content hash used to compare state values across storages."""
+    try:
+        data = json.dumps(value, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        data = repr(value)
+    return hashlib.sha256(data.encode()).hexdigest()
+
 
 class StateManagerSettings(ServiceSettings):
     """Settings for State Management Service."""
@@ -206,28 +229,107 @@ class StateManager:
         """Clear state entries, optionally by type."""
         raise NotImplementedError
 
+    async def get_multi(self, keys: list[str]) -> dict[str, t.Any]:
+        """Get values for the keys that exist."""
+        result = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                result[key] = value
+        return result
+
+    async def set_multi(
+        self,
+        items: dict[str, t.Any],
+        *,
+        state_type: StateType = StateType.TRANSIENT,
+        ttl_seconds: int | None = None,
+        metadata: dict[str, t.Any] | None = None,
+    ) -> None:
+        """Set multiple values with the same type, TTL and metadata."""
+        for key, value in items.items():
+            await self.set(
+                key,
+                value,
+                state_type=state_type,
+                ttl_seconds=ttl_seconds,
+                metadata=metadata,
+            )
+
+    async def delete_multi(self, keys: list[str]) -> list[str]:
+        """Delete multiple entries and return the keys that existed."""
+        return [key for key in keys if await self.delete(key)]
+
+    async def get_entries(self, keys: list[str]) -> dict[str, StateEntry]:
+        """Get unexpired entries, with metadata, for the keys that exist."""
+        raise NotImplementedError
+
+
+@dataclass(slots=True)
+class _MemoryEntry:
+    """Compact in-memory state entry; timestamps are epoch seconds."""
+
+    value: t.Any
+    state_type: StateType
+    created_at: float
+    updated_at: float
+    expires_at: float | None = None
+    version: int = 1
+    metadata: dict[str, t.Any] | None = None
+
+    def is_expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+    def to_state_entry(self, key: str) -> StateEntry:
+        return StateEntry(
+            key=key,
+            value=self.value,
+            state_type=self.state_type,
+            created_at=datetime.fromtimestamp(self.created_at),
+            updated_at=datetime.fromtimestamp(self.updated_at),
+            expires_at=(
+                datetime.fromtimestamp(self.expires_at)
+                if self.expires_at is not None
+                else None
+            ),
+            version=self.version,
+            metadata=dict(self.metadata) if self.metadata else {},
+        )
+
+    @classmethod
+    def from_state_entry(cls, entry: StateEntry) -> "_MemoryEntry":
+        return cls(
+            value=copy.deepcopy(entry.value),
+            state_type=entry.state_type,
+            created_at=entry.created_at.timestamp(),
+            updated_at=entry.updated_at.timestamp(),
+            expires_at=entry.expires_at.timestamp() if entry.expires_at else None,
+            version=entry.version,
+            metadata=copy.deepcopy(entry.metadata) or None,
+        )
+
 
 class InMemoryStateManager(StateManager):
-    """In-memory state manager with TTL support."""
+    """In-memory state manager with TTL support.
+
+    Entries are kept in least-recently-used order so eviction pops from the
+    front. Expiry times live in a min-heap; heap items left behind by
+    rewritten or removed keys are skipped when popped and compacted away
+    once they outnumber live entries.
+    """
 
     def __init__(self, settings: StateManagerSettings) -> None:
         self._settings = settings
-        self._state: dict[str, StateEntry] = {}
-        self._locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._state: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._expiry_heap: list[tuple[float, str]] = []
         self._global_lock = asyncio.Lock()
 
     async def get(self, key: str, default: t.Any = None) -> t.Any:
         """Get state value by key."""
-        async with self._locks[key]:
-            entry = self._state.get(key)
-            if entry is None:
-                return default
-
-            if entry.is_expired():
-                await self._remove_expired_entry(key)
-                return default
-
-            return entry.value
+        entry = self._live_entry(key, time.time())
+        if entry is None:
+            return default
+        return entry.value
 
     async def set(
         self,
@@ -239,59 +341,62 @@ class InMemoryStateManager(StateManager):
         metadata: dict[str, t.Any] | None = None,
     ) -> None:
         """Set state value with optional TTL and metadata."""
-        async with self._locks[key]:
-            now = datetime.now()
-            expires_at = None
-
-            if ttl_seconds is not None:
-                expires_at = now + timedelta(seconds=ttl_seconds)
-            elif state_type == StateType.TRANSIENT:
-                expires_at = now + timedelta(seconds=self._settings.default_ttl_seconds)
-
-            # Update existing entry or create new one
-            if key in self._state:
-                entry = self._state[key]
-                entry.update_value(value)
-                entry.expires_at = expires_at
-                entry.state_type = state_type
-                if metadata:
+        self._put(key, value, state_type, ttl_seconds, metadata, time.time())
+
+        # Check memory limits
+        self._enforce_memory_limits()
+
+    def _put(
+        self,
+        key: str,
+        value: t.Any,
+        state_type: StateType,
+        ttl_seconds: int | None,
+        metadata: dict[str, t.Any] | None,
+        now: float,
+    ) -> None:
+        """Create or update an entry without locking or limit enforcement."""
+        expires_at = None
+
+        if ttl_seconds is not None:
+            expires_at = now + ttl_seconds
+        elif state_type == StateType.TRANSIENT:
+            expires_at = now + self._settings.default_ttl_seconds
+
+        # Update existing entry or create new one
+        entry = self._state.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.updated_at = now
+            entry.version += 1
+            entry.expires_at = expires_at
+            entry.state_type = state_type
+            if metadata:
+                if entry.metadata is None:
+                    entry.metadata = dict(metadata)
+                else:
                     entry.metadata.update(metadata)
-            else:
-                entry = StateEntry(
-                    key=key,
-                    value=value,
-                    state_type=state_type,
-                    created_at=now,
-                    updated_at=now,
-                    expires_at=expires_at,
-                    metadata=metadata or {},
-                )
-                self._state[key] = entry
+            self._state.move_to_end(key)
+        else:
+            self._state[key] = _MemoryEntry(
+                value=value,
+                state_type=state_type,
+                created_at=now,
+                updated_at=now,
+                expires_at=expires_at,
+                metadata=dict(metadata) if metadata else None,
+            )
 
-            # Check memory limits
-            await self._enforce_memory_limits()
+        if expires_at is not None:
+            self._track_expiry(key, expires_at)
 
     async def delete(self, key: str) -> bool:
         """Delete state entry."""
-        async with self._locks[key]:
-            entry = self._state.pop(key, None)
-            if entry:
-                entry.status = StateStatus.DELETED
-                return True
-            return False
+        return self._state.pop(key, None) is not None
 
     async def exists(self, key: str) -> bool:
         """Check if state key exists."""
-        async with self._locks[key]:
-            entry = self._state.get(key)
-            if entry is None:
-                return False
-
-            if entry.is_expired():
-                await self._remove_expired_entry(key)
-                return False
-
-            return True
+        return self._live_entry(key, time.time()) is not None
 
     async def keys(self, pattern: str = "*") -> list[str]:
         """List state keys matching pattern."""
@@ -310,6 +415,7 @@ class InMemoryStateManager(StateManager):
             if state_type is None:
                 count = len(self._state)
                 self._state.clear()
+                self._expiry_heap.clear()
                 return count
 
             keys_to_remove = [
@@ -323,27 +429,109 @@ class InMemoryStateManager(StateManager):
 
             return len(keys_to_remove)
 
-    async def _remove_expired_entry(self, key: str) -> None:
-        """Remove expired entry from state."""
-        if key in self._state:
-            self._state[key].status = StateStatus.EXPIRED
-            del self._state[key]
+    async def get_multi(self, keys: list[str]) -> dict[str, t.Any]:
+        """Get values for the keys that exist under a single lock."""
+        async with self._global_lock:
+            now = time.time()
+            result = {}
+            for key in keys:
+                entry = self._live_entry(key, now)
+                if entry is not None:
+                    result[key] = entry.value
+            return result
+
+    async def get_entries(self, keys: list[str]) -> dict[str, StateEntry]:
+        """Get unexpired entries for the keys that exist under a single lock."""
+        async with self._global_lock:
+            now = time.time()
+            result = {}
+            for key in keys:
+                entry = self._live_entry(key, now)
+                if entry is not None:
+                    result[key] = entry.to_state_entry(key)
+            return result
 
-    async def _enforce_memory_limits(self) -> None:
-        """Enforce memory limits by removing oldest entries."""
-        if len(self._state) <= self._settings.max_memory_entries:
-            return
+    async def set_multi(
+        self,
+        items: dict[str, t.Any],
+        *,
+        state_type: StateType = StateType.TRANSIENT,
+        ttl_seconds: int | None = None,
+        metadata: dict[str, t.Any] | None = None,
+    ) -> None:
+        """Set multiple values under a single lock."""
+        async with self._global_lock:
+            now = time.time()
+            for key, value in items.items():
+                self._put(key, value, state_type, ttl_seconds, metadata, now)
+            self._enforce_memory_limits()
 
-        # Remove oldest entries until under limit
-        sorted_entries = sorted(
-            self._state.items(),
-            key=lambda x: x[1].updated_at,
-            reverse=False,
-        )
+    async def delete_multi(self, keys: list[str]) -> list[str]:
+        """Delete multiple entries under a single lock."""
+        async with self._global_lock:
+            return [key for key in keys if self._state.pop(key, None) is not None]
 
-        entries_to_remove = len(self._state) - self._settings.max_memory_entries
-        for key, _ in sorted_entries[:entries_to_remove]:
+    async def put_entries(self, entries: list[StateEntry]) -> None:
+        """Store copies of entries as-is, keeping their versions."""
+        async with self._global_lock:
+            for entry in entries:
+                memory_entry = _MemoryEntry.from_state_entry(entry)
+                self._state[entry.key] = memory_entry
+                self._state.move_to_end(entry.key)
+                if memory_entry.expires_at is not None:
+                    self._track_expiry(entry.key, memory_entry.expires_at)
+            self._enforce_memory_limits()
+
+    async def purge_expired(self) -> int:
+        """Remove expired entries and return how many were removed."""
+        async with self._global_lock:
+            return self._purge_expired(time.time())
+
+    def _live_entry(self, key: str, now: float) -> _MemoryEntry | None:
+        """Return an unexpired entry and mark it recently used."""
+        entry = self._state.get(key)
+        if entry is None:
+            return None
+
+        if entry.is_expired(now):
             del self._state[key]
+            return None
+
+        self._state.move_to_end(key)
+        return entry
+
+    def _track_expiry(self, key: str, expires_at: float) -> None:
+        """Schedule an expiry, rebuilding the heap when stale items pile up."""
+        heapq.heappush(self._expiry_heap, (expires_at, key))
+        if len(self._expiry_heap) > 2 * len(self._state) + 64:
+            self._expiry_heap = [
+                (entry.expires_at, key)
+                for key, entry in self._state.items()
+                if entry.expires_at is not None
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _purge_expired(self, now: float) -> int:
+        """Pop due heap items, removing entries whose expiry still matches."""
+        heap = self._expiry_heap
+        removed = 0
+        while heap and heap[0][0] <= now:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._state.get(key)
+            if entry is not None and entry.expires_at == expires_at:
+                del self._state[key]
+                removed += 1
+        return removed
+
+    def _enforce_memory_limits(self) -> None:
+        """Enforce memory limits by dropping expired, then least recent entries."""
+        limit = self._settings.max_memory_entries
+        if len(self._state) <= limit:
+            return
+
+        self._purge_expired(time.time())
+        while len(self._state) > limit:
+            self._state.popitem(last=False)
 
     def get_memory_stats(self) -> dict[str, t.Any]:
         """Get memory usage statistics."""
@@ -426,6 +614,7 @@ class PersistentStateManager(StateManager):
             created_at=now,
             updated_at=now,
             expires_at=expires_at,
+            value_hash=hash_state_value(value),
             metadata=metadata or {},
         )
 
@@ -434,6 +623,120 @@ class PersistentStateManager(StateManager):
             {"key": key, "data": entry.model_dump()},
         )
 
+    async def get_multi(self, keys: list[str]) -> dict[str, t.Any]:
+        """Get values for the keys that exist with one bulk read."""
+        entries = await self.get_entries(keys)
+        return {key: entry.value for key, entry in entries.items()}
+
+    async def get_entries(self, keys: list[str]) -> dict[str, StateEntry]:
+        """Get unexpired entries with one bulk read, dropping expired ones.
+
+        Repository errors propagate, so a failed read is never mistaken for
+        missing entries.
+        """
+        if not keys:
+            return {}
+        repository = await self._ensure_repository()
+        find_by_keys = getattr(repository, "find_by_keys", None)
+        if find_by_keys is not None:
+            results = await find_by_keys("state_entries", keys)
+        else:
+            found = await asyncio.gather(
+                *(repository.find_by_key("state_entries", key) for key in keys),
+            )
+            results = [result for result in found if result]
+
+        entries = {}
+        expired = []
+        for result in results:
+            entry = StateEntry(**result.get("data", {}))
+            if entry.is_expired():
+                expired.append(entry.key)
+            else:
+                entries[entry.key] = entry
+
+        if expired:
+            await self.delete_multi(expired)
+        return entries
+
+    async def set_multi(
+        self,
+        items: dict[str, t.Any],
+        *,
+        state_type: StateType = StateType.PERSISTENT,
+        ttl_seconds: int | None = None,
+        metadata: dict[str, t.Any] | None = None,
+    ) -> None:
+        """Set multiple values with one bulk upsert."""
+        if not items:
+            return
+        now = datetime.now()
+        expires_at = None
+
+        if ttl_seconds is not None:
+            expires_at = now + timedelta(seconds=ttl_seconds)
+
+        records = [
+            {
+                "key": key,
+                "data": StateEntry(
+                    key=key,
+                    value=value,
+                    state_type=state_type,
+                    created_at=now,
+                    updated_at=now,
+                    expires_at=expires_at,
+                    value_hash=hash_state_value(value),
+                    metadata=dict(metadata) if metadata else {},
+                ).model_dump(),
+            }
+            for key, value in items.items()
+        ]
+        await self._upsert_records(records)
+
+    async def put_entries(self, entries: list[StateEntry]) -> None:
+        """Write entries as-is, keeping their versions and hashes."""
+        if not entries:
+            return
+        await self._upsert_records(
+            [
+                {
+                    "key": entry.key,
+                    "data": entry.model_copy(
+                        update={"value_hash": hash_state_value(entry.value)},
+                    ).model_dump(),
+                }
+                for entry in entries
+            ],
+        )
+
+    async def _upsert_records(self, records: list[dict[str, t.Any]]) -> None:
+        """Upsert records in bulk, falling back to one call per record."""
+        repository = await self._ensure_repository()
+        upsert_many = getattr(repository, "upsert_many", None)
+        if upsert_many is not None:
+            await upsert_many("state_entries", records)
+            return
+        await asyncio.gather(
+            *(repository.upsert("state_entries", record) for record in records),
+        )
+
+    async def delete_multi(self, keys: list[str]) -> list[str]:
+        """Delete multiple entries with one bulk delete.
+
+        Repository errors propagate instead of reporting nothing deleted.
+        """
+        if not keys:
+            return []
+        repository = await self._ensure_repository()
+        delete_by_keys = getattr(repository, "delete_by_keys", None)
+        if delete_by_keys is not None:
+            return list(await delete_by_keys("state_entries", keys))
+        results = await asyncio.gather(
+            *(repository.delete_by_key("state_entries", key) for key in keys),
+        )
+        return [key for key, result in zip(keys, results, strict=True) if result]
+
     async def delete(self, key: str) -> bool:
         """Delete state entry from persistent storage."""
         repository = await self._ensure_repository()
@@ -526,6 +829,32 @@ class MockRepositoryService:
         """Delete entry by key."""
         return t.cast("dict[str, t.Any] | None", self._data[collection].pop(key, None))
 
+    async def find_by_keys(
+        self,
+        collection: str,
+        keys: list[str],
+    ) -> list[dict[str, t.Any]]:
+        """Find entries for the keys that exist."""
+        entries = self._data[collection]
+        return [entries[key] for key in keys if key in entries]
+
+    async def upsert_many(
+        self,
+        collection: str,
+        records: list[dict[str, t.Any]],
+    ) -> None:
+        """Insert or update multiple entries."""
+        entries = self._data[collection]
+        for data in records:
+            key = data.get("key")
+            if key:
+                entries[key] = data
+
+    async def delete_by_keys(self, collection: str, keys: list[str]) -> list[str]:
+        """Delete entries by key and return the keys that existed."""
+        entries = self._data[collection]
+        return [key for key in keys if entries.pop(key, None) is not None]
+
     async def find_all(self, collection: str) -> list[dict[str, t.Any]]:
         """Find all entries in collection."""
         return list(self._data[collection].values())
@@ -710,13 +1039,17 @@ class StateManagerService(ServiceBase):
 
     # Batch operations
     async def get_multi(self, keys: list[str]) -> dict[str, t.Any]:
-        """Get multiple state values."""
-        result = {}
-        for key in keys:
-            value = await self.get(key)
-            if value is not None:
-                result[key] = value
-        return result
+        """Get multiple state values, reading persistent storage for misses."""
+        self._metrics.gets_total += len(keys)
+
+        result = await self._memory_manager.get_multi(keys)
+        missing = [key for key in keys if result.get(key) is None]
+
+        if missing and self._persistent_manager:
+            self._metrics.persistent_reads_total += len(missing)
+            result.update(await self._persistent_manager.get_multi(missing))
+
+        return {key: value for key, value in result.items() if value is not None}
 
     async def set_multi(
         self,
@@ -724,23 +1057,50 @@ class StateManagerService(ServiceBase):
         *,
         state_type: StateType = StateType.TRANSIENT,
         ttl_seconds: int | None = None,
+        metadata: dict[str, t.Any] | None = None,
     ) -> None:
-        """Set multiple state values."""
-        tasks = [
-            self.set(key, value, state_type=state_type, ttl_seconds=ttl_seconds)
-            for key, value in items.items()
-        ]
-        await asyncio.gather(*tasks)
+        """Set multiple state values with one bulk write per storage."""
+        self._metrics.sets_total += len(items)
+
+        await self._memory_manager.set_multi(
+            items,
+            state_type=state_type,
+            ttl_seconds=ttl_seconds,
+            metadata=metadata,
+        )
+
+        if self._persistent_manager and state_type in {
+            StateType.PERSISTENT,
+            StateType.SHARED,
+        }:
+            self._metrics.persistent_writes_total += len(items)
+            await self._persistent_manager.set_multi(
+                items,
+                state_type=state_type,
+                ttl_seconds=ttl_seconds,
+                metadata=metadata,
+            )
 
     async def delete_multi(self, keys: list[str]) -> int:
-        """Delete multiple state entries."""
-        tasks = [self.delete(key) for key in keys]
-        results = await asyncio.gather(*tasks)
-        return sum(results)
+        """Delete multiple state entries with one bulk delete per storage."""
+        self._metrics.deletes_total += len(keys)
+
+        deleted = set(await self._memory_manager.delete_multi(keys))
+        if self._persistent_manager:
+            deleted.update(await self._persistent_manager.delete_multi(keys))
+
+        return len(deleted)
 
     # State synchronization
     async def sync_state(self, keys: list[str] | None = None) -> None:
-        """Synchronize state between memory and persistent storage."""
+        """Synchronize state between memory and persistent storage.
+
+        Keys are compared in chunks of ``batch_size``: each chunk is one bulk
+        read per storage, and values are compared by content hash against the
+        hash stored with the persistent entry. Memory takes precedence when
+        both sides hold an entry. A chunk whose read fails is skipped rather
+        than rewritten.
+        """
         if not self._persistent_manager:
             return
 
@@ -749,22 +1109,48 @@ class StateManagerService(ServiceBase):
         if keys is None:
             keys = await self._memory_manager.keys()
 
-        for key in keys:
+        batch_size = max(1, self._settings.batch_size)
+        for start in range(0, len(keys), batch_size):
+            chunk = keys[start : start + batch_size]
             try:
-                memory_value = await self._memory_manager.get(key)
-                persistent_value = await self._persistent_manager.get(key)
-
-                if memory_value != persistent_value:
-                    self._metrics.sync_conflicts_total += 1
-                    # Memory takes precedence for now
-                    if memory_value is not None:
-                        await self._persistent_manager.set(key, memory_value)
-                    elif persistent_value is not None:
-                        await self._memory_manager.set(key, persistent_value)
+                await self._sync_chunk(chunk)
             except Exception:
                 # Log sync errors but continue
                 continue
 
+    async def _sync_chunk(self, keys: list[str]) -> None:
+        """Reconcile one chunk of keys between memory and persistent storage."""
+        persistent_manager = t.cast("PersistentStateManager", self._persistent_manager)
+        memory_entries = await self._memory_manager.get_entries(keys)
+        persistent_entries = await persistent_manager.get_entries(keys)
+
+        to_persist = []
+        to_memory = []
+        for key in keys:
+            memory_entry = memory_entries.get(key)
+            persistent_entry = persistent_entries.get(key)
+            if memory_entry is None and persistent_entry is None:
+                continue
+            if (
+                memory_entry is not None
+                and persistent_entry is not None
+                and hash_state_value(memory_entry.value)
+                == persistent_entry.content_hash()
+            ):
+                continue
+
+            self._metrics.sync_conflicts_total += 1
+            if memory_entry is not None:
+                to_persist.append(memory_entry)
+            else:
+                to_memory.append(t.cast("StateEntry", persistent_entry))
+
+        if to_persist:
+            self._metrics.persistent_writes_total += len(to_persist)
+            await persistent_manager.put_entries(to_persist)
+        if to_memory:
+            await self._memory_manager.put_entries(to_memory)
+
     async def health_check(self) -> dict[str, t.Any]:
         """Health check for state management service."""
         base_health = await super().health_check()
@@ -816,19 +1202,7 @@ class StateManagerService(ServiceBase):
 
     async def _cleanup_expired_entries(self) -> None:
         """Clean up expired state entries."""
-        # Get all keys and check for expiration
-        all_keys = await self._memory_manager.keys()
-        expired_keys = []
-
-        for key in all_keys:
-            entry = self._memory_manager._state.get(key)
-            if entry and entry.is_expired():
-                expired_keys.append(key)
-
-        # Remove expired entries
-        for key in expired_keys:
-            await self._memory_manager.delete(key)
-            self._metrics.expires_total += 1
+        self._metrics.expires_total += await self._memory_manager.purge_expired()
 
 
 # Convenience functions for common state operations
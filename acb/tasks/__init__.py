@@ -73,7 +73,9 @@ from acb.services.discovery import ServiceStatus, enable_service, generate_servi
 
 # Core queue classes
 from ._base import (
+    ExecutorPoolMetrics,
     FunctionalTaskHandler,
+    HandlerExecutor,
     QueueBase,
     QueueCapability,
     QueueMetadata,
@@ -140,7 +142,9 @@ RABBITMQ_AVAILABLE = True  # Will be available via messaging adapters
 __all__ = [
     "RABBITMQ_AVAILABLE",
     "REDIS_AVAILABLE",
+    "ExecutorPoolMetrics",
     "FunctionalTaskHandler",
+    "HandlerExecutor",
     # Core queue classes
     "QueueBase",
     "QueueCapability",
@@ -363,12 +367,17 @@ class QueueService(ServiceBase):
             **kwargs,
         )
 
-    def register_handler(self, task_type: str, handler: TaskHandler) -> None:
+    def register_handler(
+        self,
+        task_type: str,
+        handler: TaskHandler,
+        executor: HandlerExecutor | str = HandlerExecutor.ASYNC,
+    ) -> None:
         """Register a task handler."""
         if not self._queue:
             msg = "Queue not available"
             raise RuntimeError(msg)
-        self._queue.register_handler(task_type, handler)
+        self._queue.register_handler(task_type, handler, executor)
 
     def schedule_cron(
         self,
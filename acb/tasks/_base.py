@@ -6,13 +6,18 @@ Designed to complement the Events System with reliable background processing.
 """
 
 import logging
+import multiprocessing
+import os
+import pickle  # nosec B403
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
 from enum import Enum
 from uuid import UUID, uuid4
 
 import asyncio
 import typing as t
+from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from pydantic import BaseModel, Field, field_validator
@@ -51,6 +56,14 @@ class TaskPriority(Enum):
     CRITICAL = 20
 
 
+class HandlerExecutor(Enum):
+    """Where a task handler runs."""
+
+    ASYNC = "async"  # On the worker's event loop
+    THREAD = "thread"  # In the queue's managed thread pool
+    PROCESS = "process"  # In the queue's managed process pool
+
+
 class QueueCapability(Enum):
     """Queue backend capabilities."""
 
@@ -173,6 +186,22 @@ class WorkerMetrics:
     uptime: float = 0.0  # seconds
 
 
+@dataclass
+class ExecutorPoolMetrics:
+    """Handler executor pool utilisation."""
+
+    max_workers: int = 0
+    active_tasks: int = 0
+    tasks_submitted: int = 0
+
+    @property
+    def utilization(self) -> float:
+        """Share of pool workers busy with a task."""
+        if not self.max_workers:
+            return 0.0
+        return min(self.active_tasks / self.max_workers, 1.0)
+
+
 @dataclass
 class QueueMetrics:
     """Queue performance metrics."""
@@ -191,6 +220,8 @@ class QueueMetrics:
 
     # Workers
     worker_metrics: WorkerMetrics = field(default_factory=WorkerMetrics)
+    thread_pool: ExecutorPoolMetrics = field(default_factory=ExecutorPoolMetrics)
+    process_pool: ExecutorPoolMetrics = field(default_factory=ExecutorPoolMetrics)
 
     # Health
     last_task_processed: datetime | None = None
@@ -318,6 +349,11 @@ def task_handler(
     return decorator
 
 
+def _handle_in_executor(handler: TaskHandler, task: TaskData) -> TaskResult:
+    """Run ``handler.handle`` on a private event loop in a pool worker."""
+    return asyncio.run(handler.handle(task))
+
+
 class QueueSettings(Settings):
     """Base settings for queue implementations."""
 
@@ -342,6 +378,15 @@ class QueueSettings(Settings):
     batch_size: int = 10
     prefetch_count: int = 20
 
+    # Idle workers
+    idle_poll_interval: float = 1.0  # Backends without a readiness signal
+    max_idle_wait: float = 30.0  # Upper bound on a blocking readiness wait
+
+    # Handler executors (None: sized from the CPU count)
+    thread_pool_workers: int | None = None
+    process_pool_workers: int | None = None
+    process_start_method: str | None = None  # fork, spawn or forkserver
+
     # Health monitoring
     health_check_enabled: bool = True
     health_check_interval: float = 60.0
@@ -397,6 +442,8 @@ class QueueBase(CleanupMixin):
 
         self._settings = settings or QueueSettings()
         self._handlers: dict[str, TaskHandler] = {}
+        self._handler_executors: dict[str, HandlerExecutor] = {}
+        self._handler_pools: dict[HandlerExecutor, Executor] = {}
         self._workers: dict[str, asyncio.Task[None]] = {}
         self._metrics = QueueMetrics()
         self._shutdown_event = asyncio.Event()
@@ -591,10 +638,36 @@ class QueueBase(CleanupMixin):
         if self._metrics.worker_metrics.idle_workers > 0:
             self._metrics.worker_metrics.idle_workers -= 1
 
-    @staticmethod
-    async def _handle_empty_queue() -> None:
-        """Handle empty queue by waiting before next dequeue."""
-        await asyncio.sleep(1.0)
+    async def next_task_delay(self) -> float | None:
+        """Get the seconds until the earliest scheduled task becomes ready.
+
+        Returns:
+            Delay in seconds, or None if unknown or nothing is scheduled
+        """
+        return None
+
+    async def wait_for_task(self, timeout: float) -> bool:
+        """Block until a task may be ready or the timeout expires.
+
+        Backends with a readiness signal override this; the default polls
+        every ``idle_poll_interval`` seconds.
+
+        Args:
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if woken by a readiness signal, False on timeout
+        """
+        await asyncio.sleep(min(timeout, self._settings.idle_poll_interval))
+        return False
+
+    async def _handle_empty_queue(self) -> None:
+        """Wait for a readiness signal, at most until the next task's ETA."""
+        timeout = self._settings.max_idle_wait
+        delay = await self.next_task_delay()
+        if delay is not None:
+            timeout = min(timeout, max(delay, 0.0))
+        await self.wait_for_task(timeout)
 
     async def _execute_worker_iteration(self, worker_id: str) -> bool:
         """Execute one worker loop iteration. Returns True if should continue."""
@@ -661,7 +734,7 @@ class QueueBase(CleanupMixin):
             # Execute task with timeout
             try:
                 result = await asyncio.wait_for(
-                    handler.handle(task),
+                    self._run_handler(handler, task),
                     timeout=task.timeout or self._settings.default_task_timeout,
                 )
                 result.worker_id = worker_id
@@ -781,15 +854,97 @@ class QueueBase(CleanupMixin):
         if total_tasks > 0:
             self._metrics.error_rate = self._metrics.failed_tasks / total_tasks
 
+    # Handler execution
+    def _pool_metrics(self, executor: HandlerExecutor) -> ExecutorPoolMetrics:
+        if executor is HandlerExecutor.PROCESS:
+            return self._metrics.process_pool
+        return self._metrics.thread_pool
+
+    def _get_handler_pool(self, kind: HandlerExecutor) -> Executor:
+        """Get or lazily create the managed pool for ``kind``."""
+        executor = self._handler_pools.get(kind)
+        if executor is not None:
+            return executor
+
+        cpu_count = os.process_cpu_count() or 1
+        if kind is HandlerExecutor.PROCESS:
+            max_workers = self._settings.process_pool_workers or cpu_count
+            mp_context = (
+                multiprocessing.get_context(self._settings.process_start_method)
+                if self._settings.process_start_method
+                else None
+            )
+            executor = ProcessPoolExecutor(max_workers, mp_context=mp_context)
+        else:
+            max_workers = self._settings.thread_pool_workers or min(32, cpu_count + 4)
+            executor = ThreadPoolExecutor(max_workers, thread_name_prefix="acb-task")
+
+        self._handler_pools[kind] = executor
+        self._pool_metrics(kind).max_workers = max_workers
+        return executor
+
+    async def _run_handler(self, handler: TaskHandler, task: TaskData) -> TaskResult:
+        """Run a handler on the event loop or in its registered pool.
+
+        A pool-run handler that times out keeps its pool worker until it
+        returns; only queued submissions are cancelled.
+        """
+        kind = self._handler_executors.get(task.task_type, HandlerExecutor.ASYNC)
+        if kind is HandlerExecutor.ASYNC:
+            return await handler.handle(task)
+
+        loop = asyncio.get_running_loop()
+        pool_metrics = self._pool_metrics(kind)
+        future = self._get_handler_pool(kind).submit(_handle_in_executor, handler, task)
+        pool_metrics.active_tasks += 1
+        pool_metrics.tasks_submitted += 1
+
+        def release(_: Future[TaskResult]) -> None:
+            # Completion is reported on a pool thread
+            with suppress(RuntimeError):  # Loop already closed
+                loop.call_soon_threadsafe(self._release_pool_slot, pool_metrics)
+
+        future.add_done_callback(release)
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def _release_pool_slot(pool_metrics: ExecutorPoolMetrics) -> None:
+        pool_metrics.active_tasks = max(0, pool_metrics.active_tasks - 1)
+
+    def _shutdown_handler_pools(self) -> None:
+        for kind, executor in self._handler_pools.items():
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._pool_metrics(kind).max_workers = 0
+        self._handler_pools.clear()
+
     # Handler registration
-    def register_handler(self, task_type: str, handler: TaskHandler) -> None:
+    def register_handler(
+        self,
+        task_type: str,
+        handler: TaskHandler,
+        executor: HandlerExecutor | str = HandlerExecutor.ASYNC,
+    ) -> None:
         """Register a task handler.
 
         Args:
             task_type: Task type identifier
             handler: Task handler instance
+            executor: Run the handler on the event loop ("async"), in a
+                managed thread pool ("thread") or process pool ("process")
+
+        Raises:
+            ValueError: If a process-pool handler cannot be pickled
         """
+        executor = HandlerExecutor(executor)
+        if executor is HandlerExecutor.PROCESS:
+            try:
+                pickle.dumps(handler)
+            except Exception as e:
+                msg = f"Handler for {task_type} must be picklable to run in a process pool: {e}"
+                raise ValueError(msg) from e
+
         self._handlers[task_type] = handler
+        self._handler_executors[task_type] = executor
         self.logger.info(f"Registered handler for task type: {task_type}")
 
     def unregister_handler(self, task_type: str) -> None:
@@ -800,6 +955,7 @@ class QueueBase(CleanupMixin):
         """
         if task_type in self._handlers:
             del self._handlers[task_type]
+            self._handler_executors.pop(task_type, None)
             self.logger.info(f"Unregistered handler for task type: {task_type}")
 
     def get_handler(self, task_type: str) -> TaskHandler | None:
@@ -852,6 +1008,7 @@ class QueueBase(CleanupMixin):
 
         # Stop workers
         await self.stop_workers()
+        self._shutdown_handler_pools()
 
         # Clean up resources
         await self.cleanup()
@@ -906,6 +1063,8 @@ class QueueBase(CleanupMixin):
                 "processing_tasks": self._metrics.processing_tasks,
                 "active_workers": self._metrics.worker_metrics.active_workers,
                 "total_workers": self._metrics.worker_metrics.total_workers,
+                "thread_pool_utilization": self._metrics.thread_pool.utilization,
+                "process_pool_utilization": self._metrics.process_pool.utilization,
                 "error_rate": self._metrics.error_rate,
             },
         }
@@ -9,6 +9,7 @@ from __future__ import annotations
 import heapq
 import time
 
+import asyncio
 import typing as t
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -82,12 +83,18 @@ class MemoryQueue(QueueBase):
     def __init__(self, settings: MemoryQueueSettings | None = None) -> None:
         super().__init__(settings or MemoryQueueSettings())
         self._queues: dict[str, list[PriorityTaskItem]] = {}
+        # Min-heap over every queue's head: (scheduled_time, priority, count,
+        # queue_name). An entry is stale once its item is no longer the head of
+        # that queue; stale entries are dropped lazily when they surface.
+        self._heads: list[tuple[float, int, int, str]] = []
         self._task_status: dict[UUID, TaskResult] = {}
         self._completed_tasks: dict[UUID, TaskResult] = {}
         self._dead_letter_tasks: dict[UUID, tuple[TaskData, TaskResult]] = {}
         self._enqueue_counter = 0
         self._rate_window: list[float] = []  # timestamps of recent enqueues
         self._memory_usage = 0
+        # Signalled on every enqueue so idle workers wake without polling
+        self._task_ready = asyncio.Condition()
 
     @property
     def _mem_limit(self) -> int:
@@ -130,6 +137,8 @@ class MemoryQueue(QueueBase):
         self._enqueue_counter += 1
         item = PriorityTaskItem.from_task(task, self._enqueue_counter)
         heapq.heappush(q, item)
+        if q[0] is item:
+            self._index_head(qname)
 
         self._memory_usage += size
         self._metrics.pending_tasks += 1
@@ -141,34 +150,81 @@ class MemoryQueue(QueueBase):
             queue_name=task.queue_name,
         )
 
+        async with self._task_ready:
+            self._task_ready.notify()
+
         return str(task.task_id)
 
-    async def dequeue(self, queue_name: str | None = None) -> TaskData | None:
-        now = time.time()
+    def _index_head(self, queue_name: str) -> None:
+        """Record the current head of ``queue_name`` in the global index."""
+        q = self._queues.get(queue_name)
+        if not q:
+            return
+        head = q[0]
+        heapq.heappush(
+            self._heads,
+            (head.scheduled_time, head.priority, head._count, queue_name),
+        )
+        if len(self._heads) > 2 * len(self._queues) + 64:
+            self._heads = [
+                entry for entry in self._heads if self._is_current_head(entry)
+            ]
+            heapq.heapify(self._heads)
+
+    def _is_current_head(self, entry: tuple[float, int, int, str]) -> bool:
+        q = self._queues.get(entry[3])
+        return bool(q) and q[0]._count == entry[2]  # type: ignore[index]
+
+    def _peek_head(self) -> tuple[float, int, int, str] | None:
+        """Return the earliest head across all queues, dropping stale entries."""
+        heads = self._heads
+        while heads and not self._is_current_head(heads[0]):
+            heapq.heappop(heads)
+        return heads[0] if heads else None
+
+    async def next_task_delay(self) -> float | None:
+        head = self._peek_head()
+        if head is None:
+            return None
+        return head[0] - time.time()
 
-        if queue_name is not None:
-            return self._pop_ready_from_queue(
-                self._queues.setdefault(queue_name, []),
-                now,
-            )
+    async def wait_for_task(self, timeout: float) -> bool:
+        seen = self._enqueue_counter
 
-        # No specific queue: consider heads of all queues
-        best_queue, _best_item = self._find_best_queue_item(now)
-        if best_queue is not None:
-            return self._pop_ready_from_queue(best_queue, now)
-        return None
+        def woken() -> bool:
+            # A new enqueue may also move the next ETA earlier
+            return self._enqueue_counter != seen or self._has_ready_task()
 
-    def _pop_ready_from_queue(
-        self,
-        q: list[PriorityTaskItem],
-        now: float,
-    ) -> TaskData | None:
+        async with self._task_ready:
+            try:
+                await asyncio.wait_for(self._task_ready.wait_for(woken), timeout)
+            except TimeoutError:
+                return False
+        return True
+
+    def _has_ready_task(self) -> bool:
+        head = self._peek_head()
+        return head is not None and head[0] <= time.time()
+
+    async def dequeue(self, queue_name: str | None = None) -> TaskData | None:
+        if queue_name is None:
+            # No specific queue: take the best head across all queues
+            head = self._peek_head()
+            if head is None:
+                return None
+            queue_name = head[3]
+
+        return self._pop_ready_from_queue(queue_name, time.time())
+
+    def _pop_ready_from_queue(self, queue_name: str, now: float) -> TaskData | None:
+        q = self._queues.get(queue_name)
         if not q:
             return None
         item = q[0]
         if item.scheduled_time > now:
             return None
         heapq.heappop(q)
+        self._index_head(queue_name)
         # Update counters
         self._metrics.pending_tasks = max(0, self._metrics.pending_tasks - 1)
         self._metrics.processing_tasks += 1
@@ -180,44 +236,12 @@ class MemoryQueue(QueueBase):
         )
         return item.task
 
-    def _find_best_queue_item(
-        self,
-        now: float,
-    ) -> tuple[list[PriorityTaskItem] | None, PriorityTaskItem | None]:
-        best_q: list[PriorityTaskItem] | None = None
-        best_item: PriorityTaskItem | None = None
-        for q in self._queues.values():
-            if not q:
-                continue
-            head = q[0]
-            if head.scheduled_time > now:
-                continue
-            if best_item is None or self._is_better_item(head, best_item):
-                best_item = head
-                best_q = q
-        return best_q, best_item
-
-    def _is_better_item(
-        self,
-        head: PriorityTaskItem,
-        best_item: PriorityTaskItem,
-    ) -> bool:
-        return (
-            head.scheduled_time,
-            head.priority,
-            head._count,
-        ) < (
-            best_item.scheduled_time,
-            best_item.priority,
-            best_item._count,
-        )
-
     async def get_task_status(self, task_id: UUID) -> TaskResult | None:
         return self._task_status.get(task_id)
 
     async def cancel_task(self, task_id: UUID) -> bool:
         # Remove from any queue where present
-        for q in self._queues.values():
+        for queue_name, q in self._queues.items():
             for i, item in enumerate(q):
                 if item.task.task_id == task_id:
                     self._memory_usage = max(
@@ -226,6 +250,8 @@ class MemoryQueue(QueueBase):
                     )
                     del q[i]
                     heapq.heapify(q)
+                    if i == 0:
+                        self._index_head(queue_name)
                     self._metrics.pending_tasks = max(
                         0,
                         self._metrics.pending_tasks - 1,
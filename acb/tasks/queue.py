@@ -402,7 +402,7 @@ class Queue(QueueBase):
             Task result
         """
         try:
-            result = await handler.handle(task)
+            result = await self._run_handler(handler, task)
             return result.result if hasattr(result, "result") else result
         except Exception as e:
             self.logger.exception(f"Handler execution failed for {task.task_id}: {e}")
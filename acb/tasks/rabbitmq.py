@@ -47,11 +47,13 @@ except ImportError:
 import contextlib
 
 from ._base import (
+    HandlerExecutor,
     QueueBase,
     QueueCapability,
     QueueMetadata,
     QueueSettings,
     TaskData,
+    TaskHandler,
     TaskResult,
     TaskStatus,
     generate_queue_id,
@@ -189,6 +191,7 @@ class RabbitMQQueue(QueueBase):
         # Background tasks
         self._consumer_task: asyncio.Task[None] | None = None
         self._health_monitor: asyncio.Task[None] | None = None
+        self._consumers_changed = asyncio.Event()
 
     async def start(self) -> None:
         """Start the RabbitMQ queue."""
@@ -441,6 +444,22 @@ class RabbitMQQueue(QueueBase):
         # Instead, tasks are consumed via the consumer loop
         return None
 
+    async def wait_for_task(self, timeout: float) -> bool:
+        """Idle until shutdown; messages are pushed to the queue consumers."""
+        with suppress(TimeoutError):
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout)
+        return False
+
+    def register_handler(
+        self,
+        task_type: str,
+        handler: TaskHandler,
+        executor: HandlerExecutor | str = HandlerExecutor.ASYNC,
+    ) -> None:
+        super().register_handler(task_type, handler, executor)
+        # Start consuming the new queue without waiting for a poll
+        self._consumers_changed.set()
+
     async def _consumer_loop(self) -> None:
         """Main consumer loop."""
         while self._running and not self._shutdown_event.is_set():
@@ -450,11 +469,17 @@ class RabbitMQQueue(QueueBase):
                     list(self._handlers.keys()) if self._handlers else ["default"]
                 )
 
+                self._consumers_changed.clear()
                 for queue_name in queue_names:
                     if queue_name not in self._consumers:
                         await self._start_queue_consumer(queue_name)
 
-                await asyncio.sleep(1.0)
+                # Failed consumers are retried after max_idle_wait
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._consumers_changed.wait(),
+                        self._settings.max_idle_wait,
+                    )
 
             except asyncio.CancelledError:
                 break
@@ -537,7 +562,7 @@ class RabbitMQQueue(QueueBase):
 
             # Execute task
             result = await asyncio.wait_for(
-                handler.handle(task),
+                self._run_handler(handler, task),
                 timeout=task.timeout or self._settings.default_task_timeout,
             )
             result.worker_id = worker_id
@@ -7,6 +7,7 @@ production deployments with persistence, clustering, and high availability.
 import json
 import logging
 import time
+from collections import deque
 from uuid import UUID
 
 import asyncio
@@ -111,11 +112,15 @@ class RedisQueueSettings(QueueSettings):
     # Performance
     pipeline_size: int = 100
     use_lua_scripts: bool = True
+    ack_batch_size: int = 100  # Task results written per acknowledgement pipeline
+    ack_flush_interval: float = 0.05  # Max seconds a result waits to be written
 
 
 class RedisQueue(QueueBase):
     """Redis-backed task queue implementation."""
 
+    _settings: RedisQueueSettings  # Type hint for proper attribute checking
+
     def __init__(self, settings: RedisQueueSettings | None = None) -> None:
         if not REDIS_AVAILABLE:
             msg = "Redis is required for RedisQueue. Install with: pip install redis>=5.0.0"
@@ -141,6 +146,7 @@ class RedisQueue(QueueBase):
         self._task_data_key = f"{self._key_prefix}:tasks:{{task_id}}"
         self._task_result_key = f"{self._key_prefix}:results:{{task_id}}"
         self._metrics_key = f"{self._key_prefix}:metrics"
+        self._notify_key = f"{self._key_prefix}:notify"
 
         # Lua scripts for atomic operations
         self._lua_scripts: dict[str, Any] = {}
@@ -149,6 +155,11 @@ class RedisQueue(QueueBase):
         self._delayed_task_processor: asyncio.Task[None] | None = None
         self._health_monitor: asyncio.Task[None] | None = None
 
+        # Claimed but unstarted tasks, and results waiting to be written
+        self._prefetched: deque[TaskData] = deque()
+        self._pending_acks: list[tuple[TaskData, TaskResult, bool]] = []
+        self._ack_flush_task: asyncio.Task[None] | None = None
+
     async def start(self) -> None:
         """Start the Redis queue."""
         await self._ensure_redis()
@@ -180,6 +191,13 @@ class RedisQueue(QueueBase):
 
         await super().stop()
 
+        if self._ack_flush_task:
+            self._ack_flush_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._ack_flush_task
+        await self._flush_acks()
+        await self._release_prefetched()
+
         # Close Redis connection
         if self._redis:
             await self._redis.aclose()
@@ -231,9 +249,12 @@ class RedisQueue(QueueBase):
         local queue_key = KEYS[1]
         local task_data_key = KEYS[2]
         local metrics_key = KEYS[3]
+        local notify_key = KEYS[4]
         local task_data = ARGV[1]
         local priority = tonumber(ARGV[2])
         local scheduled_time = tonumber(ARGV[3])
+        local notify = tonumber(ARGV[4])
+        local notify_backlog = tonumber(ARGV[5])
 
         -- Store task data
         redis.call('SET', task_data_key, task_data)
@@ -246,70 +267,61 @@ class RedisQueue(QueueBase):
         redis.call('HINCRBY', metrics_key, 'pending_tasks', 1)
         redis.call('HINCRBY', metrics_key, 'total_enqueued', 1)
 
-        return 1
-        """
-
-        # Script for atomic dequeue
-        dequeue_script = """
-        local queue_key = KEYS[1]
-        local processing_key = KEYS[2]
-        local metrics_key = KEYS[3]
-        local current_time = tonumber(ARGV[1])
-
-        -- Get tasks ready for processing
-        local tasks = redis.call('ZRANGEBYSCORE', queue_key, '-inf', current_time, 'LIMIT', 0, 1)
-
-        if #tasks == 0 then
-            return nil
+        -- Wake one idle worker
+        if notify == 1 then
+            redis.call('LPUSH', notify_key, 1)
+            redis.call('LTRIM', notify_key, 0, notify_backlog - 1)
         end
 
-        local task_key = tasks[1]
-
-        -- Move from queue to processing
-        redis.call('ZREM', queue_key, task_key)
-        redis.call('ZADD', processing_key, current_time, task_key)
-
-        -- Update metrics
-        redis.call('HINCRBY', metrics_key, 'pending_tasks', -1)
-        redis.call('HINCRBY', metrics_key, 'processing_tasks', 1)
-
-        -- Get task data
-        local task_data = redis.call('GET', task_key)
-        return {task_key, task_data}
+        return 1
         """
 
-        # Script for task completion
-        complete_script = """
+        # Script for claiming up to N ready tasks across queues
+        dequeue_batch_script = """
         local processing_key = KEYS[1]
-        local result_key = KEYS[2]
-        local metrics_key = KEYS[3]
-        local task_key = ARGV[1]
-        local result_data = ARGV[2]
-        local success = tonumber(ARGV[3])
-
-        -- Remove from processing
-        redis.call('ZREM', processing_key, task_key)
-
-        -- Store result
-        redis.call('SET', result_key, result_data)
-        redis.call('EXPIRE', result_key, 86400)  -- 24 hours
+        local metrics_key = KEYS[2]
+        local max_score = tonumber(ARGV[1])
+        local limit = tonumber(ARGV[2])
+        local current_time = tonumber(ARGV[3])
+
+        -- Collect ready candidates from every queue, best score first
+        local candidates = {}
+        for i = 3, #KEYS do
+            local entries = redis.call(
+                'ZRANGEBYSCORE', KEYS[i], '-inf', max_score,
+                'WITHSCORES', 'LIMIT', 0, limit
+            )
+            for j = 1, #entries, 2 do
+                table.insert(candidates, {KEYS[i], entries[j], tonumber(entries[j + 1])})
+            end
+        end
+        table.sort(candidates, function(a, b) return a[3] < b[3] end)
+
+        -- Move the best N from their queues to processing
+        local claimed = {}
+        local count = math.min(limit, #candidates)
+        for i = 1, count do
+            local queue_key, task_key = candidates[i][1], candidates[i][2]
+            redis.call('ZREM', queue_key, task_key)
+            redis.call('ZADD', processing_key, current_time, task_key)
+            local task_data = redis.call('GET', task_key)
+            if task_data then
+                table.insert(claimed, task_data)
+            end
+        end
 
-        -- Update metrics
-        redis.call('HINCRBY', metrics_key, 'processing_tasks', -1)
-        if success == 1 then
-            redis.call('HINCRBY', metrics_key, 'completed_tasks', 1)
-        else
-            redis.call('HINCRBY', metrics_key, 'failed_tasks', 1)
+        if count > 0 then
+            redis.call('HINCRBY', metrics_key, 'pending_tasks', -count)
+            redis.call('HINCRBY', metrics_key, 'processing_tasks', count)
         end
 
-        return 1
+        return claimed
         """
 
         try:
             self._lua_scripts = {
                 "enqueue": redis_client.register_script(enqueue_script),
-                "dequeue": redis_client.register_script(dequeue_script),
-                "complete": redis_client.register_script(complete_script),
+                "dequeue_batch": redis_client.register_script(dequeue_batch_script),
             }
             self.logger.debug("Lua scripts loaded")
         except Exception as e:
@@ -336,14 +348,21 @@ class RedisQueue(QueueBase):
 
         # Generate keys
         task_key = self._task_data_key.format(task_id=task.task_id)
+        ready = scheduled_time <= time.time()
 
         try:
             if self._settings.use_lua_scripts and "enqueue" in self._lua_scripts:
                 # Use atomic Lua script
                 queue_key = self._queue_key.format(queue_name=task.queue_name)
                 await self._lua_scripts["enqueue"](
-                    keys=[queue_key, task_key, self._metrics_key],
-                    args=[task_json, task.priority.value, scheduled_time],
+                    keys=[queue_key, task_key, self._metrics_key, self._notify_key],
+                    args=[
+                        task_json,
+                        task.priority.value,
+                        scheduled_time,
+                        int(ready),
+                        self._settings.max_workers,
+                    ],
                 )
             else:
                 # Use pipeline for atomic operation
@@ -353,7 +372,7 @@ class RedisQueue(QueueBase):
                 pipe.set(task_key, task_json)
 
                 # Add to appropriate queue
-                if scheduled_time > time.time():
+                if not ready:
                     # Delayed task
                     pipe.zadd(self._delayed_key, {task_key: scheduled_time})
                 else:
@@ -361,6 +380,7 @@ class RedisQueue(QueueBase):
                     queue_key = self._queue_key.format(queue_name=task.queue_name)
                     score = scheduled_time * 1_000_000 - task.priority.value
                     pipe.zadd(queue_key, {task_key: score})
+                    self._signal_ready(pipe, 1)
 
                 # Update metrics
                 pipe.hincrby(self._metrics_key, "pending_tasks", 1)
@@ -377,6 +397,45 @@ class RedisQueue(QueueBase):
             self.logger.exception(f"Failed to enqueue task {task.task_id}: {e}")
             raise
 
+    def _signal_ready(self, pipe: t.Any, count: int) -> None:
+        """Queue ``count`` wakeup tokens for idle workers on a pipeline."""
+        pipe.lpush(self._notify_key, *([1] * count))
+        # Tokens are only hints; keep at most one per worker
+        pipe.ltrim(self._notify_key, 0, self._settings.max_workers - 1)
+
+    async def next_task_delay(self) -> float | None:
+        """Seconds until the earliest queued or delayed task is due.
+
+        Enqueues only signal tasks that are ready, so idle workers use this
+        to cut their BLPOP short when a delayed or retried task comes due.
+        """
+        redis_client = await self._ensure_redis()
+        queue_keys = await self._resolve_queue_keys(redis_client, None)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zrange(self._delayed_key, 0, 0, withscores=True)
+        for queue_key in queue_keys:
+            pipe.zrange(queue_key, 0, 0, withscores=True)
+        delayed, *queued = await pipe.execute()
+
+        current_time = time.time()
+        if delayed and delayed[0][1] <= current_time:
+            # Due now; promote instead of waiting for the next promoter pass
+            await self._promote_due_delayed_tasks(redis_client, current_time)
+            return 0.0
+        # Delayed scores are epoch seconds, queue scores epoch microseconds
+        etas = [score for _, score in delayed]
+        etas.extend(score / 1_000_000 for entries in queued for _, score in entries)
+        return min(etas) - current_time if etas else None
+
+    async def wait_for_task(self, timeout: float) -> bool:
+        """Block on the wakeup list with BLPOP instead of polling."""
+        if timeout <= 0:
+            return False
+        redis_client = await self._ensure_redis()
+        # BLPOP holds a pooled connection; stay below the socket read timeout
+        timeout = min(timeout, self._settings.socket_timeout * 0.9)
+        return await redis_client.blpop([self._notify_key], timeout=timeout) is not None
+
     async def _resolve_queue_keys(
         self,
         redis_client: t.Any,
@@ -389,100 +448,137 @@ class RedisQueue(QueueBase):
         pattern = self._queue_key.format(queue_name="*")
         return await redis_client.keys(pattern)
 
-    async def _dequeue_with_lua(
-        self,
-        queue_key: str,
-        current_time: float,
-    ) -> TaskData | None:
-        """Dequeue using Lua script for atomic operation."""
-        result = await self._lua_scripts["dequeue"](
-            keys=[queue_key, self._processing_key, self._metrics_key],
-            args=[current_time],
-        )
-
-        if not result:
-            return None
-
-        _task_key, task_data = result
-        return TaskData.model_validate_json(task_data)
+    @staticmethod
+    def _ready_score(current_time: float) -> float:
+        """Highest queue score that is due at ``current_time``."""
+        return current_time * 1_000_000
 
-    async def _dequeue_manual(
+    async def _dequeue_batch_manual(
         self,
         redis_client: t.Any,
-        queue_key: str,
+        queue_keys: list[str],
+        n: int,
         current_time: float,
-    ) -> TaskData | None:
-        """Dequeue using manual pipeline operations."""
-        # Get task ready for processing
-        tasks = await redis_client.zrangebyscore(
-            queue_key,
-            "-inf",
-            current_time,
-            start=0,
-            num=1,
-        )
-
-        if not tasks:
-            return None
-
-        task_key = tasks[0]
+    ) -> list[str]:
+        """Claim up to ``n`` tasks with pipelines when Lua is unavailable."""
+        pipe = redis_client.pipeline(transaction=False)
+        for queue_key in queue_keys:
+            pipe.zrangebyscore(
+                queue_key,
+                "-inf",
+                self._ready_score(current_time),
+                start=0,
+                num=n,
+                withscores=True,
+            )
+        candidates = sorted(
+            (score, queue_key, task_key)
+            for queue_key, entries in zip(queue_keys, await pipe.execute(), strict=True)
+            for task_key, score in entries
+        )[:n]
+        if not candidates:
+            return []
 
-        # Move to processing atomically
-        pipe = redis_client.pipeline()
-        pipe.zrem(queue_key, task_key)
-        pipe.zadd(self._processing_key, {task_key: current_time})
-        pipe.hincrby(self._metrics_key, "pending_tasks", -1)
-        pipe.hincrby(self._metrics_key, "processing_tasks", 1)
-        pipe.get(task_key)
+        pipe = redis_client.pipeline(transaction=False)
+        for _, queue_key, task_key in candidates:
+            pipe.zrem(queue_key, task_key)
+        removed = await pipe.execute()
+        # Another worker may have claimed some candidates first
+        claimed = [
+            task_key
+            for (_, _, task_key), was_removed in zip(candidates, removed, strict=True)
+            if was_removed
+        ]
+        if not claimed:
+            return []
 
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.zadd(self._processing_key, dict.fromkeys(claimed, current_time))
+        pipe.hincrby(self._metrics_key, "pending_tasks", -len(claimed))
+        pipe.hincrby(self._metrics_key, "processing_tasks", len(claimed))
+        pipe.mget(claimed)
         results = await pipe.execute()
-        task_data = results[-1]
-
-        if not task_data:
-            return None
+        return [task_data for task_data in results[-1] if task_data]
 
-        task = TaskData.model_validate_json(task_data)
-        self.logger.debug(f"Dequeued task {task.task_id}")
-        return task
-
-    async def _try_dequeue_from_queues(
+    async def dequeue_batch(
         self,
-        queue_keys: list[str],
-        current_time: float,
-        redis_client: t.Any,
-    ) -> TaskData | None:
-        """Try to dequeue from multiple queue keys."""
-        use_lua = self._settings.use_lua_scripts and "dequeue" in self._lua_scripts
-
-        for queue_key in queue_keys:
-            if use_lua:
-                task = await self._dequeue_with_lua(queue_key, current_time)
-            else:
-                task = await self._dequeue_manual(redis_client, queue_key, current_time)
+        n: int,
+        queue_name: str | None = None,
+    ) -> list[TaskData]:
+        """Atomically claim up to ``n`` ready tasks across queues.
 
-            if task:
-                return task
+        Tasks are taken in schedule-then-priority order over all matching
+        queue keys, in a single script call when Lua scripts are enabled.
 
-        return None
+        Args:
+            n: Maximum number of tasks to claim
+            queue_name: Restrict to one queue (default: all queues)
 
-    async def dequeue(self, queue_name: str | None = None) -> TaskData | None:
-        """Dequeue a task for processing."""
-        if not self._running:
-            return None
+        Returns:
+            Claimed tasks, best first
+        """
+        if not self._running or n <= 0:
+            return []
 
         redis_client = await self._ensure_redis()
         current_time = time.time()
 
         try:
             queue_keys = await self._resolve_queue_keys(redis_client, queue_name)
-            return await self._try_dequeue_from_queues(
-                queue_keys,
-                current_time,
-                redis_client,
+            if not queue_keys:
+                return []
+            if self._settings.use_lua_scripts and "dequeue_batch" in self._lua_scripts:
+                payloads = await self._lua_scripts["dequeue_batch"](
+                    keys=[self._processing_key, self._metrics_key, *queue_keys],
+                    args=[self._ready_score(current_time), n, current_time],
+                )
+            else:
+                payloads = await self._dequeue_batch_manual(
+                    redis_client,
+                    queue_keys,
+                    n,
+                    current_time,
+                )
+        except Exception as e:
+            self.logger.exception(f"Failed to dequeue task batch: {e}")
+            return []
+
+        return [TaskData.model_validate_json(payload) for payload in payloads]
+
+    async def dequeue(self, queue_name: str | None = None) -> TaskData | None:
+        """Dequeue a task, refilling the local prefetch buffer as needed."""
+        if queue_name is not None:
+            tasks = await self.dequeue_batch(1, queue_name)
+            return tasks[0] if tasks else None
+
+        if not self._prefetched:
+            self._prefetched.extend(
+                await self.dequeue_batch(max(1, self._settings.prefetch_count)),
             )
+        return self._prefetched.popleft() if self._prefetched else None
+
+    async def _release_prefetched(self) -> None:
+        """Return claimed but unstarted tasks to their queues."""
+        if not self._prefetched or self._redis is None:
+            return
+
+        tasks = list(self._prefetched)
+        self._prefetched.clear()
+        score = self._ready_score(time.time())
+        pipe = self._redis.pipeline(transaction=False)
+        for task in tasks:
+            task_key = self._task_data_key.format(task_id=task.task_id)
+            queue_key = self._queue_key.format(queue_name=task.queue_name)
+            pipe.zrem(self._processing_key, task_key)
+            pipe.zadd(queue_key, {task_key: score - task.priority.value})
+        pipe.hincrby(self._metrics_key, "pending_tasks", len(tasks))
+        pipe.hincrby(self._metrics_key, "processing_tasks", -len(tasks))
+        try:
+            await pipe.execute()
         except Exception as e:
-            self.logger.exception(f"Failed to dequeue task: {e}")
-            return None
+            self.logger.exception(
+                f"Failed to release {len(tasks)} prefetched tasks: {e}"
+            )
 
     async def _check_result_storage(
         self,
@@ -708,8 +804,8 @@ class RedisQueue(QueueBase):
     ) -> dict[str, t.Any]:
         """Build dead letter data structure."""
         return {
-            "task": task.model_dump(),
-            "result": result.model_dump(),
+            "task": task.model_dump(mode="json"),
+            "result": result.model_dump(mode="json"),
             "timestamp": time.time(),
         }
 
@@ -789,33 +885,37 @@ class RedisQueue(QueueBase):
                 pipe.zadd(queue_key, {task_key: score})
                 pipe.zrem(self._delayed_key, task_key)
 
+        self._signal_ready(pipe, len(ready_tasks))
         await pipe.execute()
         self.logger.debug(f"Moved {len(ready_tasks)} delayed tasks to queues")
 
+    async def _promote_due_delayed_tasks(
+        self,
+        redis_client: t.Any,
+        current_time: float,
+    ) -> None:
+        """Move up to 100 due delayed tasks to their queues."""
+        ready_tasks = await redis_client.zrangebyscore(
+            self._delayed_key,
+            "-inf",
+            current_time,
+            start=0,
+            num=100,
+        )
+        if ready_tasks:
+            await self._process_ready_delayed_tasks(
+                redis_client,
+                ready_tasks,
+                current_time,
+            )
+
     async def _process_delayed_tasks(self) -> None:
         """Process delayed tasks in background."""
         redis_client = await self._ensure_redis()
 
         while self._running and not self._shutdown_event.is_set():
             try:
-                current_time = time.time()
-
-                # Get ready delayed tasks
-                ready_tasks = await redis_client.zrangebyscore(
-                    self._delayed_key,
-                    "-inf",
-                    current_time,
-                    start=0,
-                    num=100,
-                )
-
-                if ready_tasks:
-                    await self._process_ready_delayed_tasks(
-                        redis_client,
-                        ready_tasks,
-                        current_time,
-                    )
-
+                await self._promote_due_delayed_tasks(redis_client, time.time())
                 await asyncio.sleep(1.0)
 
             except asyncio.CancelledError:
@@ -877,83 +977,71 @@ class RedisQueue(QueueBase):
         except Exception as e:
             self.logger.exception(f"Failed to update Redis metrics: {e}")
 
-    async def _on_task_completed(self, task: TaskData, result: TaskResult) -> None:
-        """Handle task completion."""
-        await super()._on_task_completed(task, result)
+    async def _acknowledge(
+        self,
+        task: TaskData,
+        result: TaskResult,
+        success: bool,
+    ) -> None:
+        """Buffer a task result until the next acknowledgement flush."""
+        self._pending_acks.append((task, result, success))
+        if len(self._pending_acks) >= self._settings.ack_batch_size:
+            await self._flush_acks()
+        elif self._ack_flush_task is None or self._ack_flush_task.done():
+            self._ack_flush_task = asyncio.create_task(self._flush_acks_later())
+
+    async def _flush_acks_later(self) -> None:
+        await asyncio.sleep(self._settings.ack_flush_interval)
+        await self._flush_acks()
+
+    async def _flush_acks(self) -> None:
+        """Write buffered results and metric updates in one pipeline."""
+        if not self._pending_acks:
+            return
 
-        redis_client = await self._ensure_redis()
+        acks = self._pending_acks
+        self._pending_acks = []
+        completed = sum(success for _, _, success in acks)
+        # Dead-lettered tasks already left processing_tasks in
+        # _configure_dead_letter_pipeline
+        released = sum(result.status != TaskStatus.DEAD_LETTER for _, result, _ in acks)
 
         try:
-            if self._settings.use_lua_scripts and "complete" in self._lua_scripts:
-                # Use atomic Lua script
-                task_key = self._task_data_key.format(task_id=task.task_id)
-                result_key = self._task_result_key.format(task_id=task.task_id)
-
-                await self._lua_scripts["complete"](
-                    keys=[self._processing_key, result_key, self._metrics_key],
-                    args=[task_key, result.model_dump_json(), 1],
+            redis_client = await self._ensure_redis()
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.zrem(
+                self._processing_key,
+                *(
+                    self._task_data_key.format(task_id=task.task_id)
+                    for task, _, _ in acks
+                ),
+            )
+            for task, result, _ in acks:
+                pipe.set(
+                    self._task_result_key.format(task_id=task.task_id),
+                    result.model_dump_json(),
+                    ex=86400,  # 24 hours
                 )
-            else:
-                # Manual operation
-                pipe = redis_client.pipeline()
-
-                task_key = self._task_data_key.format(task_id=task.task_id)
-                result_key = self._task_result_key.format(task_id=task.task_id)
-
-                # Remove from processing
-                pipe.zrem(self._processing_key, task_key)
-
-                # Store result
-                pipe.set(result_key, result.model_dump_json())
-                pipe.expire(result_key, 86400)  # 24 hours
-
-                # Update metrics
-                pipe.hincrby(self._metrics_key, "processing_tasks", -1)
-                pipe.hincrby(self._metrics_key, "completed_tasks", 1)
-
-                await pipe.execute()
+            if released:
+                pipe.hincrby(self._metrics_key, "processing_tasks", -released)
+            if completed:
+                pipe.hincrby(self._metrics_key, "completed_tasks", completed)
+            if completed < len(acks):
+                pipe.hincrby(self._metrics_key, "failed_tasks", len(acks) - completed)
+            await pipe.execute()
 
         except Exception as e:
-            self.logger.exception(
-                f"Failed to handle task completion for {task.task_id}: {e}",
-            )
+            self.logger.exception(f"Failed to acknowledge {len(acks)} tasks: {e}")
+
+    async def _on_task_completed(self, task: TaskData, result: TaskResult) -> None:
+        """Handle task completion."""
+        await super()._on_task_completed(task, result)
+        await self._acknowledge(task, result, True)
 
     async def _on_task_failed(self, task: TaskData, result: TaskResult) -> None:
         """Handle task failure."""
         await super()._on_task_failed(task, result)
-
-        redis_client = await self._ensure_redis()
-
-        try:
-            if self._settings.use_lua_scripts and "complete" in self._lua_scripts:
-                # Use atomic Lua script
-                task_key = self._task_data_key.format(task_id=task.task_id)
-                result_key = self._task_result_key.format(task_id=task.task_id)
-
-                await self._lua_scripts["complete"](
-                    keys=[self._processing_key, result_key, self._metrics_key],
-                    args=[task_key, result.model_dump_json(), 0],
-                )
-            else:
-                # Manual operation
-                pipe = redis_client.pipeline()
-
-                task_key = self._task_data_key.format(task_id=task.task_id)
-                result_key = self._task_result_key.format(task_id=task.task_id)
-
-                # Store result
-                pipe.set(result_key, result.model_dump_json())
-                pipe.expire(result_key, 86400)  # 24 hours
-
-                # Update metrics
-                pipe.hincrby(self._metrics_key, "failed_tasks", 1)
-
-                await pipe.execute()
-
-        except Exception as e:
-            self.logger.exception(
-                f"Failed to handle task failure for {task.task_id}: {e}",
-            )
+        await self._acknowledge(task, result, False)
 
     async def health_check(self) -> dict[str, Any]:
         """Perform health check."""
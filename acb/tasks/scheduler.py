@@ -5,8 +5,12 @@ system, allowing tasks to be scheduled based on time patterns, intervals,
 and complex scheduling rules.
 """
 
+import heapq
 import logging
+import operator
+import time
 from collections.abc import Callable
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 import asyncio
@@ -33,6 +37,15 @@ from ._base import (
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _parsed_cron(expression: str) -> Any:
+    """Parse a cron expression once and reuse the iterator.
+
+    Callers must reset it with ``set_current()`` before each ``get_next()``.
+    """
+    return croniter.croniter(expression)
+
+
 class ScheduleRule(BaseModel):
     """Scheduling rule definition."""
 
@@ -128,13 +141,18 @@ class ScheduleRule(BaseModel):
             if not croniter:
                 msg = "croniter is required for cron expressions"
                 raise ImportError(msg)
-            cron = croniter.croniter(self.cron_expression, base_time)
+            cron = _parsed_cron(self.cron_expression)
+            cron.set_current(base_time, force=True)
             return cron.get_next(datetime)
 
         if self.interval_seconds:
             anchor = self.last_run or base_time
             return anchor + timedelta(seconds=self.interval_seconds)
 
+        # One-off rule (schedule_once): run at start_time
+        if self.start_time and self.run_count == 0:
+            return self.start_time
+
         return None
 
     def _is_within_schedule_window(self, next_time: datetime | None) -> bool:
@@ -182,8 +200,13 @@ class TaskScheduler:
         self.queue = queue
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
 
-        # Schedule rules
+        # Schedule rules, plus a min-heap of (next_run, sequence, rule_id).
+        # Heap entries are never removed in place: an entry whose time no
+        # longer matches its rule's next_run is stale and skipped when popped.
         self._rules: dict[UUID, ScheduleRule] = {}
+        self._heap: list[tuple[float, int, UUID]] = []
+        self._heap_sequence = 0
+        self._wakeup = asyncio.Event()
 
         # Scheduler state
         self._running = False
@@ -191,7 +214,8 @@ class TaskScheduler:
         self._shutdown_event = asyncio.Event()
 
         # Configuration
-        self._check_interval = 1.0  # Check every second
+        self._check_interval = 1.0  # Retry delay after errors
+        self._max_sleep = 60.0  # Re-check the wall clock at least this often
         self._max_concurrent_tasks = 100
 
     async def start(self) -> None:
@@ -223,29 +247,84 @@ class TaskScheduler:
 
         self.logger.info("Task scheduler stopped")
 
+    def _push(self, rule: ScheduleRule) -> None:
+        """Add a heap entry for the rule's next run and wake the loop."""
+        if not rule.enabled or rule.next_run is None:
+            return
+
+        self._heap_sequence += 1
+        heapq.heappush(
+            self._heap,
+            (rule.next_run.timestamp(), self._heap_sequence, rule.rule_id),
+        )
+        if len(self._heap) > 2 * len(self._rules) + 64:
+            self._compact_heap()
+        self._wakeup.set()
+
+    def _compact_heap(self) -> None:
+        """Drop stale entries left behind by updates and removals."""
+        self._heap = [entry for entry in self._heap if self._is_current(entry)]
+        heapq.heapify(self._heap)
+
+    def _is_current(self, entry: tuple[float, int, UUID]) -> bool:
+        rule = self._rules.get(entry[2])
+        return bool(
+            rule
+            and rule.enabled
+            and rule.next_run
+            and rule.next_run.timestamp() == entry[0]
+        )
+
+    def _pop_due_rules(self, current_time: datetime) -> list[ScheduleRule]:
+        """Pop every rule due at ``current_time``; cost is O(due log n)."""
+        now = current_time.timestamp()
+        due: dict[UUID, ScheduleRule] = {}
+        while self._heap and self._heap[0][0] <= now:
+            entry = heapq.heappop(self._heap)
+            rule = self._rules[entry[2]] if self._is_current(entry) else None
+            if rule is not None and rule.should_run(current_time):
+                due[rule.rule_id] = rule
+        return list(due.values())
+
+    def _seconds_until_next_run(self) -> float | None:
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - time.time())
+
+    async def _run_due_rules(self, current_time: datetime) -> int:
+        tasks_scheduled = 0
+        for rule in self._pop_due_rules(current_time):
+            try:
+                await self._execute_rule(rule, current_time)
+                tasks_scheduled += 1
+                self._push(rule)
+            except Exception as e:
+                self.logger.exception(f"Failed to execute rule {rule.name}: {e}")
+                rule.next_run = current_time + timedelta(seconds=self._check_interval)
+                self._push(rule)
+        return tasks_scheduled
+
     async def _scheduler_loop(self) -> None:
-        """Main scheduler loop."""
+        """Main scheduler loop.
+
+        Sleeps until the earliest next run; adding or changing a rule wakes
+        it early. Idle cost is independent of the number of rules.
+        """
         while self._running and not self._shutdown_event.is_set():
             try:
-                current_time = datetime.now(tz=UTC)
-                tasks_scheduled = 0
-
-                # Check all rules
-                for rule in list(self._rules.values()):
-                    if rule.should_run(current_time):
-                        try:
-                            await self._execute_rule(rule, current_time)
-                            tasks_scheduled += 1
-                        except Exception as e:
-                            self.logger.exception(
-                                f"Failed to execute rule {rule.name}: {e}",
-                            )
-
+                self._wakeup.clear()
+                tasks_scheduled = await self._run_due_rules(datetime.now(tz=UTC))
                 if tasks_scheduled > 0:
                     self.logger.debug(f"Scheduled {tasks_scheduled} tasks")
 
-                # Sleep until next check
-                await asyncio.sleep(self._check_interval)
+                delay = self._seconds_until_next_run()
+                timeout = (
+                    self._max_sleep if delay is None else min(delay, self._max_sleep)
+                )
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
 
             except asyncio.CancelledError:
                 break
@@ -288,6 +367,7 @@ class TaskScheduler:
     def add_rule(self, rule: ScheduleRule) -> UUID:
         """Add a scheduling rule."""
         self._rules[rule.rule_id] = rule
+        self._push(rule)
         self.logger.info(f"Added scheduling rule: {rule.name}")
         return rule.rule_id
 
@@ -313,6 +393,7 @@ class TaskScheduler:
         if rule:
             rule.enabled = True
             rule.calculate_next_run()
+            self._push(rule)
             self.logger.info(f"Enabled scheduling rule: {rule.name}")
             return True
         return False
@@ -341,6 +422,7 @@ class TaskScheduler:
         # Recalculate next run
         if rule.enabled:
             rule.calculate_next_run()
+            self._push(rule)
 
         self.logger.info(f"Updated scheduling rule: {rule.name}")
         return True
@@ -353,12 +435,7 @@ class TaskScheduler:
             if rule.enabled and rule.next_run
         ]
 
-        # Sort by next run time
-        import operator
-
-        upcoming.sort(key=operator.itemgetter(0))
-
-        return upcoming[:limit]
+        return heapq.nsmallest(limit, upcoming, key=operator.itemgetter(0))
 
     # Convenience methods for common scheduling patterns
     def schedule_cron(
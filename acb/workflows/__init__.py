@@ -63,6 +63,7 @@ Usage:
 from acb.workflows._base import (
     StepResult,
     StepState,
+    WorkflowAdmissionError,
     WorkflowConfig,
     WorkflowDefinition,
     WorkflowEngine,
@@ -72,6 +73,11 @@ from acb.workflows._base import (
     WorkflowState,
     WorkflowStep,
 )
+from acb.workflows.checkpoint import (
+    CheckpointStore,
+    StateCheckpointStore,
+    step_input_hash,
+)
 from acb.workflows.discovery import (
     WorkflowCapability,
     WorkflowEngineStatus,
@@ -88,8 +94,12 @@ from acb.workflows.engine import BasicWorkflowEngine
 
 __all__ = [
     "BasicWorkflowEngine",
+    # Checkpointing
+    "CheckpointStore",
+    "StateCheckpointStore",
     "StepResult",
     "StepState",
+    "WorkflowAdmissionError",
     # Discovery system
     "WorkflowCapability",
     # Configuration and settings
@@ -114,4 +124,5 @@ __all__ = [
     "list_enabled_workflow_engines",
     "list_workflow_engines",
     "register_workflow_engine",
+    "step_input_hash",
 ]
@@ -7,8 +7,10 @@ This module provides the foundation for workflow management, including:
 - Error handling and retry mechanisms
 """
 
+import time
 from abc import ABC, abstractmethod
 from enum import Enum
+from itertools import count
 
 import asyncio
 import typing as t
@@ -20,6 +22,13 @@ from pydantic import BaseModel, ConfigDict, Field
 from acb.services._base import ServiceBase, ServiceConfig, ServiceSettings
 
 
+class WorkflowAdmissionError(Exception):
+    """Raised when a workflow is rejected because the pending queue is full.
+
+    Also raised when a workflow with the same ID is already pending.
+    """
+
+
 class WorkflowState(Enum):
     """Workflow execution state."""
 
@@ -102,6 +111,10 @@ class WorkflowStep(BaseModel):
         default=False,
         description="Can execute in parallel with other steps",
     )
+    memoize: bool = Field(
+        default=False,
+        description="Reuse the stored output of an identical earlier step",
+    )
 
 
 class WorkflowDefinition(BaseModel):
@@ -136,6 +149,9 @@ class WorkflowSettings(ServiceSettings):
     """Settings for workflow engine."""
 
     max_concurrent_workflows: int = 10
+    max_pending_workflows: int = 100
+    # How long submit_workflow() waits for queue space before rejecting
+    admission_timeout: float = 0.0
     max_concurrent_steps: int = 5
     default_timeout: float = 3600.0
     enable_events: bool = True
@@ -259,10 +275,22 @@ class WorkflowEngine(ABC):
         ...
 
 
+@dataclass
+class _PendingWorkflow:
+    """A submitted workflow waiting for a worker."""
+
+    workflow: WorkflowDefinition
+    context: dict[str, t.Any] | None
+    submitted_at: float
+    cancelled: bool = False
+
+
 class WorkflowService(ServiceBase):
     """Base service for workflow management.
 
     Provides workflow orchestration with integration to Events System and Task Queue.
+    Submitted workflows wait in a bounded priority queue and are run by a fixed
+    pool of ``max_concurrent_workflows`` workers.
     """
 
     def __init__(
@@ -284,9 +312,24 @@ class WorkflowService(ServiceBase):
         self._engine = engine
         self._settings: WorkflowSettings = self._settings  # type: ignore
         self._active_workflows: dict[str, asyncio.Task[WorkflowResult]] = {}
-        self._workflow_semaphore = asyncio.Semaphore(
-            self._settings.max_concurrent_workflows,
-        )
+
+        # Admission control: (-priority, sequence, pending) keeps FIFO order
+        # within a priority level. Cancelled entries stay in the queue until a
+        # worker skips them, so the bound is enforced on the live pending
+        # workflows rather than on the queue size
+        self._pending_queue: asyncio.PriorityQueue[
+            tuple[int, int, _PendingWorkflow]
+        ] = asyncio.PriorityQueue()
+        self._pending_workflows: dict[str, _PendingWorkflow] = {}
+        self._pending_changed = asyncio.Condition()
+        self._submission_counter = count()
+        self._workers: list[asyncio.Task[None]] = []
+
+        self._rejected = 0
+        self._started = 0
+        self._finished = 0
+        self._total_wait_time = 0.0
+        self._total_run_time = 0.0
 
     async def _initialize(self) -> None:
         """Initialize workflow service."""
@@ -296,12 +339,24 @@ class WorkflowService(ServiceBase):
         if hasattr(self._engine, "initialize"):
             await self._engine.initialize()
 
+        self._start_workers()
+
         self.logger.info("Workflow service initialized")
 
     async def _shutdown(self) -> None:
         """Shutdown workflow service."""
         self.logger.info("Shutting down workflow service")
 
+        # Stop taking work, then drop anything still queued
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        for pending in self._pending_workflows.values():
+            pending.cancelled = True
+        self._pending_workflows.clear()
+        await self._notify_pending_changed()
+
         # Cancel all active workflows
         for workflow_id, task in self._active_workflows.items():
             self.logger.info(f"Cancelling workflow {workflow_id}")
@@ -326,32 +381,142 @@ class WorkflowService(ServiceBase):
             "status": "ok",
             "active_workflows": len(self._active_workflows),
             "max_concurrent": self._settings.max_concurrent_workflows,
+            "pending_workflows": len(self._pending_workflows),
+            "max_pending": self._settings.max_pending_workflows,
         }
 
+    def _start_workers(self) -> None:
+        """Start the fixed worker pool if it is not running yet."""
+        if self._workers:
+            return
+
+        self._workers = [
+            asyncio.create_task(self._worker_loop())
+            for _ in range(self._settings.max_concurrent_workflows)
+        ]
+
     async def submit_workflow(
         self,
         workflow: WorkflowDefinition,
         context: dict[str, t.Any] | None = None,
+        priority: int = 0,
     ) -> str:
         """Submit a workflow for execution.
 
+        The workflow is queued until a worker is free. When the pending queue
+        is full, waits up to ``admission_timeout`` seconds for space.
+
         Args:
             workflow: Workflow definition to execute
             context: Optional execution context
+            priority: Higher values are started first
 
         Returns:
             Workflow ID for tracking
+
+        Raises:
+            WorkflowAdmissionError: If the pending queue stays full or a
+                workflow with the same ID is already pending
         """
         self.increment_requests()
-
-        async with self._workflow_semaphore:
-            # Create execution task
-            task = asyncio.create_task(
-                self._execute_workflow_with_tracking(workflow, context),
+        self._start_workers()
+
+        workflow_id = workflow.workflow_id
+        async with self._pending_changed:
+            if (
+                not self._has_pending_capacity()
+                and self._settings.admission_timeout > 0
+            ):
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        self._pending_changed.wait_for(self._has_pending_capacity),
+                        timeout=self._settings.admission_timeout,
+                    )
+
+            if workflow_id in self._pending_workflows:
+                self._reject(f"Workflow {workflow_id} rejected: already pending")
+            if not self._has_pending_capacity():
+                self._reject(
+                    f"Workflow {workflow_id} rejected: "
+                    f"{self._settings.max_pending_workflows} workflows already pending",
+                )
+
+            pending = _PendingWorkflow(
+                workflow=workflow,
+                context=context,
+                submitted_at=time.monotonic(),
+            )
+            self._pending_workflows[workflow_id] = pending
+            self._pending_queue.put_nowait(
+                (-priority, next(self._submission_counter), pending),
             )
-            self._active_workflows[workflow.workflow_id] = task
 
-            return workflow.workflow_id
+        self._update_admission_metrics()
+
+        return workflow_id
+
+    def _has_pending_capacity(self) -> bool:
+        return len(self._pending_workflows) < self._settings.max_pending_workflows
+
+    def _reject(self, msg: str) -> t.NoReturn:
+        """Count a rejected submission and raise ``WorkflowAdmissionError``."""
+        self._rejected += 1
+        self._update_admission_metrics()
+        raise WorkflowAdmissionError(msg)
+
+    async def _notify_pending_changed(self) -> None:
+        """Wake submissions waiting for a free pending slot."""
+        async with self._pending_changed:
+            self._pending_changed.notify_all()
+
+    async def _worker_loop(self) -> None:
+        """Run queued workflows one at a time."""
+        while True:
+            _, _, pending = await self._pending_queue.get()
+            try:
+                if pending.cancelled:
+                    continue
+
+                workflow_id = pending.workflow.workflow_id
+                if self._pending_workflows.get(workflow_id) is pending:
+                    del self._pending_workflows[workflow_id]
+                    await self._notify_pending_changed()
+                started_at = time.monotonic()
+                self._started += 1
+                self._total_wait_time += started_at - pending.submitted_at
+
+                task = asyncio.create_task(
+                    self._execute_workflow_with_tracking(
+                        pending.workflow,
+                        pending.context,
+                    ),
+                )
+                self._active_workflows[workflow_id] = task
+                self._update_admission_metrics()
+
+                # wait() instead of await so a cancelled workflow does not
+                # cancel the worker
+                await asyncio.wait({task})
+
+                self._finished += 1
+                self._total_run_time += time.monotonic() - started_at
+                self._update_admission_metrics()
+            finally:
+                self._pending_queue.task_done()
+
+    def _update_admission_metrics(self) -> None:
+        """Publish queue depth, wait time and run time as custom metrics."""
+        self.set_custom_metric("workflows_pending", len(self._pending_workflows))
+        self.set_custom_metric("workflows_running", len(self._active_workflows))
+        self.set_custom_metric("workflows_rejected", self._rejected)
+        self.set_custom_metric(
+            "workflow_avg_wait_ms",
+            self._total_wait_time / self._started * 1000 if self._started else 0.0,
+        )
+        self.set_custom_metric(
+            "workflow_avg_run_ms",
+            self._total_run_time / self._finished * 1000 if self._finished else 0.0,
+        )
 
     async def _execute_workflow_with_tracking(
         self,
@@ -398,6 +563,14 @@ class WorkflowService(ServiceBase):
 
     async def cancel_workflow(self, workflow_id: str) -> bool:
         """Cancel a workflow."""
+        # Drop it from the queue if it has not started yet
+        pending = self._pending_workflows.pop(workflow_id, None)
+        if pending is not None:
+            pending.cancelled = True
+            self._update_admission_metrics()
+            await self._notify_pending_changed()
+            return True
+
         # Cancel task if still running
         if workflow_id in self._active_workflows:
             task = self._active_workflows[workflow_id]
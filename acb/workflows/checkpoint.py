@@ -0,0 +1,200 @@
+"""Workflow checkpoint storage.
+
+Lets workflow engines persist step results as they complete, so a workflow
+that is re-executed after a crash resumes from its last checkpoint instead of
+recomputing finished steps. Also stores memoized step outputs keyed by a hash
+of the step's inputs and context, so identical steps can reuse earlier results.
+
+Features:
+- CheckpointStore interface for pluggable checkpoint backends
+- StateCheckpointStore backed by the StateManagerService
+- Content-hash helper for step memoization keys
+"""
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+
+import typing as t
+from datetime import datetime
+
+from acb.services.state import StateManagerService, StateType
+from acb.workflows._base import StepResult, StepState, WorkflowStep
+
+
+def step_input_hash(
+    step: WorkflowStep,
+    dependency_outputs: dict[str, t.Any],
+    context: dict[str, t.Any] | None = None,
+) -> str:
+    """Hash the inputs that determine a step's output.
+
+    Covers the action, its parameters, the outputs of the steps it depends on
+    and the execution context, since action handlers receive it too.
+    """
+    payload = json.dumps(
+        {
+            "action": step.action,
+            "params": step.params,
+            "dependencies": dependency_outputs,
+            "context": context or {},
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _dump_step_result(result: StepResult) -> dict[str, t.Any]:
+    return {
+        "step_id": result.step_id,
+        "state": result.state.value,
+        "output": result.output,
+        "error": result.error,
+        "started_at": result.started_at.isoformat() if result.started_at else None,
+        "completed_at": (
+            result.completed_at.isoformat() if result.completed_at else None
+        ),
+        "duration_ms": result.duration_ms,
+        "retry_count": result.retry_count,
+        "metadata": result.metadata,
+    }
+
+
+def _load_step_result(data: dict[str, t.Any]) -> StepResult:
+    started_at = data.get("started_at")
+    completed_at = data.get("completed_at")
+    return StepResult(
+        step_id=data["step_id"],
+        state=StepState(data["state"]),
+        output=data.get("output"),
+        error=data.get("error"),
+        started_at=datetime.fromisoformat(started_at) if started_at else None,
+        completed_at=datetime.fromisoformat(completed_at) if completed_at else None,
+        duration_ms=data.get("duration_ms"),
+        retry_count=data.get("retry_count", 0),
+        metadata=data.get("metadata") or {},
+    )
+
+
+class CheckpointStore(ABC):
+    """Abstract base class for workflow checkpoint storage."""
+
+    @abstractmethod
+    async def load(
+        self,
+        workflow_id: str,
+        step_ids: list[str],
+    ) -> dict[str, StepResult]:
+        """Load checkpointed step results for a workflow.
+
+        Args:
+            workflow_id: ID of the workflow
+            step_ids: Steps of the workflow definition
+
+        Returns:
+            Checkpointed results keyed by step ID
+        """
+        ...
+
+    @abstractmethod
+    async def save_step(self, workflow_id: str, result: StepResult) -> None:
+        """Checkpoint a single finished step.
+
+        Args:
+            workflow_id: ID of the workflow
+            result: Result of the finished step
+        """
+        ...
+
+    @abstractmethod
+    async def clear(self, workflow_id: str, step_ids: list[str]) -> None:
+        """Drop all checkpoints of a workflow.
+
+        Args:
+            workflow_id: ID of the workflow
+            step_ids: Steps of the workflow definition
+        """
+        ...
+
+    @abstractmethod
+    async def get_memo(self, input_hash: str) -> StepResult | None:
+        """Get a memoized step result by input hash.
+
+        Args:
+            input_hash: Hash from step_input_hash()
+
+        Returns:
+            StepResult if a result was memoized, None otherwise
+        """
+        ...
+
+    @abstractmethod
+    async def save_memo(self, input_hash: str, result: StepResult) -> None:
+        """Memoize a step result under its input hash.
+
+        Args:
+            input_hash: Hash from step_input_hash()
+            result: Completed step result
+        """
+        ...
+
+
+class StateCheckpointStore(CheckpointStore):
+    """Checkpoint store backed by the StateManagerService.
+
+    Entries are written as persistent state, so they reach the service's
+    persistent storage as well as memory.
+    """
+
+    def __init__(
+        self,
+        state: StateManagerService,
+        key_prefix: str = "workflows",
+        ttl_seconds: int | None = None,
+        memo_ttl_seconds: int | None = None,
+    ) -> None:
+        self._state = state
+        self._key_prefix = key_prefix
+        self._ttl_seconds = ttl_seconds
+        self._memo_ttl_seconds = memo_ttl_seconds
+
+    def _step_key(self, workflow_id: str, step_id: str) -> str:
+        return f"{self._key_prefix}:checkpoint:{workflow_id}:{step_id}"
+
+    def _memo_key(self, input_hash: str) -> str:
+        return f"{self._key_prefix}:memo:{input_hash}"
+
+    async def load(
+        self,
+        workflow_id: str,
+        step_ids: list[str],
+    ) -> dict[str, StepResult]:
+        keys = {self._step_key(workflow_id, step_id): step_id for step_id in step_ids}
+        stored = await self._state.get_multi(list(keys))
+        return {keys[key]: _load_step_result(data) for key, data in stored.items()}
+
+    async def save_step(self, workflow_id: str, result: StepResult) -> None:
+        await self._state.set(
+            self._step_key(workflow_id, result.step_id),
+            _dump_step_result(result),
+            state_type=StateType.PERSISTENT,
+            ttl_seconds=self._ttl_seconds,
+        )
+
+    async def clear(self, workflow_id: str, step_ids: list[str]) -> None:
+        await self._state.delete_multi(
+            [self._step_key(workflow_id, step_id) for step_id in step_ids],
+        )
+
+    async def get_memo(self, input_hash: str) -> StepResult | None:
+        data = await self._state.get(self._memo_key(input_hash))
+        return _load_step_result(data) if data else None
+
+    async def save_memo(self, input_hash: str, result: StepResult) -> None:
+        await self._state.set(
+            self._memo_key(input_hash),
+            _dump_step_result(result),
+            state_type=StateType.PERSISTENT,
+            ttl_seconds=self._memo_ttl_seconds,
+        )
@@ -4,7 +4,7 @@ Provides a simple but robust workflow execution engine with:
 - Step dependency resolution and ordering
 - Parallel step execution where possible
 - Retry logic with exponential backoff
-- State persistence and recovery
+- Checkpointing, resume and step memoization via a CheckpointStore
 - Event integration for workflow tracking
 """
 
@@ -25,6 +25,7 @@ from acb.workflows._base import (
     WorkflowState,
     WorkflowStep,
 )
+from acb.workflows.checkpoint import CheckpointStore, step_input_hash
 
 
 class BasicWorkflowEngine(WorkflowEngine):
@@ -32,8 +33,13 @@ class BasicWorkflowEngine(WorkflowEngine):
 
     logger: Inject[Logger]
 
-    def __init__(self, max_concurrent_steps: int = 5) -> None:
+    def __init__(
+        self,
+        max_concurrent_steps: int = 5,
+        checkpoint_store: CheckpointStore | None = None,
+    ) -> None:
         self._max_concurrent_steps = max_concurrent_steps
+        self._checkpoint_store = checkpoint_store
         self._workflow_states: dict[str, WorkflowResult] = {}
         self._step_semaphore = asyncio.Semaphore(max_concurrent_steps)
         self._action_registry: dict[str, t.Callable[..., t.Awaitable[t.Any]]] = {}
@@ -78,8 +84,15 @@ class BasicWorkflowEngine(WorkflowEngine):
         self,
         workflow: WorkflowDefinition,
         context: dict[str, t.Any] | None = None,
+        *,
+        resume: bool = True,
     ) -> WorkflowResult:
-        """Execute a workflow with dependency resolution and parallel execution."""
+        """Execute a workflow with dependency resolution and parallel execution.
+
+        With a checkpoint store, steps checkpointed by an earlier run of the same
+        workflow ID are restored instead of executed, unless ``resume`` is False.
+        Checkpoints are dropped once the workflow completes.
+        """
         start_time = time.time()
         context = context or {}
 
@@ -89,6 +102,8 @@ class BasicWorkflowEngine(WorkflowEngine):
         )
 
         try:
+            await self._restore_checkpoint(workflow, result, completed_steps, resume)
+
             # Execute workflow steps in dependency order
             await self._execute_workflow_steps(
                 workflow,
@@ -101,6 +116,12 @@ class BasicWorkflowEngine(WorkflowEngine):
             # Finalize workflow result
             self._finalize_workflow_result(workflow, result, failed_steps, start_time)
 
+            if self._checkpoint_store and result.state == WorkflowState.COMPLETED:
+                await self._checkpoint_store.clear(
+                    workflow.workflow_id,
+                    [step.step_id for step in workflow.steps],
+                )
+
             return result
 
         except Exception as e:
@@ -126,6 +147,34 @@ class BasicWorkflowEngine(WorkflowEngine):
 
         return result, completed_steps, failed_steps
 
+    async def _restore_checkpoint(
+        self,
+        workflow: WorkflowDefinition,
+        result: WorkflowResult,
+        completed_steps: dict[str, StepResult],
+        resume: bool,
+    ) -> None:
+        """Mark steps checkpointed by an earlier run as completed."""
+        if self._checkpoint_store is None:
+            return
+
+        step_ids = [step.step_id for step in workflow.steps]
+        if not resume:
+            await self._checkpoint_store.clear(workflow.workflow_id, step_ids)
+            return
+
+        restored = await self._checkpoint_store.load(workflow.workflow_id, step_ids)
+        for step_id, step_result in restored.items():
+            step_result.metadata["restored"] = True
+            completed_steps[step_id] = step_result
+            result.steps.append(step_result)
+
+        if restored:
+            self.logger.info(
+                f"Workflow {workflow.workflow_id} resumed with "
+                f"{len(restored)} checkpointed steps",
+            )
+
     async def _execute_workflow_steps(
         self,
         workflow: WorkflowDefinition,
@@ -134,34 +183,89 @@ class BasicWorkflowEngine(WorkflowEngine):
         completed_steps: dict[str, StepResult],
         failed_steps: set[str],
     ) -> None:
-        """Execute all workflow steps in dependency order."""
-        while len(completed_steps) < len(workflow.steps):
-            # Find steps ready to execute
-            ready_steps = self._find_ready_steps(
-                workflow.steps,
-                completed_steps,
-                failed_steps,
+        """Execute all workflow steps in dependency order.
+
+        Each step starts as soon as its last dependency finishes, so a slow
+        step only holds back the steps that depend on it. The step semaphore
+        bounds how many run at once.
+        """
+        steps_by_id = {step.step_id: step for step in workflow.steps}
+        dependents, pending_deps = self._index_dependencies(workflow.steps)
+        running: dict[asyncio.Task[StepResult], str] = {}
+
+        def launch(step: WorkflowStep) -> None:
+            task = asyncio.create_task(
+                self._run_step(workflow, step, context, completed_steps),
             )
+            running[task] = step.step_id
 
-            # Check for completion or deadlock
-            if not ready_steps:
-                self._handle_no_ready_steps(workflow, completed_steps, failed_steps)
-                break
+        # Steps restored from a checkpoint count as finished dependencies
+        for step_id in completed_steps:
+            for dependent_id in dependents.get(step_id, ()):
+                pending_deps[dependent_id] -= 1
 
-            # Execute ready steps in parallel
-            step_results = await self._execute_parallel_steps(ready_steps, context)
+        for step in workflow.steps:
+            if not pending_deps[step.step_id] and step.step_id not in completed_steps:
+                launch(step)
 
-            # Process step results
-            should_stop = self._process_step_results(
-                workflow,
-                step_results,
-                completed_steps,
-                failed_steps,
-                result,
-            )
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    step_id = running.pop(task)
+                    if self._record_step_result(
+                        workflow,
+                        step_id,
+                        task.result(),
+                        completed_steps,
+                        failed_steps,
+                        result,
+                    ):
+                        return
+
+                    for dependent_id in dependents.get(step_id, ()):
+                        dependent = steps_by_id[dependent_id]
+                        # A failed dependency blocks the step for good unless
+                        # it allows skipping
+                        if not self._check_dependency_status(
+                            step_id,
+                            dependent,
+                            completed_steps,
+                        ):
+                            continue
+                        pending_deps[dependent_id] -= 1
+                        if not pending_deps[dependent_id]:
+                            launch(dependent)
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if len(completed_steps) < len(workflow.steps):
+            self._handle_no_ready_steps(workflow, completed_steps, failed_steps)
+
+    def _index_dependencies(
+        self,
+        steps: list[WorkflowStep],
+    ) -> tuple[dict[str, list[str]], dict[str, int]]:
+        """Build dependents lists and unmet-dependency counts for each step.
 
-            if should_stop:
-                break
+        Dependencies on unknown step IDs are never met, so those steps never
+        start and are reported as deadlocked.
+        """
+        dependents: dict[str, list[str]] = {}
+        pending_deps: dict[str, int] = {}
+
+        for step in steps:
+            pending_deps[step.step_id] = len(step.depends_on)
+            for dep_id in step.depends_on:
+                dependents.setdefault(dep_id, []).append(step.step_id)
+
+        return dependents, pending_deps
 
     def _handle_no_ready_steps(
         self,
@@ -182,51 +286,27 @@ class BasicWorkflowEngine(WorkflowEngine):
                 f"Remaining steps: {[s.step_id for s in remaining]}",
             )
 
-    async def _execute_parallel_steps(
-        self,
-        ready_steps: list[WorkflowStep],
-        context: dict[str, t.Any],
-    ) -> list[tuple[str, StepResult]]:
-        """Execute multiple steps in parallel and collect results."""
-        step_tasks = [
-            (
-                step.step_id,
-                asyncio.create_task(self._execute_step_with_retry(step, context)),
-            )
-            for step in ready_steps
-        ]
-
-        # Wait for all tasks to complete
-        results = []
-        for step_id, task in step_tasks:
-            step_result = await task
-            results.append((step_id, step_result))
-
-        return results
-
-    def _process_step_results(
+    def _record_step_result(
         self,
         workflow: WorkflowDefinition,
-        step_results: list[tuple[str, StepResult]],
+        step_id: str,
+        step_result: StepResult,
         completed_steps: dict[str, StepResult],
         failed_steps: set[str],
         result: WorkflowResult,
     ) -> bool:
-        """Process step results and update workflow state. Returns True if should stop."""
-        for step_id, step_result in step_results:
-            completed_steps[step_id] = step_result
-            result.steps.append(step_result)
+        """Record a finished step and update workflow state. Returns True if should stop."""
+        completed_steps[step_id] = step_result
+        result.steps.append(step_result)
 
-            if step_result.state == StepState.FAILED:
-                should_stop = self._handle_step_failure(
-                    workflow,
-                    step_id,
-                    step_result,
-                    failed_steps,
-                    result,
-                )
-                if should_stop:
-                    return True
+        if step_result.state == StepState.FAILED:
+            return self._handle_step_failure(
+                workflow,
+                step_id,
+                step_result,
+                failed_steps,
+                result,
+            )
 
         return False
 
@@ -265,6 +345,10 @@ class BasicWorkflowEngine(WorkflowEngine):
             else:
                 result.state = WorkflowState.COMPLETED
 
+        # Report steps in definition order rather than completion order
+        order = {step.step_id: index for index, step in enumerate(workflow.steps)}
+        result.steps.sort(key=lambda step: order.get(step.step_id, len(order)))
+
         # Set completion time
         result.completed_at = datetime.now()
         result.duration_ms = (time.time() - start_time) * 1000
@@ -289,15 +373,6 @@ class BasicWorkflowEngine(WorkflowEngine):
         result.duration_ms = (time.time() - start_time) * 1000
         self._workflow_states[workflow.workflow_id] = result
 
-    def _is_step_already_processed(
-        self,
-        step_id: str,
-        completed: dict[str, StepResult],
-        failed: set[str],
-    ) -> bool:
-        """Check if step has already been completed or failed."""
-        return step_id in completed or step_id in failed
-
     def _check_dependency_status(
         self,
         dep_id: str,
@@ -315,37 +390,43 @@ class BasicWorkflowEngine(WorkflowEngine):
 
         return True
 
-    def _are_dependencies_satisfied(
+    async def _run_step(
         self,
+        workflow: WorkflowDefinition,
         step: WorkflowStep,
-        completed: dict[str, StepResult],
-    ) -> bool:
-        """Check if all dependencies for a step are satisfied."""
-        for dep_id in step.depends_on:
-            if not self._check_dependency_status(dep_id, step, completed):
-                return False
-
-        return True
-
-    def _find_ready_steps(
-        self,
-        steps: list[WorkflowStep],
-        completed: dict[str, StepResult],
-        failed: set[str],
-    ) -> list[WorkflowStep]:
-        """Find steps that are ready to execute."""
-        ready = []
-
-        for step in steps:
-            # Skip if already processed
-            if self._is_step_already_processed(step.step_id, completed, failed):
-                continue
-
-            # Check if dependencies are satisfied
-            if self._are_dependencies_satisfied(step, completed):
-                ready.append(step)
-
-        return ready
+        context: dict[str, t.Any],
+        completed_steps: dict[str, StepResult],
+    ) -> StepResult:
+        """Execute a step, reusing a memoized result and checkpointing success."""
+        store = self._checkpoint_store
+        if store is None:
+            return await self._execute_step_with_retry(step, context)
+
+        input_hash = None
+        if step.memoize:
+            input_hash = step_input_hash(
+                step,
+                {
+                    dep_id: completed_steps[dep_id].output
+                    for dep_id in step.depends_on
+                    if dep_id in completed_steps
+                },
+                context,
+            )
+            memoized = await store.get_memo(input_hash)
+            if memoized is not None:
+                memoized.step_id = step.step_id
+                memoized.metadata["memoized"] = True
+                await store.save_step(workflow.workflow_id, memoized)
+                return memoized
+
+        step_result = await self._execute_step_with_retry(step, context)
+        if step_result.state == StepState.COMPLETED:
+            await store.save_step(workflow.workflow_id, step_result)
+            if input_hash is not None:
+                await store.save_memo(input_hash, step_result)
+
+        return step_result
 
     async def _execute_step_with_retry(
         self,
@@ -2,8 +2,11 @@
 
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import brotli
 import pytest
 import typing as t
+from msgspec import msgpack
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from acb.adapters.cache._base import CacheBase, CacheBaseSettings, MsgPackSerializer
 from acb.adapters.cache.memory import Cache as MemoryCache
@@ -20,37 +23,68 @@ class TestMsgPackSerializer:
         assert not serializer.use_list
 
     @pytest.mark.unit
-    def test_dumps(self) -> None:
+    def test_init_unknown_codec(self) -> None:
+        with pytest.raises(ValueError, match="Unknown cache codec"):
+            MsgPackSerializer(codec="snappy")  # type: ignore[arg-type]
+
+    @pytest.mark.unit
+    def test_dumps_small_payload_skips_compression(self) -> None:
         serializer: MsgPackSerializer = MsgPackSerializer()
+        test_data: dict[str, t.Any] = {"key": "value", "number": 42}
+        with patch("acb.adapters.cache._base.brotli.compress") as mock_compress:
+            result: bytes = serializer.dumps(test_data)
+            mock_compress.assert_not_called()
+        assert result == b"\xa0" + msgpack.encode(test_data)
+
+    @pytest.mark.unit
+    def test_dumps_large_payload_is_compressed(self) -> None:
+        serializer: MsgPackSerializer = MsgPackSerializer(compression_threshold=64)
+        test_data: list[str] = ["value"] * 100
+        result: bytes = serializer.dumps(test_data)
+        assert result[0] == 0xA1
+        assert len(result) < len(msgpack.encode(test_data))
+        assert serializer.loads(result) == test_data
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("codec", ["none", "brotli", "zstd", "lz4"])
+    def test_roundtrip(self, codec: str) -> None:
+        if codec == "zstd":
+            pytest.importorskip("zstandard")
+        elif codec == "lz4":
+            pytest.importorskip("lz4")
+        serializer = MsgPackSerializer(codec=codec, compression_threshold=0)  # type: ignore[arg-type]
         test_data: dict[str, t.Any] = {
-            "key": "value",
+            "string": "test",
             "number": 42,
             "list": [1, 2, 3],
+            "nested": {"key": "value"},
         }
-        with (
-            patch("acb.adapters.cache._base.msgpack.encode") as mock_encode,
-            patch("acb.adapters.cache._base.compress.brotli") as mock_compress,
-        ):
-            mock_encode.return_value = b"encoded_data"
-            mock_compress.return_value = b"compressed_data"
-            result: str = serializer.dumps(test_data)
-            mock_encode.assert_called_once_with(test_data)
-            mock_compress.assert_called_once_with(b"encoded_data")
-            assert result == "compressed_data"
+        serialized: bytes = serializer.dumps(test_data)
+        assert isinstance(serialized, bytes)
+        assert serializer.loads(serialized) == test_data
+
+    @pytest.mark.unit
+    def test_loads_other_codec(self) -> None:
+        written = MsgPackSerializer(compression_threshold=0).dumps({"key": "value"})
+        reader = MsgPackSerializer(codec="none")
+        assert reader.loads(written) == {"key": "value"}
 
     @pytest.mark.unit
-    def test_loads(self) -> None:
+    def test_loads_legacy_entries(self) -> None:
         serializer: MsgPackSerializer = MsgPackSerializer()
-        test_data: str = "compressed_data"
+        test_data: dict[str, t.Any] = {"key": "value", "list": [1, 2, 3]}
+        legacy: str = brotli.compress(msgpack.encode(test_data)).decode("latin-1")
+        assert serializer.loads(legacy) == test_data
+        assert serializer.loads(legacy.encode()) == test_data
+
+    @pytest.mark.unit
+    def test_missing_optional_codec(self) -> None:
+        serializer = MsgPackSerializer(codec="zstd", compression_threshold=0)
         with (
-            patch("acb.adapters.cache._base.decompress.brotli") as mock_decompress,
-            patch("acb.adapters.cache._base.msgpack.decode") as mock_decode,
+            patch.dict("sys.modules", {"zstandard": None}),
+            pytest.raises(ImportError, match="zstandard"),
         ):
-            mock_decompress.return_value = b"decompressed_data"
-            mock_decode.return_value = {"key": "value"}
-            result: t.Any = serializer.loads(test_data)
-            mock_decompress.assert_called_once_with(test_data.encode("latin-1"))
-            assert result == {"key": "value"}
+            serializer.dumps({"key": "value"})
 
     @pytest.mark.unit
     def test_loads_empty_string(self) -> None:
@@ -61,35 +95,66 @@ class TestMsgPackSerializer:
     @pytest.mark.unit
     def test_loads_none_value(self) -> None:
         serializer: MsgPackSerializer = MsgPackSerializer()
-        result: t.Any = serializer.loads(None)  # type: ignore
+        result: t.Any = serializer.loads(None)
         assert result is None
 
-    @pytest.mark.unit
-    def test_loads_no_decompressed_data(self) -> None:
-        """Test handling when decompress.brotli returns empty data."""
-        serializer: MsgPackSerializer = MsgPackSerializer()
-        test_data: str = "compressed_data"
 
-        with patch("acb.adapters.cache._base.decompress.brotli") as mock_decompress:
-            mock_decompress.return_value = b""  # Empty data
+def _legacy_dumps(value: t.Any) -> str:
+    return brotli.compress(msgpack.encode(value), quality=3).decode("latin-1")
 
-            result: t.Any = serializer.loads(test_data)
-            assert result is None
 
-    @pytest.mark.unit
-    def test_integration(self) -> None:
-        serializer: MsgPackSerializer = MsgPackSerializer()
-        test_data: dict[str, t.Any] = {
-            "string": "test",
-            "number": 42,
-            "list": [1, 2, 3],
-            "nested": {"key": "value"},
-        }
-        serialized: str = serializer.dumps(test_data)
-        # We can't easily test deserialization without the actual compression/decompression
-        # but we can at least verify it's a string
-        assert isinstance(serialized, str)
-        assert len(serialized) > 0
+def _legacy_loads(value: str) -> t.Any:
+    return msgpack.decode(
+        brotli.decompress(value.encode("latin-1")).decode("latin-1").encode("latin-1"),
+    )
+
+
+class TestMsgPackSerializerBenchmarks:
+    PAYLOADS: t.ClassVar[dict[str, t.Any]] = {
+        "small": {"id": 1, "name": "user", "active": True},
+        "large": [
+            {"id": i, "name": f"user-{i}", "tags": ["a", "b"]} for i in range(2000)
+        ],
+    }
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("size", ["small", "large"])
+    @pytest.mark.parametrize("codec", ["none", "brotli"])
+    def test_encode_throughput(
+        self,
+        benchmark: BenchmarkFixture,
+        size: str,
+        codec: str,
+    ) -> None:
+        serializer = MsgPackSerializer(codec=codec)  # type: ignore[arg-type]
+        result = benchmark(serializer.dumps, self.PAYLOADS[size])
+        assert isinstance(result, bytes)
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("size", ["small", "large"])
+    @pytest.mark.parametrize("codec", ["none", "brotli"])
+    def test_decode_throughput(
+        self,
+        benchmark: BenchmarkFixture,
+        size: str,
+        codec: str,
+    ) -> None:
+        serializer = MsgPackSerializer(codec=codec)  # type: ignore[arg-type]
+        encoded = serializer.dumps(self.PAYLOADS[size])
+        result = benchmark(serializer.loads, encoded)
+        assert result == self.PAYLOADS[size]
+
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("size", ["small", "large"])
+    def test_legacy_roundtrip_throughput(
+        self,
+        benchmark: BenchmarkFixture,
+        size: str,
+    ) -> None:
+        """Baseline: brotli on every payload plus latin-1 string round trips."""
+        payload = self.PAYLOADS[size]
+        result = benchmark(lambda: _legacy_loads(_legacy_dumps(payload)))
+        assert result == payload
 
 
 class TestCacheBaseSettings:
@@ -366,6 +366,40 @@ class TestMemoryCache:
                 call_kwargs = mock_smc.call_args[1]
                 assert call_kwargs["namespace"] == f"{app_name}:"
 
+    @pytest.mark.asyncio
+    async def test_delete_pattern(
+        self,
+        mock_config: MagicMock,
+        mock_logger: MagicMock,
+    ) -> None:
+        adapter = Cache()
+        adapter.config = mock_config
+        adapter.logger = mock_logger
+
+        for key in ("repo:entity:user:1", "repo:entity:user:2", "repo:query:user:x"):
+            await adapter.set(key, "value")
+
+        assert await adapter.delete_pattern("repo:entity:user:*") == 2
+        assert await adapter.get("repo:entity:user:1") is None
+        assert await adapter.get("repo:query:user:x") == "value"
+
+    @pytest.mark.asyncio
+    async def test_many_operations(
+        self,
+        mock_config: MagicMock,
+        mock_logger: MagicMock,
+    ) -> None:
+        adapter = Cache()
+        adapter.config = mock_config
+        adapter.logger = mock_logger
+
+        await adapter.set_many({"a": 1, "b": {"x": 2}}, ttl=60)
+
+        assert await adapter.get_many(["a", "missing", "b"]) == [1, None, {"x": 2}]
+        assert await adapter.delete_many(["a", "missing"]) == 1
+        assert await adapter.get("a") is None
+        assert await adapter.get("b") == {"x": 2}
+
     @pytest.mark.asyncio
     async def test_cleanup_resources_with_multi_tier_cache(
         self,
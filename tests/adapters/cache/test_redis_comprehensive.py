@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import typing as t
+from contextlib import asynccontextmanager
 from pydantic import SecretStr
 
 from acb.adapters.cache.redis import Cache, CacheSettings
@@ -23,6 +24,25 @@ class MockRedisClient:
         self.get = AsyncMock()
         self.set = AsyncMock()
         self.delete = AsyncMock()
+        self.mget = AsyncMock()
+        self.pipelined: list[tuple[str, t.Any, int | None]] = []
+        self.scan_keys: list[str] = []
+        self.scan_calls: list[dict[str, t.Any]] = []
+
+    async def scan_iter(
+        self, match: str | None = None, count: int | None = None
+    ) -> t.AsyncIterator[str]:
+        self.scan_calls.append({"match": match, "count": count})
+        for key in self.scan_keys:
+            yield key
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> t.AsyncIterator[t.Any]:
+        pipe = MagicMock()
+        pipe.set.side_effect = lambda key, value, ex=None: self.pipelined.append(
+            (key, value, ex)
+        )
+        yield pipe
 
     @classmethod
     def from_url(cls, *args: t.Any, **kwargs: t.Any) -> "MockRedisClient":
@@ -184,6 +204,8 @@ class TestRedisCache:
         mock_cache.max_connections = 20
         mock_cache.health_check_interval = 30
         mock_cache.retry_on_timeout = True
+        mock_cache.scan_batch_size = 1000
+        mock_cache.unlink_rate_limit = None
         mock_config.cache = mock_cache
 
         return mock_config
@@ -444,39 +466,109 @@ class TestRedisCache:
     async def test_clear_without_namespace(self, redis_cache):
         """Test clear method without namespace."""
         mock_client = MockRedisClient()
-        mock_client.keys.return_value = ["testapp:key1", "testapp:key2"]
+        mock_client.scan_keys = ["testapp:key1", "testapp:key2"]
+        mock_client.unlink.return_value = 2
 
         with patch.object(redis_cache, "get_client", return_value=mock_client):
             result = await redis_cache._clear()
 
-            mock_client.keys.assert_called_once_with("testapp:*")
-            assert mock_client.unlink.call_count == 2
+            assert mock_client.scan_calls == [{"match": "testapp:*", "count": 1000}]
+            mock_client.unlink.assert_called_once_with(
+                ("testapp:key1", "testapp:key2"),
+            )
             assert result is True
 
     async def test_clear_with_namespace(self, redis_cache):
         """Test clear method with namespace."""
         mock_client = MockRedisClient()
-        mock_client.keys.return_value = ["testapp:users:key1"]
+        mock_client.scan_keys = ["testapp:users:key1"]
 
         with patch.object(redis_cache, "get_client", return_value=mock_client):
             result = await redis_cache._clear(namespace="users")
 
-            mock_client.keys.assert_called_once_with("testapp:users:*")
+            assert mock_client.scan_calls[0]["match"] == "testapp:users:*"
             mock_client.unlink.assert_called_once_with(("testapp:users:key1",))
             assert result is True
 
     async def test_clear_no_keys(self, redis_cache):
         """Test clear method when no keys match."""
         mock_client = MockRedisClient()
-        mock_client.keys.return_value = []
 
         with patch.object(redis_cache, "get_client", return_value=mock_client):
             result = await redis_cache._clear()
 
-            mock_client.keys.assert_called_once_with("testapp:*")
+            assert mock_client.scan_calls[0]["match"] == "testapp:*"
             mock_client.unlink.assert_not_called()
             assert result is True
 
+    async def test_delete_pattern_unlinks_in_batches(self, redis_cache):
+        """Test pattern deletion issues one UNLINK per SCAN batch."""
+        mock_client = MockRedisClient()
+        mock_client.scan_keys = [f"repo:entity:{i}" for i in range(5)]
+        mock_client.unlink.side_effect = lambda keys: len(keys)
+
+        with patch.object(redis_cache, "get_client", return_value=mock_client):
+            deleted = await redis_cache.delete_pattern("repo:entity:*", batch_size=2)
+
+        assert deleted == 5
+        assert mock_client.scan_calls == [{"match": "repo:entity:*", "count": 2}]
+        assert [call.args[0] for call in mock_client.unlink.call_args_list] == [
+            ("repo:entity:0", "repo:entity:1"),
+            ("repo:entity:2", "repo:entity:3"),
+            ("repo:entity:4",),
+        ]
+
+    async def test_delete_pattern_rate_limit(self, redis_cache):
+        """Test pattern deletion waits between batches to honour the rate limit."""
+        mock_client = MockRedisClient()
+        mock_client.scan_keys = [f"key{i}" for i in range(6)]
+        mock_client.unlink.side_effect = lambda keys: len(keys)
+
+        with (
+            patch.object(redis_cache, "get_client", return_value=mock_client),
+            patch(
+                "acb.adapters.cache.redis.asyncio.sleep", new_callable=AsyncMock
+            ) as mock_sleep,
+        ):
+            deleted = await redis_cache.delete_pattern(
+                "key*", batch_size=2, rate_limit=2.0
+            )
+
+        assert deleted == 6
+        assert mock_sleep.await_count == 2
+        assert all(0 < call.args[0] <= 2.0 for call in mock_sleep.await_args_list)
+
+    async def test_get_many_uses_mget(self, redis_cache):
+        """Test get_many fetches every key with a single MGET."""
+        mock_client = MockRedisClient()
+        mock_client.mget.return_value = [b"1", None]
+
+        with patch.object(redis_cache, "get_client", return_value=mock_client):
+            assert await redis_cache.get_many(["a", "b"]) == [b"1", None]
+            assert await redis_cache.get_many([]) == []
+
+        mock_client.mget.assert_awaited_once_with(["a", "b"])
+
+    async def test_set_many_pipelines_writes(self, redis_cache):
+        """Test set_many sends all writes through one pipeline."""
+        mock_client = MockRedisClient()
+
+        with patch.object(redis_cache, "get_client", return_value=mock_client):
+            await redis_cache.set_many({"a": b"1", "b": b"2"}, ttl=30)
+
+        assert mock_client.pipelined == [("a", b"1", 30), ("b", b"2", 30)]
+        mock_client.set.assert_not_called()
+
+    async def test_delete_many_single_command(self, redis_cache):
+        """Test delete_many removes all keys with one DEL."""
+        mock_client = MockRedisClient()
+        mock_client.delete.return_value = 2
+
+        with patch.object(redis_cache, "get_client", return_value=mock_client):
+            assert await redis_cache.delete_many(["a", "b", "c"]) == 2
+
+        mock_client.delete.assert_awaited_once_with(["a", "b", "c"])
+
     async def test_exists_true(self, redis_cache):
         """Test exists method when key exists."""
         mock_client = MockRedisClient()
@@ -766,10 +858,12 @@ class TestRedisCache:
             assert exists is False
 
             # Test clear operation
-            mock_client.keys.return_value = ["testapp:key1", "testapp:key2"]
+            mock_client.scan_keys = ["testapp:key1", "testapp:key2"]
             await redis_cache._clear()
-            mock_client.keys.assert_called_with("testapp:*")
-            assert mock_client.unlink.call_count == 2
+            assert mock_client.scan_calls[-1]["match"] == "testapp:*"
+            mock_client.unlink.assert_called_once_with(
+                ("testapp:key1", "testapp:key2"),
+            )
 
             # Test close
             # Set the _client attribute to the mock client so _close can access it
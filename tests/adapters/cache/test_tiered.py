@@ -0,0 +1,279 @@
+"""Tests for the tiered (L1 memory + L2 Redis) cache adapter."""
+
+import time
+from fnmatch import fnmatchcase
+from unittest.mock import MagicMock
+
+import asyncio
+import pytest
+import typing as t
+from contextlib import asynccontextmanager
+
+from acb.adapters.cache.tiered import Cache
+
+
+class FakeRedisServer:
+    """In-memory stand-in for a Redis server shared by several clients."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.subscribers: list[asyncio.Queue[dict[str, t.Any]]] = []
+
+
+class FakeRedisClient:
+    def __init__(self, server: FakeRedisServer) -> None:
+        self.server = server
+        self.get_calls = 0
+
+    async def get(self, key: str) -> bytes | None:
+        self.get_calls += 1
+        return self.server.data.get(key)
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        ex: int | None = None,
+        condition: t.Any = None,
+    ) -> bool:
+        if condition is not None and key in self.server.data:
+            return False
+        self.server.data[key] = value
+        return True
+
+    async def incrby(self, key: str, increment: int) -> int:
+        value = int(self.server.data.get(key, b"0")) + increment
+        self.server.data[key] = str(value).encode()
+        return value
+
+    async def expire(self, key: str, seconds: int) -> bool:
+        return key in self.server.data
+
+    async def persist(self, key: str) -> bool:
+        return key in self.server.data
+
+    async def mget(self, keys: list[str]) -> list[bytes | None]:
+        self.get_calls += 1
+        return [self.server.data.get(key) for key in keys]
+
+    @asynccontextmanager
+    async def pipeline(self, transaction: bool = True) -> t.AsyncIterator[t.Any]:
+        pipe = MagicMock()
+        pipe.set.side_effect = lambda key, value, ex=None: self.server.data.__setitem__(
+            key, value
+        )
+        yield pipe
+
+    async def delete(self, keys: list[str]) -> int:
+        return sum(self.server.data.pop(key, None) is not None for key in keys)
+
+    async def scan_iter(
+        self, match: str | None = None, count: int | None = None
+    ) -> t.AsyncIterator[str]:
+        for key in list(self.server.data):
+            if fnmatchcase(key, match or "*"):
+                yield key
+
+    async def unlink(self, keys: tuple[str, ...]) -> int:
+        return await self.delete(list(keys))
+
+    async def close(self) -> None:
+        pass
+
+    async def publish(self, channel: str, message: bytes) -> int:
+        for queue in self.server.subscribers:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+        return len(self.server.subscribers)
+
+    @asynccontextmanager
+    async def pubsub(self, **kwargs: t.Any) -> t.AsyncIterator[t.Any]:
+        queue: asyncio.Queue[dict[str, t.Any]] = asyncio.Queue()
+        self.server.subscribers.append(queue)
+
+        async def messages() -> t.AsyncIterator[dict[str, t.Any]]:
+            while True:
+                yield await queue.get()
+
+        try:
+            yield messages()
+        finally:
+            self.server.subscribers.remove(queue)
+
+
+def _make_cache(server: FakeRedisServer, **settings: t.Any) -> Cache:
+    cache = Cache()
+    config = MagicMock()
+    config.app.name = "testapp"
+    config.cache.l1_max_entries = settings.get("l1_max_entries", 100)
+    config.cache.l1_ttl = settings.get("l1_ttl", 60)
+    config.cache.invalidation_channel = None
+    config.cache.scan_batch_size = 100
+    config.cache.unlink_rate_limit = None
+    config.cache.ssl_enabled = False
+    cache.config = config
+    cache.logger = MagicMock()
+    cache._client = FakeRedisClient(server)
+    return cache
+
+
+async def _start_listener(cache: Cache, server: FakeRedisServer) -> None:
+    subscribers = len(server.subscribers)
+    cache._invalidation_task = asyncio.create_task(cache._listen_for_invalidations())
+    while len(server.subscribers) == subscribers:
+        await asyncio.sleep(0)
+
+
+async def _drain() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+class TestTieredCache:
+    @pytest.mark.asyncio
+    async def test_hot_reads_are_served_from_l1(self) -> None:
+        server = FakeRedisServer()
+        cache = _make_cache(server)
+
+        assert await cache.get("user:1") is None
+        await cache.set("user:1", {"name": "ann"}, ttl=300)
+        cache._l1.clear()
+
+        assert await cache.get("user:1") == {"name": "ann"}
+        for _ in range(3):
+            assert await cache.get("user:1") == {"name": "ann"}
+
+        assert cache._client.get_calls == 2
+        stats = cache.get_tier_stats()
+        assert stats["l1_hits"] == 3 and stats["l2_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["l1_hit_ratio"] == 0.6
+        assert stats["l2_hit_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_l1_is_bounded_and_ttl_capped(self) -> None:
+        cache = _make_cache(FakeRedisServer(), l1_max_entries=2, l1_ttl=60)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        assert list(cache._l1) == ["a", "c"]
+
+        await cache.set("short", 4, ttl=1)
+        _, expires_at = cache._l1["short"]
+        assert expires_at - time.monotonic() <= 1
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_other_workers(self) -> None:
+        server = FakeRedisServer()
+        worker_a = _make_cache(server)
+        worker_b = _make_cache(server)
+        await _start_listener(worker_a, server)
+        await _start_listener(worker_b, server)
+        try:
+            await worker_a.set("user:1", "v1")
+            assert await worker_b.get("user:1") == "v1"
+            assert "user:1" in worker_b._l1
+
+            await worker_a.set("user:1", "v2")
+            await _drain()
+            assert "user:1" not in worker_b._l1
+            assert "user:1" in worker_a._l1
+            assert await worker_b.get("user:1") == "v2"
+
+            await worker_b.delete_pattern("user:*")
+            await _drain()
+            assert not worker_a._l1
+            assert await worker_a.get("user:1") is None
+            assert worker_a.get_tier_stats()["invalidations_received"] == 1
+        finally:
+            await worker_a._close()
+            await worker_b._close()
+
+    @pytest.mark.asyncio
+    async def test_ignores_own_and_malformed_messages(self) -> None:
+        cache = _make_cache(FakeRedisServer())
+        await cache.set("k", "v")
+
+        cache._handle_invalidation(b"not json")
+        cache._handle_invalidation(b"[1, 2]")
+        cache._handle_invalidation(
+            b'{"origin": "%s", "kind": "key", "target": "k"}'
+            % cache._instance_id.encode(),
+        )
+
+        assert "k" in cache._l1
+        assert cache.get_tier_stats()["invalidations_received"] == 0
+
+    @pytest.mark.asyncio
+    async def test_many_operations_share_tiers(self) -> None:
+        server = FakeRedisServer()
+        worker_a = _make_cache(server)
+        worker_b = _make_cache(server)
+        await _start_listener(worker_b, server)
+        try:
+            await worker_a.set_many({"a": 1, "b": 2})
+            await worker_b.get("a")
+            worker_b._client.get_calls = 0
+
+            assert await worker_b.get_many(["a", "b", "c"]) == [1, 2, None]
+            assert worker_b._client.get_calls == 1
+            assert set(worker_b._l1) == {"a", "b"}
+            stats = worker_b.get_tier_stats()
+            assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (1, 2, 1)
+
+            await worker_a.delete_many(["a", "b"])
+            await _drain()
+            assert not worker_b._l1
+            assert await worker_b.get_many(["a", "b"]) == [None, None]
+        finally:
+            await worker_b._close()
+
+    @pytest.mark.asyncio
+    async def test_mutations_invalidate_every_l1(self) -> None:
+        server = FakeRedisServer()
+        worker_a = _make_cache(server)
+        worker_b = _make_cache(server)
+        await _start_listener(worker_b, server)
+        try:
+            assert await worker_a.increment("hits") == 1
+            assert await worker_b.get("hits") == 1
+            assert await worker_a.get("hits") == 1
+
+            assert await worker_a.increment("hits", 4) == 5
+            await _drain()
+            assert await worker_a.get("hits") == 5
+            assert await worker_b.get("hits") == 5
+
+            assert await worker_a.add("token", "t1", ttl=30)
+            with pytest.raises(ValueError):
+                await worker_a.add("token", "t2")
+            assert await worker_b.get("token") == "t1"
+
+            assert await worker_a.expire("token", 5)
+            await _drain()
+            assert "token" not in worker_a._l1
+            assert "token" not in worker_b._l1
+        finally:
+            await worker_b._close()
+
+    @pytest.mark.asyncio
+    async def test_namespace_is_part_of_the_key(self) -> None:
+        server = FakeRedisServer()
+        worker_a = _make_cache(server)
+        worker_b = _make_cache(server)
+        await _start_listener(worker_b, server)
+        try:
+            await worker_a.set("k", "a", namespace="a:")
+            await worker_a.set("k", "b", namespace="b:")
+            assert await worker_b.get("k", namespace="a:") == "a"
+            assert await worker_b.get("k", namespace="b:") == "b"
+            assert await worker_b.get("k") is None
+            assert set(server.data) == {"a:k", "b:k"}
+
+            await worker_a.delete("k", namespace="a:")
+            await _drain()
+            assert "a:k" not in worker_b._l1
+            assert await worker_b.get("k", namespace="b:") == "b"
+        finally:
+            await worker_b._close()
@@ -0,0 +1,259 @@
+"""Tests for batched sends and delayed promotion in the Redis messaging adapter."""
+
+import time
+from unittest.mock import MagicMock
+
+import asyncio
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from acb.adapters.messaging._base import MessagePriority, QueueMessage
+from acb.adapters.messaging.redis import RedisMessaging, RedisMessagingSettings
+
+
+def _messaging(server: FakeServer, use_lua_scripts: bool = False) -> RedisMessaging:
+    """Create a connected messaging backend on fakeredis, without background tasks."""
+    messaging = RedisMessaging(
+        RedisMessagingSettings(use_lua_scripts=use_lua_scripts),
+    )
+    messaging._client = FakeRedis(server=server)
+    messaging._logger = MagicMock()
+    messaging._connected = True
+    return messaging
+
+
+async def _queued(messaging: RedisMessaging, topic: str) -> list[QueueMessage]:
+    client = messaging._client
+    keys = await client.zrange(messaging._queue_key.format(topic=topic), 0, -1)
+    return [QueueMessage.model_validate_json(await client.get(key)) for key in keys]
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+class TestRedisMessagingBatch:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lua_scripts", [False, True])
+    async def test_enqueue_batch(self, server, use_lua_scripts):
+        if use_lua_scripts:
+            pytest.importorskip("lupa")
+        messaging = _messaging(server, use_lua_scripts)
+        if use_lua_scripts:
+            await messaging._load_lua_scripts()
+            assert "enqueue_batch" in messaging._lua_scripts
+
+        ids = await messaging.enqueue_batch(
+            "jobs",
+            [
+                (b"low", MessagePriority.LOW, None),
+                (b"high", MessagePriority.HIGH, {"k": "v"}),
+                (b"normal-1", MessagePriority.NORMAL, None),
+                (b"normal-2", MessagePriority.NORMAL, None),
+                (b"normal-3", MessagePriority.NORMAL, None),
+            ],
+        )
+
+        queued = await _queued(messaging, "jobs")
+        assert sorted(str(m.message_id) for m in queued) == sorted(ids)
+        assert [m.payload for m in queued] == [
+            b"high",
+            b"normal-1",
+            b"normal-2",
+            b"normal-3",
+            b"low",
+        ]
+        assert queued[0].headers == {"k": "v"}
+
+        client = messaging._client
+        message_key = messaging._message_key.format(message_id=ids[0])
+        assert 0 < await client.ttl(message_key) <= messaging._settings.message_ttl
+
+    @pytest.mark.asyncio
+    async def test_enqueue_batch_uses_one_round_trip(self, server):
+        messaging = _messaging(server)
+        client = messaging._client
+        calls = 0
+        real_pipeline = client.pipeline
+
+        def counting_pipeline(*args, **kwargs):
+            nonlocal calls
+            calls += 1
+            return real_pipeline(*args, **kwargs)
+
+        client.pipeline = counting_pipeline
+        await messaging.enqueue_batch(
+            "jobs",
+            [(b"x", MessagePriority.NORMAL, None) for _ in range(50)],
+        )
+
+        assert calls == 1
+        assert len(await _queued(messaging, "jobs")) == 50
+
+    @pytest.mark.asyncio
+    async def test_publish_batch_routes_by_topic(self, server):
+        messaging = _messaging(server)
+
+        await messaging.publish_batch(
+            [
+                ("a", b"1", None),
+                ("b", b"2", {"h": "1"}),
+                ("a", b"3", None),
+            ],
+        )
+
+        assert [m.payload for m in await _queued(messaging, "a")] == [b"1", b"3"]
+        b_messages = await _queued(messaging, "b")
+        assert [m.payload for m in b_messages] == [b"2"]
+        assert b_messages[0].headers == {"h": "1"}
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self, server):
+        messaging = _messaging(server)
+        assert await messaging.enqueue_batch("jobs", []) == []
+        await messaging.publish_batch([])
+
+
+class TestRedisMessagingBatchBenchmarks:
+    BATCH = [(b"payload", MessagePriority.NORMAL, None) for _ in range(500)]
+
+    @pytest.mark.benchmark(group="redis-enqueue")
+    def test_enqueue_one_by_one(self, server, benchmark: BenchmarkFixture):
+        messaging = _messaging(server)
+
+        async def enqueue_all() -> None:
+            for message, priority, headers in self.BATCH:
+                await messaging.enqueue("jobs", message, priority, 0.0, headers)
+
+        with asyncio.Runner() as runner:
+            benchmark(lambda: runner.run(enqueue_all()))
+
+    @pytest.mark.benchmark(group="redis-enqueue")
+    def test_enqueue_batch(self, server, benchmark: BenchmarkFixture):
+        messaging = _messaging(server)
+
+        with asyncio.Runner() as runner:
+            ids = benchmark(
+                lambda: runner.run(messaging.enqueue_batch("jobs", self.BATCH))
+            )
+
+        assert len(ids) == len(self.BATCH)
+
+
+class TestRedisMessagingDelayedPromotion:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lua_scripts", [False, True])
+    async def test_promotes_due_messages_in_one_pass(self, server, use_lua_scripts):
+        if use_lua_scripts:
+            pytest.importorskip("lupa")
+        messaging = _messaging(server, use_lua_scripts)
+        if use_lua_scripts:
+            await messaging._load_lua_scripts()
+            assert "promote_delayed" in messaging._lua_scripts
+
+        await messaging.enqueue("jobs", b"low", MessagePriority.LOW, delay_seconds=1)
+        await messaging.enqueue("jobs", b"high", MessagePriority.HIGH, delay_seconds=2)
+        later_id = await messaging.enqueue("other", b"later", delay_seconds=3600)
+        expired_id = await messaging.enqueue("jobs", b"gone", delay_seconds=1)
+        client = messaging._client
+        await client.delete(messaging._message_key.format(message_id=expired_id))
+
+        current_time = (time.time() + 10) * 1_000_000
+        processed, earliest = await messaging._process_delayed_batch(
+            client,
+            current_time,
+        )
+
+        assert processed == 3
+        assert [m.payload for m in await _queued(messaging, "jobs")] == [
+            b"low",
+            b"high",
+        ]
+        remaining = await client.zrange(messaging._delayed_key, 0, -1)
+        assert remaining == [
+            messaging._message_key.format(message_id=later_id).encode(),
+        ]
+        assert earliest is not None
+        assert earliest > current_time
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lua_scripts", [False, True])
+    async def test_keeps_due_time_order(self, server, use_lua_scripts):
+        if use_lua_scripts:
+            pytest.importorskip("lupa")
+        messaging = _messaging(server, use_lua_scripts)
+        if use_lua_scripts:
+            await messaging._load_lua_scripts()
+
+        for delay, payload in enumerate([b"first", b"second", b"third"], start=1):
+            await messaging.enqueue("jobs", payload, delay_seconds=delay)
+
+        await messaging._process_delayed_batch(
+            messaging._client,
+            (time.time() + 10) * 1_000_000,
+        )
+
+        assert [m.payload for m in await _queued(messaging, "jobs")] == [
+            b"first",
+            b"second",
+            b"third",
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("use_lua_scripts", [False, True])
+    async def test_drops_unreadable_messages(self, server, use_lua_scripts):
+        if use_lua_scripts:
+            pytest.importorskip("lupa")
+        messaging = _messaging(server, use_lua_scripts)
+        if use_lua_scripts:
+            await messaging._load_lua_scripts()
+
+        await messaging.enqueue("jobs", b"ok", delay_seconds=1)
+        bad_id = await messaging.enqueue("jobs", b"bad", delay_seconds=1)
+        client = messaging._client
+        await client.set(messaging._message_key.format(message_id=bad_id), b"{}")
+
+        processed, earliest = await messaging._process_delayed_batch(
+            client,
+            (time.time() + 10) * 1_000_000,
+        )
+
+        assert processed == 2
+        assert earliest is None
+        assert [m.payload for m in await _queued(messaging, "jobs")] == [b"ok"]
+        assert await client.zcard(messaging._delayed_key) == 0
+        messaging._logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_delayed_set(self, server):
+        messaging = _messaging(server)
+        assert await messaging._process_delayed_batch(
+            messaging._client,
+            time.time() * 1_000_000,
+        ) == (0, None)
+
+    def test_sleep_follows_earliest_score(self, server):
+        messaging = _messaging(server)
+        interval = messaging._settings.delayed_poll_interval
+
+        assert messaging._delayed_sleep(0, None) == interval
+        assert messaging._delayed_sleep(messaging._settings.batch_size, None) == 0.0
+        soon = (time.time() + interval / 4) * 1_000_000
+        assert 0.0 < messaging._delayed_sleep(0, soon) <= interval / 4
+        assert messaging._delayed_sleep(0, (time.time() - 5) * 1_000_000) == 0.0
+        far = (time.time() + 3600) * 1_000_000
+        assert messaging._delayed_sleep(0, far) == interval
+
+    @pytest.mark.asyncio
+    async def test_delayed_enqueue_wakes_promoter(self, server):
+        messaging = _messaging(server)
+        assert not messaging._delayed_wakeup.is_set()
+
+        await messaging.enqueue("jobs", b"now")
+        assert not messaging._delayed_wakeup.is_set()
+
+        await messaging.enqueue("jobs", b"later", delay_seconds=0.5)
+        assert messaging._delayed_wakeup.is_set()
@@ -1,12 +1,14 @@
 """Tests for the SQL base adapter."""
 
+import weakref
+from contextvars import ContextVar
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from contextlib import asynccontextmanager
 from sqlalchemy.ext.asyncio import AsyncConnection
 
-from acb.adapters.sql._base import SqlBase
+from acb.adapters.sql._base import SqlBase, SqlPoolMetrics
 
 
 class MockSqlBase(SqlBase):
@@ -20,6 +22,12 @@ class MockSqlBase(SqlBase):
         # Add the missing _resource_cache attribute
         self._resource_cache = MagicMock()
         self._resource_cache.clear = MagicMock()
+        # Session-scope and pool-metrics state normally set by SqlBase.__init__
+        self._task_session = ContextVar("test_sql_session", default=None)
+        self._task_sessions = weakref.WeakSet()
+        self._closing_sessions = set()
+        self._pool_metrics = SqlPoolMetrics()
+        self._pool_events_engine = None
 
     async def init(self) -> None:
         pass
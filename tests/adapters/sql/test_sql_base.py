@@ -1,12 +1,17 @@
 """Tests for the SQL Base adapter."""
 
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncio
 import pytest
+import typing as t
 from contextlib import asynccontextmanager
-from sqlalchemy.ext.asyncio import AsyncConnection
+from pytest_benchmark.fixture import BenchmarkFixture
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
 
-from acb.adapters.sql._base import SqlBase
+from acb.adapters.sql._base import SqlBase, SqlBaseSettings
 
 
 class MockSqlBase(SqlBase):
@@ -62,6 +67,143 @@ class TestSqlBase:
 
         sql_base.init = custom_init
 
-        import asyncio
-
         asyncio.run(sql_base.init())
+
+
+class TaskScopedSqlBase(SqlBase):
+    def __init__(self, database_url: str, pool_size: int = 5) -> None:
+        super().__init__()
+        self.config = MagicMock()
+        self.config.sql.session_scope = "task"
+        self.logger = MagicMock()
+        self._database_url = database_url
+        self._pool_size = pool_size
+
+    async def _create_client(self) -> AsyncEngine:
+        return create_async_engine(
+            self._database_url,
+            pool_size=self._pool_size,
+            max_overflow=0,
+        )
+
+
+async def _run_concurrent_queries(
+    sql: TaskScopedSqlBase,
+    concurrency: int,
+    queries_per_task: int,
+) -> int:
+    async def worker() -> int:
+        done = 0
+        async with sql.get_session() as session:
+            for _ in range(queries_per_task):
+                result = await session.execute(text("SELECT 1"))
+                done += result.scalar_one()
+                await session.commit()
+        return done
+
+    results = await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return sum(results)
+
+
+class TestSqlBaseTaskScopedSessions:
+    @pytest.fixture
+    def sql(self, tmp_path: Path) -> TaskScopedSqlBase:
+        return TaskScopedSqlBase(f"sqlite+aiosqlite:///{tmp_path / 'tasks.db'}")
+
+    @pytest.mark.asyncio
+    async def test_each_task_gets_its_own_session(
+        self,
+        sql: TaskScopedSqlBase,
+    ) -> None:
+        parent = await sql._ensure_session()
+        assert await sql._ensure_session() is parent
+        assert sql.session is parent
+
+        async def child() -> t.Any:
+            return await sql._ensure_session()
+
+        first, second = await asyncio.gather(child(), child())
+        assert first is not parent
+        assert second is not parent
+        assert first is not second
+        await sql._cleanup_resources()
+
+    @pytest.mark.asyncio
+    async def test_get_session_scopes_and_nests(self, sql: TaskScopedSqlBase) -> None:
+        async with sql.get_session() as outer:
+            async with sql.get_session() as inner:
+                assert inner is outer
+            assert sql.session is outer
+        with pytest.raises(RuntimeError):
+            _ = sql.session
+        await sql._cleanup_resources()
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics_track_checkouts(self, sql: TaskScopedSqlBase) -> None:
+        assert await _run_concurrent_queries(sql, 4, 3) == 12
+        stats = sql.get_pool_metrics()
+        assert stats["session_scope"] == "task"
+        assert stats["sessions_created"] == 4
+        assert stats["checkouts"] >= 4
+        assert stats["checked_out"] == 0
+        assert 1 <= stats["peak_checked_out"] <= 5
+        assert stats["pool_class"] == "AsyncAdaptedQueuePool"
+        await sql._cleanup_resources()
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_runs_executemany_on_one_connection(
+        self,
+        sql: TaskScopedSqlBase,
+    ) -> None:
+        await sql.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        results = await sql.execute_batch(
+            [
+                (
+                    "INSERT INTO items (name) VALUES (:name)",
+                    [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+                ),
+                ("SELECT COUNT(*) FROM items", None),
+            ],
+        )
+        assert results[0].rowcount == 3
+        assert results[1].scalar_one() == 3
+        assert sql.get_pool_metrics()["checkouts"] == 2
+        await sql._cleanup_resources()
+
+    def test_pool_settings_skip_null_pool(self) -> None:
+        from sqlalchemy.pool import NullPool
+
+        settings = MagicMock(poolclass=NullPool, pool_size=5)
+        assert SqlBaseSettings._build_pool_params(settings) == {}
+        settings = MagicMock(
+            poolclass=None,
+            pool_size=10,
+            max_overflow=5,
+            pool_recycle=None,
+        )
+        assert SqlBaseSettings._build_pool_params(settings) == {
+            "pool_size": 10,
+            "max_overflow": 5,
+        }
+
+
+class TestSqlBaseSessionBenchmarks:
+    @pytest.mark.benchmark
+    @pytest.mark.parametrize("concurrency", [1, 4, 16])
+    def test_task_scoped_session_throughput(
+        self,
+        benchmark: BenchmarkFixture,
+        tmp_path: Path,
+        concurrency: int,
+    ) -> None:
+        database_url = f"sqlite+aiosqlite:///{tmp_path / 'bench.db'}"
+
+        async def run() -> int:
+            sql = TaskScopedSqlBase(database_url, pool_size=concurrency)
+            try:
+                return await _run_concurrent_queries(sql, concurrency, 20)
+            finally:
+                await sql._cleanup_resources()
+
+        result = benchmark(lambda: asyncio.run(run()))
+        assert result == concurrency * 20
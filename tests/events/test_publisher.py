@@ -1,7 +1,10 @@
 """Tests for EventPublisher functionality."""
 
+from unittest.mock import AsyncMock, MagicMock
+
 import asyncio
 import pytest
+from msgspec import msgpack
 
 from acb.events import (
     Event,
@@ -196,6 +199,69 @@ class TestEventPublisher:
         assert publisher.metrics.events_published == 1
         assert publisher.metrics.events_processed >= 1
 
+    async def test_publish_batch_groups_by_topic(self, mock_queue_adapter_import):
+        """publish_batch hands all events to the backend in one call."""
+        publisher = EventPublisher(EventPublisherSettings())
+        backend = MagicMock(spec=["publish", "publish_batch"])
+        backend.publish = AsyncMock()
+        backend.publish_batch = AsyncMock()
+        publisher._pubsub = backend
+        events = [
+            create_event("user.created", "svc", {"n": 1}),
+            create_event("order.created", "svc", {"n": 2}),
+            create_event("user.created", "svc", {"n": 3}, headers={"h": "v"}),
+        ]
+
+        await publisher.publish_batch(events)
+        await publisher.publish_batch([])
+
+        backend.publish.assert_not_awaited()
+        backend.publish_batch.assert_awaited_once()
+        (messages,) = backend.publish_batch.await_args.args
+        assert [topic for topic, _, _ in messages] == [
+            "events.user.created",
+            "events.user.created",
+            "events.order.created",
+        ]
+        assert messages[1][2] == {
+            "h": "v",
+            "correlation_id": str(events[2].metadata.event_id),
+        }
+        decoded = Event.model_validate(msgpack.decode(messages[2][1]))
+        assert decoded.metadata.event_id == events[1].metadata.event_id
+        assert decoded.payload == {"n": 2}
+        assert decoded.metadata.timeout == publisher._settings.default_timeout
+        assert publisher.metrics.events_published == 3
+
+    async def test_publish_batch_without_backend_batching(
+        self, mock_queue_adapter_import
+    ):
+        """Backends without publish_batch get one publish per event."""
+        publisher = EventPublisher(EventPublisherSettings())
+        backend = MagicMock(spec=["publish"])
+        backend.publish = AsyncMock()
+        publisher._pubsub = backend
+        events = [create_event("test.event", "svc", {"n": i}) for i in range(3)]
+
+        await publisher.publish_batch(events)
+
+        assert [
+            call.kwargs["correlation_id"] for call in backend.publish.await_args_list
+        ] == [str(e.metadata.event_id) for e in events]
+        assert publisher.metrics.events_published == 3
+
+    async def test_publish_batch_delivers_locally(self, publisher, mock_handler):
+        """Batched events reach local subscribers like single publishes."""
+        await publisher.subscribe(
+            EventSubscription(handler=mock_handler, event_type="test.event"),
+        )
+        events = [create_event("test.event", "svc", {"n": i}) for i in range(3)]
+
+        await publisher.publish_batch(events)
+        await asyncio.sleep(0.1)
+
+        assert sorted(e.payload["n"] for e in mock_handler.handled_events) == [0, 1, 2]
+
     async def test_publish_event_no_subscribers(self, publisher):
         """Test publishing event with no subscribers."""
         event = create_event("test.event", "test_service")
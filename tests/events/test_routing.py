@@ -0,0 +1,172 @@
+"""Tests for the compiled subscription routing index."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from acb.events import (
+    Event,
+    EventFilter,
+    EventHandler,
+    EventHandlerResult,
+    EventPriority,
+    EventRouter,
+    EventSubscription,
+    ManagedSubscription,
+    create_event,
+)
+from acb.events._routing import compile_patterns, matches_any
+
+
+class NoopHandler(EventHandler):
+    def can_handle(self, event: Event) -> bool:
+        return True
+
+    async def handle(self, event: Event) -> EventHandlerResult:
+        return EventHandlerResult(success=True)
+
+
+def _managed(
+    event_type: str | None = None,
+    event_filter: EventFilter | None = None,
+) -> ManagedSubscription:
+    return ManagedSubscription(
+        subscription=EventSubscription(handler=NoopHandler(), event_type=event_type),
+        filter=event_filter,
+    )
+
+
+class TestCompilePatterns:
+    def test_patterns_are_joined_into_one_alternation(self):
+        compiled = compile_patterns(("user\\.", "order\\.created"))
+
+        assert len(compiled) == 1
+        assert compile_patterns(("user\\.", "order\\.created")) is compiled
+        assert matches_any(compiled, "user.deleted")
+        assert matches_any(compiled, "order.created")
+        assert not matches_any(compiled, "order.updated")
+        assert not matches_any(compiled, "admin.user.created")
+
+    def test_patterns_with_groups_or_flags_stay_separate(self):
+        grouped = compile_patterns(("(a)\\1", "b"))
+        assert len(grouped) == 2
+        assert matches_any(grouped, "aa") and matches_any(grouped, "b")
+
+        flagged = compile_patterns(("x", "(?i)user"))
+        assert len(flagged) == 2
+        assert matches_any(flagged, "USER.created")
+
+
+class TestEventRouterIndex:
+    def test_routes_by_type_filter_and_wildcard(self):
+        router = EventRouter()
+        wildcard = _managed()
+        by_pattern = _managed(
+            event_filter=EventFilter(event_type_patterns=["user\\."]),
+        )
+        by_type = _managed("user.created")
+        other_type = _managed("order.created")
+        urgent = _managed(
+            event_filter=EventFilter(event_types=["user.created"], min_priority="high"),
+        )
+        keyed = _managed(event_filter=EventFilter(routing_keys=["eu"]))
+        for managed in (wildcard, by_pattern, by_type, other_type, urgent, keyed):
+            router.add_subscription(managed)
+
+        event = create_event("user.created", "svc")
+        assert router.find_matching_subscriptions(event) == [
+            by_type,
+            by_pattern,
+            wildcard,
+        ]
+
+        event = create_event(
+            "user.created",
+            "svc",
+            priority=EventPriority.CRITICAL,
+            routing_key="eu",
+        )
+        assert router.find_matching_subscriptions(event) == [
+            by_type,
+            by_pattern,
+            urgent,
+            keyed,
+            wildcard,
+        ]
+
+        event = create_event("order.created", "svc", routing_key="us")
+        assert router.find_matching_subscriptions(event) == [other_type, wildcard]
+
+    def test_remove_and_reuse_slots(self):
+        router = EventRouter()
+        first = _managed(event_filter=EventFilter(event_type_patterns=["user\\."]))
+        router.add_subscription(first)
+        event = create_event("user.created", "svc")
+        assert router.find_matching_subscriptions(event) == [first]
+
+        assert router.remove_subscription(first.subscription.subscription_id)
+        assert not router.remove_subscription(first.subscription.subscription_id)
+        assert router.find_matching_subscriptions(event) == []
+
+        # The freed slot is reused without leaking the old pattern match
+        replacement = _managed("order.created")
+        router.add_subscription(replacement)
+        assert router.find_matching_subscriptions(event) == []
+        late = _managed(event_filter=EventFilter(event_type_patterns=["user"]))
+        router.add_subscription(late)
+        assert router.find_matching_subscriptions(event) == [late]
+
+    def test_candidates_still_get_full_match_check(self):
+        router = EventRouter()
+        paused = _managed("user.created")
+        paused.paused = True
+        from_other_source = _managed(
+            event_filter=EventFilter(event_types=["user.created"], sources=["billing"]),
+        )
+        router.add_subscription(paused)
+        router.add_subscription(from_other_source)
+
+        event = create_event("user.created", "svc")
+        assert router.find_matching_subscriptions(event) == []
+
+
+class TestRoutingBenchmarks:
+    @pytest.mark.benchmark
+    def test_route_events_with_10k_subscriptions(self, benchmark: BenchmarkFixture):
+        """Routing cost depends on the matches, not the subscription count."""
+        router = EventRouter()
+        for i in range(10_000):
+            match i % 4:
+                case 0:
+                    managed = _managed(f"type.{i}")
+                case 1:
+                    managed = _managed(
+                        event_filter=EventFilter(
+                            event_type_patterns=[f"pattern\\.{i}\\b"],
+                        ),
+                    )
+                case 2:
+                    managed = _managed(
+                        event_filter=EventFilter(routing_keys=[f"key{i}"]),
+                    )
+                case _:
+                    managed = _managed(
+                        event_filter=EventFilter(
+                            event_types=[f"filtered.{i}"],
+                            min_priority="critical",
+                        ),
+                    )
+            router.add_subscription(managed)
+
+        events = [
+            create_event(f"type.{i}", "svc", routing_key=f"key{i + 2}")
+            for i in range(0, 400, 4)
+        ]
+        for event in events:
+            router.find_matching_subscriptions(event)
+
+        def route_all() -> int:
+            return sum(
+                len(router.find_matching_subscriptions(event)) for event in events
+            )
+
+        assert benchmark(route_all) == 2 * len(events)
@@ -7,6 +7,7 @@ import pytest
 from datetime import datetime
 
 from acb.events import (
+    BufferOverflowPolicy,
     Event,
     EventBuffer,
     EventFilter,
@@ -195,6 +196,133 @@ class TestEventBuffer:
         assert buffer.is_empty
 
 
+class TestEventBufferBackpressure:
+    """Test EventBuffer overflow policies and batch draining."""
+
+    async def test_drop_oldest_counts_drops(self):
+        """Default policy evicts the oldest event and counts it."""
+        buffer = EventBuffer(max_size=2)
+        events = [create_event(f"event{i}", "service") for i in range(3)]
+        for event in events:
+            assert await buffer.put(event)
+
+        assert buffer.dropped_count == 1
+        assert await buffer.get_batch(10) == events[1:]
+
+    async def test_drop_newest_rejects_incoming(self):
+        """DROP_NEWEST keeps buffered events and rejects the new one."""
+        buffer = EventBuffer(
+            max_size=2, overflow_policy=BufferOverflowPolicy.DROP_NEWEST
+        )
+        events = [create_event(f"event{i}", "service") for i in range(3)]
+        results = [await buffer.put(event) for event in events]
+
+        assert results == [True, True, False]
+        assert buffer.dropped_count == 1
+        assert await buffer.get_batch(10) == events[:2]
+
+    async def test_block_waits_for_space(self):
+        """BLOCK suspends the producer until a consumer frees a slot."""
+        buffer = EventBuffer(
+            max_size=1,
+            overflow_policy=BufferOverflowPolicy.BLOCK,
+            put_timeout=1.0,
+        )
+        first = create_event("first", "service")
+        second = create_event("second", "service")
+        await buffer.put(first)
+
+        producer = asyncio.create_task(buffer.put(second))
+        await asyncio.sleep(0.01)
+        assert not producer.done()
+
+        assert await buffer.get_batch(1) == [first]
+        assert await producer
+        assert buffer.blocked_count == 1
+        assert await buffer.get_batch(1) == [second]
+
+    async def test_block_drops_after_put_timeout(self):
+        """BLOCK gives up after put_timeout and counts the drop."""
+        buffer = EventBuffer(
+            max_size=1,
+            overflow_policy=BufferOverflowPolicy.BLOCK,
+            put_timeout=0.01,
+        )
+        await buffer.put(create_event("first", "service"))
+
+        assert not await buffer.put(create_event("second", "service"))
+        assert buffer.blocked_count == 1
+        assert buffer.dropped_count == 1
+        assert buffer.size() == 1
+
+    async def test_spill_preserves_order(self, tmp_path):
+        """SPILL writes overflow to disk and reads it back in FIFO order."""
+        buffer = EventBuffer(
+            max_size=2,
+            overflow_policy=BufferOverflowPolicy.SPILL,
+            spill_dir=str(tmp_path),
+        )
+        events = [create_event(f"event{i}", "service", {"n": i}) for i in range(5)]
+        for event in events:
+            assert await buffer.put(event)
+
+        assert buffer.size() == 5
+        assert buffer.spilled_count == 3
+        assert buffer.dropped_count == 0
+
+        drained = []
+        while batch := await buffer.get_batch(2, timeout=0.01):
+            drained.extend(batch)
+        assert [e.metadata.event_id for e in drained] == [
+            e.metadata.event_id for e in events
+        ]
+        assert [e.payload["n"] for e in drained] == list(range(5))
+        buffer.close()
+
+    async def test_get_batch_drains_available(self):
+        """get_batch returns what is buffered without waiting per event."""
+        buffer = EventBuffer(max_size=10, timeout=5.0)
+        for i in range(3):
+            await buffer.put(create_event(f"event{i}", "service"))
+
+        start = asyncio.get_running_loop().time()
+        batch = await buffer.get_batch(10)
+        assert len(batch) == 3
+        assert asyncio.get_running_loop().time() - start < 0.5
+
+    async def test_get_batch_waits_for_first_event(self):
+        """get_batch wakes as soon as an event arrives."""
+        buffer = EventBuffer(max_size=10)
+        event = create_event("late", "service")
+
+        consumer = asyncio.create_task(buffer.get_batch(5, timeout=1.0))
+        await asyncio.sleep(0.01)
+        await buffer.put(event)
+
+        assert await consumer == [event]
+        assert await buffer.get_batch(5, timeout=0.01) == []
+
+    async def test_subscription_stats_include_buffer_counters(self):
+        """Overflow counters are reported through subscription stats."""
+        settings = SubscriberSettings(
+            buffer_size=1,
+            buffer_overflow_policy=BufferOverflowPolicy.DROP_NEWEST,
+        )
+        subscriber = EventSubscriber(settings)
+        sub_id = await subscriber.subscribe(
+            MockEventHandler(), event_type="test.event", mode=SubscriptionMode.PULL
+        )
+        managed_sub = subscriber._subscriptions[sub_id]
+        assert managed_sub.buffer is not None
+        await managed_sub.buffer.put(create_event("test.event", "service"))
+        await managed_sub.buffer.put(create_event("test.event", "service"))
+
+        stats = await subscriber.get_subscription_stats(sub_id)
+        assert stats is not None
+        assert stats["buffer"]["dropped"] == 1
+        assert stats["buffer"]["overflow_policy"] == "drop_newest"
+
+
 class TestEventFilter:
     """Test EventFilter functionality."""
 
@@ -32,6 +32,7 @@ except ImportError:
     EVENT_JOB_MISSED = "job_missed"
 
 from acb.tasks._base import (
+    HandlerExecutor,
     TaskData,
     TaskHandler,
     TaskPriority,
@@ -1105,6 +1106,24 @@ class TestAPSchedulerCleanup:
         # Jobs should be cleaned up
         # (Memory store doesn't persist after shutdown)
 
+    @pytest.mark.skipif(not APSCHEDULER_AVAILABLE, reason="APScheduler not installed")
+    @pytest.mark.asyncio
+    async def test_stop_shuts_down_handler_pools(self, apscheduler_queue):
+        """Test stop() with a pool-run handler leaves APScheduler's executors alone."""
+        apscheduler_queue.register_handler("pooled", SimpleTaskHandler(), "thread")
+        await apscheduler_queue.start()
+        scheduler_executors = apscheduler_queue._executors
+        pool = apscheduler_queue._get_handler_pool(HandlerExecutor.THREAD)
+
+        await apscheduler_queue.stop()
+
+        assert not apscheduler_queue._running
+        assert apscheduler_queue._executors is scheduler_executors
+        assert set(scheduler_executors) == {"default"}
+        assert apscheduler_queue._handler_pools == {}
+        with pytest.raises(RuntimeError):
+            pool.submit(print)
+
     @pytest.mark.skipif(not APSCHEDULER_AVAILABLE, reason="APScheduler not installed")
     @pytest.mark.asyncio
     async def test_result_cache_limit(self, apscheduler_queue):
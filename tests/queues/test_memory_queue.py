@@ -1,8 +1,11 @@
 """Tests for memory queue implementation."""
 
+import time
+
 import asyncio
 import pytest
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from acb.tasks._base import (
     TaskData,
@@ -45,6 +48,22 @@ class SimpleTaskHandler(TaskHandler):
         )
 
 
+class StartSignalHandler(TaskHandler):
+    """Handler that records when each task starts."""
+
+    def __init__(self):
+        self.started: asyncio.Future[float] | None = None
+
+    async def handle(self, task: TaskData) -> TaskResult:
+        if self.started is not None and not self.started.done():
+            self.started.set_result(time.perf_counter())
+        return TaskResult(
+            task_id=task.task_id,
+            status=TaskStatus.COMPLETED,
+            queue_name=task.queue_name,
+        )
+
+
 @pytest.fixture
 def memory_settings():
     """Create memory queue settings for testing."""
@@ -58,6 +77,8 @@ def memory_settings():
 @pytest.fixture
 async def memory_queue(memory_settings):
     """Create and start a memory queue for testing."""
+    # Tests dequeue directly; idle workers wake on enqueue and would race them
+    memory_settings.max_workers = 0
     queue = MemoryQueue(memory_settings)
     await queue.start()
     yield queue
@@ -599,6 +620,192 @@ class TestMemoryQueueIntegration:
         assert dequeued_count == 30
 
 
+class TestMemoryQueueWakeups:
+    """Tests for event-driven worker wakeups."""
+
+    @pytest.fixture
+    def wakeup_settings(self, memory_settings):
+        memory_settings.max_workers = 1
+        memory_settings.health_check_enabled = False
+        memory_settings.enable_metrics = False
+        return memory_settings
+
+    @pytest.mark.asyncio
+    async def test_idle_worker_wakes_on_enqueue(self, wakeup_settings):
+        """Idle workers start new tasks without waiting for a poll interval."""
+        wakeup_settings.idle_poll_interval = 5.0
+        queue = MemoryQueue(wakeup_settings)
+        handler = StartSignalHandler()
+        handler.started = asyncio.get_running_loop().create_future()
+        queue.register_handler("wake", handler)
+        await queue.start()
+        try:
+            await asyncio.sleep(0.05)
+            await queue.enqueue(TaskData(task_type="wake", queue_name="q"))
+            await asyncio.wait_for(handler.started, timeout=1.0)
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_idle_wait_ends_at_next_eta(self, wakeup_settings):
+        """A delayed task is picked up at its ETA, not after max_idle_wait."""
+        queue = MemoryQueue(wakeup_settings)
+        handler = StartSignalHandler()
+        handler.started = asyncio.get_running_loop().create_future()
+        queue.register_handler("delayed", handler)
+        await queue.enqueue(TaskData(task_type="delayed", queue_name="q", delay=0.1))
+
+        delay = await queue.next_task_delay()
+        assert delay is not None and 0 < delay <= 0.1
+
+        await queue.start()
+        try:
+            await asyncio.wait_for(handler.started, timeout=1.0)
+        finally:
+            await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_task(self, memory_settings):
+        """wait_for_task reports whether it was woken or timed out."""
+        queue = MemoryQueue(memory_settings)
+        assert await queue.next_task_delay() is None
+        assert await queue.wait_for_task(0.01) is False
+
+        waiter = asyncio.create_task(queue.wait_for_task(1.0))
+        await asyncio.sleep(0)
+        await queue.enqueue(TaskData(task_type="t", queue_name="q"))
+        assert await waiter is True
+
+
+class TestMemoryQueueHeadIndex:
+    """Tests for the global index of per-queue heads."""
+
+    @pytest.mark.asyncio
+    async def test_cross_queue_dequeue_order(self, memory_queue):
+        """Unnamed dequeue follows schedule time, then priority, then FIFO."""
+        due = datetime.now(tz=UTC) - timedelta(seconds=1)
+        tasks = [
+            TaskData(
+                task_type="t",
+                queue_name=name,
+                priority=priority,
+                scheduled_at=due - timedelta(seconds=offset),
+            )
+            for name, priority, offset in [
+                ("a", TaskPriority.LOW, 0),
+                ("b", TaskPriority.HIGH, 0),
+                ("c", TaskPriority.NORMAL, 1),
+                ("a", TaskPriority.CRITICAL, 0),
+                ("b", TaskPriority.HIGH, 0),
+            ]
+        ]
+        for task in tasks:
+            await memory_queue.enqueue(task)
+        await memory_queue.enqueue(TaskData(task_type="t", queue_name="d", delay=60))
+
+        order = []
+        while (task := await memory_queue.dequeue()) is not None:
+            order.append(task.task_id)
+
+        expected = [tasks[2], tasks[3], tasks[1], tasks[4], tasks[0]]
+        assert order == [task.task_id for task in expected]
+        delay = await memory_queue.next_task_delay()
+        assert delay is not None and 59 < delay <= 60
+
+    @pytest.mark.asyncio
+    async def test_index_follows_cancel_and_purge(self, memory_queue):
+        first = TaskData(task_type="t", queue_name="a")
+        second = TaskData(task_type="t", queue_name="a", delay=30)
+        other = TaskData(task_type="t", queue_name="b", delay=60)
+        for task in (first, second, other):
+            await memory_queue.enqueue(task)
+
+        assert await memory_queue.cancel_task(first.task_id)
+        delay = await memory_queue.next_task_delay()
+        assert delay is not None and 29 < delay <= 30
+
+        await memory_queue.purge_queue("a")
+        delay = await memory_queue.next_task_delay()
+        assert delay is not None and 59 < delay <= 60
+
+        await memory_queue.purge_queue("b")
+        assert await memory_queue.next_task_delay() is None
+        assert await memory_queue.dequeue() is None
+
+    @pytest.mark.asyncio
+    async def test_index_stays_bounded(self, memory_queue):
+        for i in range(500):
+            await memory_queue.enqueue(
+                TaskData(task_type="t", queue_name=f"q{i % 5}", delay=-i),
+            )
+        assert len(memory_queue._heads) <= 2 * len(memory_queue._queues) + 64
+
+
+class TestMemoryQueueBenchmarks:
+    """Benchmarks for task dispatch latency."""
+
+    @pytest.mark.benchmark
+    def test_dequeue_with_many_sparse_queues(
+        self,
+        benchmark: BenchmarkFixture,
+        memory_settings,
+    ):
+        """Cross-queue dequeue cost does not grow with the number of queues."""
+        loop = asyncio.new_event_loop()
+        queue = MemoryQueue(memory_settings)
+
+        async def fill() -> None:
+            for i in range(5000):
+                await queue.enqueue(
+                    TaskData(task_type="t", queue_name=f"sparse{i}", delay=3600),
+                )
+
+        async def round_trip() -> TaskData | None:
+            await queue.enqueue(TaskData(task_type="t", queue_name="hot"))
+            return await queue.dequeue()
+
+        loop.run_until_complete(fill())
+        try:
+            task = benchmark(lambda: loop.run_until_complete(round_trip()))
+        finally:
+            loop.close()
+
+        assert task is not None and task.queue_name == "hot"
+        assert len(queue._heads) <= 2 * len(queue._queues) + 64
+
+    @pytest.mark.benchmark
+    def test_enqueue_to_start_latency(
+        self,
+        benchmark: BenchmarkFixture,
+        memory_settings,
+    ):
+        """Time from enqueue until an idle worker starts the task."""
+        memory_settings.max_workers = 1
+        memory_settings.health_check_enabled = False
+        memory_settings.enable_metrics = False
+        loop = asyncio.new_event_loop()
+        queue = MemoryQueue(memory_settings)
+        handler = StartSignalHandler()
+        queue.register_handler("latency", handler)
+        loop.run_until_complete(queue.start())
+
+        async def round_trip() -> float:
+            handler.started = loop.create_future()
+            # Let the worker go idle before enqueueing
+            await asyncio.sleep(0)
+            enqueued_at = time.perf_counter()
+            await queue.enqueue(TaskData(task_type="latency", queue_name="bench"))
+            return await handler.started - enqueued_at
+
+        try:
+            latency = benchmark(lambda: loop.run_until_complete(round_trip()))
+        finally:
+            loop.run_until_complete(queue.stop())
+            loop.close()
+
+        assert latency < memory_settings.idle_poll_interval
+
+
 class TestMemoryQueueFactory:
     """Test memory queue factory function."""
 
@@ -1,5 +1,8 @@
 """Tests for queue base classes and common functionality."""
 
+import os
+import threading
+import time
 from uuid import uuid4
 
 import asyncio
@@ -8,6 +11,7 @@ from datetime import datetime, timedelta
 
 from acb.tasks._base import (
     FunctionalTaskHandler,
+    HandlerExecutor,
     QueueBase,
     QueueMetrics,
     QueueSettings,
@@ -109,6 +113,23 @@ class MockQueue(QueueBase):
         pass
 
 
+class WhereHandler(TaskHandler):
+    """Handler reporting the process and thread it ran in."""
+
+    def __init__(self, busy: float = 0.0):
+        self.busy = busy
+
+    async def handle(self, task: TaskData) -> TaskResult:
+        # Blocking work, as a CPU-bound handler would do
+        time.sleep(self.busy)
+        return TaskResult(
+            task_id=task.task_id,
+            status=TaskStatus.COMPLETED,
+            result={"pid": os.getpid(), "thread": threading.current_thread().name},
+            queue_name=task.queue_name,
+        )
+
+
 @pytest.fixture
 def sample_task():
     """Create a sample task for testing."""
@@ -567,5 +588,76 @@ class TestIntegration:
         await mock_queue.stop()
 
 
+class TestHandlerExecutors:
+    """Test running handlers in managed thread and process pools."""
+
+    @pytest.mark.asyncio
+    async def test_thread_executor_keeps_loop_responsive(self, mock_queue):
+        mock_queue.register_handler("blocking", WhereHandler(busy=0.2), "thread")
+        task = TaskData(task_type="blocking", queue_name="q")
+
+        handler = mock_queue.get_handler("blocking")
+        run = asyncio.create_task(mock_queue._run_handler(handler, task))
+        ticks = 0
+        while not run.done():
+            ticks += 1
+            await asyncio.sleep(0.01)
+        result = run.result()
+
+        assert ticks > 5
+        assert result.result["thread"].startswith("acb-task")
+        pool = mock_queue.metrics.thread_pool
+        assert pool.tasks_submitted == 1
+        assert pool.max_workers > 0
+        await asyncio.sleep(0)
+        assert pool.active_tasks == 0
+        mock_queue._shutdown_handler_pools()
+
+    @pytest.mark.asyncio
+    async def test_process_executor_round_trips_task_and_result(self):
+        queue = MockQueue(
+            QueueSettings(process_pool_workers=1, process_start_method="forkserver"),
+        )
+        queue.register_handler("cpu", WhereHandler(), HandlerExecutor.PROCESS)
+        task = TaskData(task_type="cpu", queue_name="q")
+
+        try:
+            await queue._process_task(task, "worker-0")
+            result = await queue._run_handler(queue.get_handler("cpu"), task)
+        finally:
+            queue._shutdown_handler_pools()
+
+        assert result.task_id == task.task_id
+        assert result.result["pid"] != os.getpid()
+        assert queue.metrics.completed_tasks == 1
+        assert queue.metrics.process_pool.tasks_submitted == 2
+
+    def test_process_executor_requires_picklable_handler(self, mock_queue):
+        lock = threading.Lock()
+
+        async def handle(task: TaskData) -> threading.Lock:
+            return lock
+
+        with pytest.raises(ValueError, match="picklable"):
+            mock_queue.register_handler(
+                "local",
+                FunctionalTaskHandler(handle),
+                "process",
+            )
+        assert mock_queue.get_handler("local") is None
+
+    @pytest.mark.asyncio
+    async def test_pool_handler_timeout_fails_task(self, mock_queue):
+        mock_queue._settings.enable_dead_letter = False
+        mock_queue.register_handler("slow", WhereHandler(busy=0.3), "thread")
+        task = TaskData(task_type="slow", queue_name="q", timeout=0.05)
+
+        await mock_queue._process_task(task, "worker-0")
+
+        assert mock_queue.metrics.failed_tasks == 1
+        assert mock_queue.metrics.thread_pool.utilization > 0
+        mock_queue._shutdown_handler_pools()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,198 @@
+"""Tests for Redis queue batch dequeue, prefetch and acknowledgements."""
+
+import time
+
+import asyncio
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from acb.tasks._base import TaskData, TaskResult, TaskStatus
+from acb.tasks.redis import RedisQueue, RedisQueueSettings
+
+
+@pytest.fixture
+def server() -> FakeServer:
+    return FakeServer()
+
+
+@pytest.fixture
+async def redis_queue(server):
+    """Create a started Redis queue backed by fakeredis, without workers."""
+    settings = RedisQueueSettings(
+        use_lua_scripts=False,
+        max_workers=0,
+        health_check_enabled=False,
+        enable_metrics=False,
+        prefetch_count=3,
+        ack_batch_size=2,
+    )
+    queue = RedisQueue(settings)
+    queue._redis = FakeRedis(server=server, decode_responses=True)
+    await queue.start()
+    yield queue
+    await queue.stop()
+
+
+def _client(server: FakeServer) -> FakeRedis:
+    return FakeRedis(server=server, decode_responses=True)
+
+
+async def _enqueue(queue: RedisQueue, count: int, queue_name: str) -> list[TaskData]:
+    tasks = []
+    for i in range(count):
+        task = TaskData(task_type="t", queue_name=queue_name, payload={"i": i})
+        await queue.enqueue(task)
+        tasks.append(task)
+    return tasks
+
+
+def _result(task: TaskData) -> TaskResult:
+    return TaskResult(
+        task_id=task.task_id,
+        status=TaskStatus.COMPLETED,
+        queue_name=task.queue_name,
+    )
+
+
+class TestRedisQueueBatchDequeue:
+    @pytest.mark.asyncio
+    async def test_dequeue_batch_claims_across_queues(self, redis_queue, server):
+        first = await _enqueue(redis_queue, 2, "a")
+        second = await _enqueue(redis_queue, 2, "b")
+
+        claimed = await redis_queue.dequeue_batch(3)
+
+        assert [task.task_id for task in claimed] == [
+            first[0].task_id,
+            first[1].task_id,
+            second[0].task_id,
+        ]
+        client = _client(server)
+        assert await client.zcard(redis_queue._processing_key) == 3
+        metrics = await client.hgetall(redis_queue._metrics_key)
+        assert metrics["pending_tasks"] == "1"
+        assert metrics["processing_tasks"] == "3"
+
+    @pytest.mark.asyncio
+    async def test_dequeue_batch_skips_future_tasks(self, redis_queue):
+        await redis_queue.enqueue(TaskData(task_type="t", queue_name="a", delay=60))
+        assert await redis_queue.dequeue_batch(5) == []
+        assert await redis_queue.dequeue_batch(0) == []
+
+    @pytest.mark.asyncio
+    async def test_dequeue_refills_prefetch_buffer(self, redis_queue):
+        tasks = await _enqueue(redis_queue, 4, "a")
+
+        assert (await redis_queue.dequeue()).task_id == tasks[0].task_id
+        assert len(redis_queue._prefetched) == 2
+        assert (await redis_queue.dequeue()).task_id == tasks[1].task_id
+        assert (await redis_queue.dequeue()).task_id == tasks[2].task_id
+        assert (await redis_queue.dequeue()).task_id == tasks[3].task_id
+        assert await redis_queue.dequeue() is None
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_prefetched_tasks(self, redis_queue, server):
+        await _enqueue(redis_queue, 3, "a")
+        await redis_queue.dequeue()
+
+        await redis_queue.stop()
+
+        client = _client(server)
+        assert await client.zcard(redis_queue._queue_key.format(queue_name="a")) == 2
+        assert await client.zcard(redis_queue._processing_key) == 1
+
+
+class TestRedisQueueAcknowledgements:
+    @pytest.mark.asyncio
+    async def test_acks_flush_in_batches(self, redis_queue, server):
+        tasks = await _enqueue(redis_queue, 2, "a")
+        claimed = await redis_queue.dequeue_batch(2)
+        client = _client(server)
+
+        await redis_queue._on_task_completed(claimed[0], _result(claimed[0]))
+        result_key = redis_queue._task_result_key.format(task_id=tasks[0].task_id)
+        assert not await client.exists(result_key)
+        assert await client.zcard(redis_queue._processing_key) == 2
+
+        failed = _result(claimed[1])
+        failed.status = TaskStatus.FAILED
+        await redis_queue._on_task_failed(claimed[1], failed)
+
+        assert await client.zcard(redis_queue._processing_key) == 0
+        metrics = await client.hgetall(redis_queue._metrics_key)
+        assert metrics["processing_tasks"] == "0"
+        assert metrics["completed_tasks"] == "1"
+        assert metrics["failed_tasks"] == "1"
+        status = await redis_queue.get_task_status(tasks[1].task_id)
+        assert status.status == TaskStatus.FAILED
+
+    @pytest.mark.asyncio
+    async def test_acks_flush_after_interval(self, redis_queue, server):
+        redis_queue._settings.ack_flush_interval = 0.01
+        (task,) = await _enqueue(redis_queue, 1, "a")
+        (claimed,) = await redis_queue.dequeue_batch(1)
+
+        await redis_queue._on_task_completed(claimed, _result(claimed))
+        assert redis_queue._pending_acks
+        await asyncio.sleep(0.05)
+
+        assert not redis_queue._pending_acks
+        result_key = redis_queue._task_result_key.format(task_id=task.task_id)
+        assert await _client(server).exists(result_key)
+
+    @pytest.mark.asyncio
+    async def test_dead_lettered_ack_releases_processing_once(
+        self,
+        redis_queue,
+        server,
+    ):
+        await _enqueue(redis_queue, 2, "a")
+        claimed = await redis_queue.dequeue_batch(2)
+
+        failed = _result(claimed[0])
+        failed.status = TaskStatus.FAILED
+        await redis_queue._move_to_dead_letter(claimed[0], failed)
+        await redis_queue._on_task_failed(claimed[0], failed)
+        await redis_queue._on_task_completed(claimed[1], _result(claimed[1]))
+
+        metrics = await _client(server).hgetall(redis_queue._metrics_key)
+        assert metrics["processing_tasks"] == "0"
+        assert metrics["dead_letter_tasks"] == "1"
+        assert metrics["failed_tasks"] == "1"
+
+
+class TestRedisQueueWakeups:
+    @pytest.mark.asyncio
+    async def test_next_task_delay_follows_earliest_task(self, redis_queue):
+        assert await redis_queue.next_task_delay() is None
+
+        await redis_queue.enqueue(TaskData(task_type="t", queue_name="a", delay=30))
+        delay = await redis_queue.next_task_delay()
+        assert 29 < delay <= 30
+
+        # A task scored into a queue for later (as the Lua enqueue does)
+        task = TaskData(task_type="t", queue_name="b")
+        client = redis_queue._redis
+        task_key = redis_queue._task_data_key.format(task_id=task.task_id)
+        await client.set(task_key, task.model_dump_json())
+        await client.zadd(
+            redis_queue._queue_key.format(queue_name="b"),
+            {task_key: (time.time() + 5) * 1_000_000},
+        )
+        assert 4 < await redis_queue.next_task_delay() <= 5
+
+    @pytest.mark.asyncio
+    async def test_due_delayed_task_is_promoted(self, redis_queue, server):
+        task = TaskData(task_type="t", queue_name="a", delay=30)
+        await redis_queue.enqueue(task)
+        client = _client(server)
+        task_key = redis_queue._task_data_key.format(task_id=task.task_id)
+        await client.zadd(redis_queue._delayed_key, {task_key: time.time() - 1})
+
+        assert await redis_queue.next_task_delay() == 0.0
+
+        assert await client.zcard(redis_queue._delayed_key) == 0
+        assert await redis_queue.wait_for_task(0.1) is True
+        claimed = await redis_queue.dequeue_batch(1)
+        assert [t.task_id for t in claimed] == [task.task_id]
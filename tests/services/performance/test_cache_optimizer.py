@@ -94,16 +94,184 @@ async def test_calculate_ttl_and_evictions(monkeypatch: pytest.MonkeyPatch) -> N
     from unittest.mock import AsyncMock
 
     opt._cache_adapter = AsyncMock()
-    now = time.time()
     # create patterns for adaptive and lru eviction
     for i in range(5):
-        opt._usage_patterns[f"k{i}"] = {
-            "access_count": i + 1,
-            "hit_count": i,
-            "miss_count": 1,
-            "last_accessed": now - i * 10,
-            "tags": [],
-        }
+        for _ in range(i + 1):
+            opt._update_usage_pattern(f"k{i}", "hit")
     ev1 = await opt._adaptive_eviction()
     ev2 = await opt._lru_eviction()
     assert ev1 >= 1 and ev2 >= 1
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key: str) -> object:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: object, ttl: int | None = None) -> None:
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+def _optimizer(**settings: object) -> tuple[CacheOptimizer, DictCache]:
+    opt = CacheOptimizer(settings=CacheOptimizerSettings(**settings))
+    opt.logger = MagicMock()
+    cache = DictCache()
+    opt._cache_adapter = cache
+    return opt, cache
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_optimized_coalesces_concurrent_misses() -> None:
+    import asyncio
+
+    opt, cache = _optimizer()
+    calls = 0
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "fetched"
+
+    waiters = [asyncio.create_task(opt.get_optimized("k", fetch)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["fetched"] * 10
+    assert calls == 1
+    assert cache.data["k"] == "fetched"
+    stats = opt.get_cache_stats()
+    assert stats.misses == 10 and stats.coalesced_requests == 9
+    assert not opt._in_flight
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_optimized_survives_cancelled_leader() -> None:
+    import asyncio
+
+    opt, _ = _optimizer()
+    release = asyncio.Event()
+
+    async def fetch() -> str:
+        await release.wait()
+        return "fetched"
+
+    leader = asyncio.create_task(opt.get_optimized("k", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(opt.get_optimized("k", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+
+    assert await follower == "fetched"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_optimized_serves_stale_and_revalidates() -> None:
+    import time
+
+    import asyncio
+
+    opt, cache = _optimizer(stale_while_revalidate_seconds=30, min_ttl_seconds=1)
+    values = iter(["v1", "v2"])
+
+    async def fetch() -> str:
+        return next(values)
+
+    assert await opt.get_optimized("k", fetch, ttl=10) == "v1"
+    assert cache.ttls["k"] == 40
+
+    # Past the logical expiry but still inside the stale window
+    opt._refresh_meta["k"] = (time.time() - 1, 0.01)
+    assert await opt.get_optimized("k", fetch, ttl=10) == "v1"
+    await asyncio.gather(*opt._in_flight.values())
+
+    assert cache.data["k"] == "v2"
+    assert opt.get_cache_stats().stale_hits == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_optimized_early_refresh() -> None:
+    import time
+
+    import asyncio
+
+    opt, cache = _optimizer(early_refresh_beta=1.0)
+    values = iter(["v1", "v2"])
+
+    async def fetch() -> str:
+        return next(values)
+
+    await opt.get_optimized("k", fetch, ttl=60)
+    # A slow fetch close to expiry makes an early refresh certain
+    opt._refresh_meta["k"] = (time.time() + 0.001, 1e9)
+    assert await opt.get_optimized("k", fetch, ttl=60) == "v1"
+    await asyncio.gather(*opt._in_flight.values())
+
+    assert cache.data["k"] == "v2"
+    stats = opt.get_cache_stats()
+    assert stats.early_refreshes == 1 and stats.stale_hits == 0
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_evictions_batch_deletes_and_stop_tracking() -> None:
+    opt = CacheOptimizer(
+        settings=CacheOptimizerSettings(
+            strategy=CacheStrategy.LFU,
+            eviction_fraction=0.5,
+            eviction_batch_size=2,
+        ),
+    )
+    opt.logger = MagicMock()
+    opt._cache_adapter = AsyncMock()
+
+    for i in range(8):
+        for _ in range(i + 1):
+            opt._update_usage_pattern(f"k{i}", "hit")
+
+    result = await opt.optimize_memory_usage()
+
+    assert result["keys_evicted"] == 4
+    batches = [call.args[0] for call in opt._cache_adapter.delete_many.await_args_list]
+    assert batches == [["k0", "k1"], ["k2", "k3"]]
+    assert list(opt._usage_patterns) == ["k4", "k5", "k6", "k7"]
+    assert len(opt._eviction_index) == 4
+    assert opt.get_cache_stats().evictions == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_evictions_fall_back_to_single_deletes() -> None:
+    opt, cache = _optimizer(strategy=CacheStrategy.LRU)
+    for key in ("a", "b", "c", "d", "e"):
+        await cache.set(key, key)
+        opt._update_usage_pattern(key, "miss")
+    opt._update_usage_pattern("a", "hit")
+
+    assert await opt._lru_eviction() == 1
+    assert "b" not in cache.data and "a" in cache.data
+
+
+@pytest.mark.unit
+def test_usage_tracking_is_bounded() -> None:
+    opt = CacheOptimizer(settings=CacheOptimizerSettings(max_tracked_keys=3))
+    for key in ("a", "b", "c"):
+        opt._update_usage_pattern(key, "miss")
+    opt._update_usage_pattern("a", "hit")
+    opt._update_usage_pattern("d", "miss")
+
+    assert list(opt._usage_patterns) == ["c", "a", "d"]
+    assert "b" not in opt._eviction_index
@@ -0,0 +1,44 @@
+"""Unit tests for the cache optimizer eviction indexes."""
+
+from __future__ import annotations
+
+import pytest
+
+from acb.services.performance.eviction import LFUIndex, SegmentedLRU
+
+
+@pytest.mark.unit
+def test_segmented_lru_prefers_one_off_keys() -> None:
+    index = SegmentedLRU(protected_capacity=2)
+    for key in ("a", "b", "c", "d"):
+        index.touch(key)
+    index.touch("a")
+    index.touch("b")
+
+    assert index.victims(2) == ["c", "d"]
+    assert index.victims(4) == ["c", "d", "a", "b"]
+
+
+@pytest.mark.unit
+def test_segmented_lru_demotes_when_protected_is_full() -> None:
+    index = SegmentedLRU(protected_capacity=1)
+    for key in ("a", "b"):
+        index.touch(key)
+        index.touch(key)
+
+    assert index.victims(1) == ["a"]
+    index.discard("a")
+    assert "a" not in index and len(index) == 1
+
+
+@pytest.mark.unit
+def test_lfu_orders_by_frequency_then_recency() -> None:
+    index = LFUIndex()
+    for key, count in (("a", 3), ("b", 1), ("c", 2), ("d", 1)):
+        for _ in range(count):
+            index.touch(key)
+
+    assert index.victims(3) == ["b", "d", "c"]
+    index.discard("b")
+    assert index.frequency("b") == 0
+    assert index.victims(10) == ["d", "c", "a"]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import asyncio
 import pytest
 from typing import Any
 
@@ -88,7 +89,7 @@ async def test_execute_batch_optimized_disabled_and_enabled() -> None:
 
     # Enabled batch optimization groups similar queries and uses adapter.execute
     qo2 = QueryOptimizer()
-    sql = AsyncMock()
+    sql = AsyncMock(spec=["execute"])  # adapter without execute_batch
     sql.execute = AsyncMock(side_effect=["r1", "r2", "r3"])  # per execution
     qo2._sql_adapter = sql
     res2 = await qo2.execute_batch_optimized(
@@ -103,6 +104,86 @@ async def test_execute_batch_optimized_disabled_and_enabled() -> None:
     assert sql.execute.await_count == 3
 
 
+class RecordingBatchAdapter:
+    def __init__(self) -> None:
+        self.batches: list[list[tuple[str, Any]]] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def execute_batch(self, statements: list[tuple[str, Any]]) -> list[Any]:
+        self.batches.append(statements)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return [f"{query}|{params}" for query, params in statements]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_batch_merges_dml_and_preserves_input_order() -> None:
+    qo = QueryOptimizer()
+    adapter = RecordingBatchAdapter()
+    qo._sql_adapter = adapter
+    insert = "INSERT INTO users (name) VALUES (:name)"
+
+    results = await qo.execute_batch_optimized(
+        [insert, insert, insert, "SELECT * FROM orders WHERE id=1"],
+        [{"name": "a"}, {"name": "b"}, {"name": "c"}, {}],
+    )
+
+    # One executemany statement for the three inserts, then the SELECT
+    assert adapter.batches == [
+        [(insert, [{"name": "a"}, {"name": "b"}, {"name": "c"}])],
+        [("SELECT * FROM orders WHERE id=1", {})],
+    ]
+    assert results[3] == "SELECT * FROM orders WHERE id=1|{}"
+    assert results[0] == results[1] == results[2]
+    assert qo.get_custom_metric("query_groups_in_batch") == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_batch_keeps_writes_in_input_order() -> None:
+    qo = QueryOptimizer()
+    adapter = RecordingBatchAdapter()
+    qo._sql_adapter = adapter
+    insert = "INSERT INTO users (name) VALUES (:name)"
+    select_users = "SELECT * FROM users WHERE id=1"
+    select_orders = "SELECT * FROM orders WHERE id=1"
+
+    await qo.execute_batch_optimized(
+        [select_users, insert, select_users, select_orders, insert],
+        [{}, {"name": "a"}, {}, {}, {"name": "b"}],
+    )
+
+    # Reads are never merged or reordered across a write; the two reads
+    # between the inserts run in parallel
+    assert [batch[0][0] for batch in adapter.batches] == [
+        select_users,
+        insert,
+        select_users,
+        select_orders,
+        insert,
+    ]
+    assert adapter.max_in_flight == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_execute_batch_caps_group_concurrency() -> None:
+    qo = QueryOptimizer(settings=QueryOptimizerSettings(batch_max_concurrency=2))
+    adapter = RecordingBatchAdapter()
+    qo._sql_adapter = adapter
+    queries = [f"SELECT * FROM table_{name} WHERE id=1" for name in "abcdef"]
+
+    results = await qo.execute_batch_optimized(queries, [{} for _ in queries])
+
+    assert [r.split("|")[0] for r in results] == queries
+    assert len(adapter.batches) == 6
+    assert adapter.max_in_flight == 2
+
+
 @pytest.mark.unit
 def test_get_query_patterns_and_slow_queries() -> None:
     qo = QueryOptimizer()
@@ -0,0 +1,122 @@
+"""Tests for CachedRepository batch reads and invalidation."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from dataclasses import dataclass
+
+from acb.adapters.cache.memory import Cache
+from acb.services.repository.cache import CachedRepository, RepositoryCacheSettings
+
+from .test_repository_base import SampleEntity, SampleRepository
+
+
+@dataclass
+class Product:
+    sku: str
+    name: str = ""
+
+
+class ProductRepository(SampleRepository):
+    """Repository keyed by ``sku`` rather than ``id``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.entity_type = Product
+        self.entity_name = "Product"
+
+    def get_entity_id(self, entity: Product) -> str:
+        return entity.sku
+
+
+@pytest.fixture
+def cache() -> Cache:
+    adapter = Cache()
+    adapter.config = MagicMock()
+    adapter.config.app.name = "test_app"
+    adapter.logger = MagicMock()
+    return adapter
+
+
+@pytest.fixture
+def repository(cache: Cache) -> CachedRepository:
+    repository = CachedRepository(
+        SampleRepository(),
+        RepositoryCacheSettings(key_prefix="repo"),
+    )
+    repository._cache = cache
+    return repository
+
+
+class TestCachedRepositoryBatchReads:
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_reads_through_in_batches(self, repository):
+        wrapped = repository.wrapped
+        entities = [await wrapped.create(SampleEntity(name=str(i))) for i in range(3)]
+        ids = [entity.id for entity in entities]
+        wrapped.get_many_by_ids = AsyncMock(wraps=wrapped.get_many_by_ids)
+
+        await repository.get_by_id(ids[1])
+        result = await repository.get_many_by_ids([ids[2], 999, ids[1], ids[0]])
+
+        assert [entity.id for entity in result] == [ids[2], ids[1], ids[0]]
+        wrapped.get_many_by_ids.assert_awaited_once_with([ids[2], 999, ids[0]])
+        assert repository._metrics.hits == 1
+        assert repository._metrics.misses == 4
+
+        result = await repository.get_many_by_ids(ids)
+        assert [entity.id for entity in result] == ids
+        assert wrapped.get_many_by_ids.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_uses_wrapped_id_accessor(self, cache):
+        wrapped = ProductRepository()
+        wrapped._entities = {"a": Product("a", "apple"), "b": Product("b", "pear")}
+        repository = CachedRepository(
+            wrapped,
+            RepositoryCacheSettings(key_prefix="repo"),
+        )
+        repository._cache = cache
+
+        result = await repository.get_many_by_ids(["b", "x", "a"])
+
+        assert [product.name for product in result] == ["pear", "apple"]
+        assert (await cache.get("repo:entity:product:a")).name == "apple"
+        assert repository.get_entity_id(result[0]) == "b"
+
+    @pytest.mark.asyncio
+    async def test_warm_cache_uses_batch_read(self, repository, cache):
+        entities = [
+            await repository.wrapped.create(SampleEntity(name=str(i))) for i in range(2)
+        ]
+
+        assert await repository.warm_cache([e.id for e in entities] + [999]) == 2
+        assert await cache.get(f"repo:entity:sampleentity:{entities[0].id}")
+
+
+class TestCachedRepositoryInvalidation:
+    @pytest.mark.asyncio
+    async def test_invalidate_all_deletes_by_pattern(self, repository, cache):
+        keys = [
+            "repo:entity:sampleentity:1",
+            "repo:query:sampleentity:list:abc",
+            "repo:count:sampleentity:all",
+        ]
+        for key in keys:
+            await cache.set(key, "value")
+        await cache.set("repo:entity:other:1", "value")
+
+        await repository.invalidate_all()
+
+        assert [await cache.get(key) for key in keys] == [None, None, None]
+        assert await cache.get("repo:entity:other:1") == "value"
+        assert repository._metrics.invalidations == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate_all_without_pattern_support(self, repository):
+        repository._cache = MagicMock(spec=["get", "set", "delete"])
+
+        await repository.invalidate_all()
+
+        assert repository._metrics.invalidations == 0
+        assert repository._metrics.errors == 0
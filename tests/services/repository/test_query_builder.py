@@ -0,0 +1,273 @@
+"""Tests for QueryBuilder compilation and server-side execution."""
+
+import pytest
+from contextlib import asynccontextmanager
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import Field as SQLField
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any
+
+from acb.services.repository._base import RepositorySettings
+from acb.services.repository.bulk import (
+    NoSqlBulkOperationsMixin,
+    SqlBulkOperationsMixin,
+)
+from acb.services.repository.query_builder import (
+    AggregateFunction,
+    QueryBuilder,
+    QueryType,
+)
+from acb.services.repository.specifications import (
+    equals,
+    greater_than,
+    in_values,
+    less_than,
+)
+
+from .test_repository_base import SampleRepository
+
+
+class Order(SQLModel, table=True):
+    __tablename__ = "qb_order"
+
+    id: int | None = SQLField(default=None, primary_key=True)
+    customer: str = ""
+    status: str = ""
+    amount: float = 0.0
+
+
+class FakeSqlAdapter:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+
+    @asynccontextmanager
+    async def get_session(self):
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            yield session
+
+
+class OrderRepository(SqlBulkOperationsMixin, SampleRepository):
+    def __init__(self, sql_adapter: FakeSqlAdapter) -> None:
+        super().__init__()
+        self.entity_type = Order
+        self.entity_name = "Order"
+        self.settings = RepositorySettings()
+        self._sql_adapter = sql_adapter
+
+
+@pytest.fixture
+async def orders(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'orders.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Order.metadata.create_all, tables=[Order.__table__])
+    repository = OrderRepository(FakeSqlAdapter(engine))
+    await repository.batch_create(
+        [
+            Order(customer="ann", status="paid", amount=10.0),
+            Order(customer="ann", status="paid", amount=30.0),
+            Order(customer="bob", status="paid", amount=5.0),
+            Order(customer="bob", status="open", amount=50.0),
+            Order(customer="cy", status="void", amount=99.0),
+        ],
+    )
+    yield repository
+    await engine.dispose()
+
+
+class TestQueryCompilation:
+    @pytest.fixture
+    def builder(self) -> QueryBuilder:
+        repository = SampleRepository()
+        return QueryBuilder(repository)
+
+    def test_compiles_full_specification_tree(self, builder):
+        spec = (greater_than("amount", 10) | equals("status", "open")) & ~equals(
+            "customer",
+            "cy",
+        )
+        compiled = (
+            builder.where(spec).select("id", "amount").order_by_desc("amount").limit(5)
+        ).compile()
+
+        assert compiled.query_type == QueryType.SELECT
+        assert compiled.sql.startswith("SELECT id, amount FROM sampleentity WHERE ")
+        assert " OR " in compiled.sql
+        assert "NOT (" in compiled.sql
+        assert compiled.sql.endswith("ORDER BY amount DESC LIMIT :_limit")
+        assert compiled.params["_limit"] == 5
+        assert compiled.nosql["projection"] == {"id": 1, "amount": 1}
+        assert compiled.nosql["sort"] == [("amount", -1)]
+        assert "$and" in compiled.nosql["filter"]
+
+    def test_compiles_group_by_having_and_aggregates(self, builder):
+        compiled = (
+            builder.where(in_values("status", ["paid", "open"]))
+            .group_by("customer")
+            .sum("amount", "total")
+            .count()
+            .having(greater_than("total", 20))
+            .compile()
+        )
+
+        assert compiled.query_type == QueryType.AGGREGATE
+        assert (
+            "SELECT customer, SUM(amount) AS total, COUNT(*) AS count_all"
+            in compiled.sql
+        )
+        assert "GROUP BY customer HAVING SUM(amount) > :" in compiled.sql
+        pipeline = compiled.nosql["pipeline"]
+        assert pipeline[1]["$group"]["total"] == {"$sum": "$amount"}
+        assert pipeline[-1] == {"$match": {"total": {"$gt": 20}}}
+
+    def test_compiles_having_without_group_by(self, builder):
+        compiled = (
+            builder.sum("amount", "total").having(greater_than("total", 20)).compile()
+        )
+
+        assert compiled.query_type == QueryType.AGGREGATE
+        assert "GROUP BY" not in compiled.sql
+        assert "FROM sampleentity HAVING SUM(amount) > :" in compiled.sql
+
+    def test_offset_without_limit_is_bounded(self, builder):
+        compiled = builder.offset(10).compile()
+        assert "LIMIT 9223372036854775807 OFFSET :_offset" in compiled.sql
+
+    def test_rejects_unsafe_identifiers(self, builder):
+        with pytest.raises(ValueError):
+            builder.select("id; DROP TABLE users").compile()
+
+    def test_rejects_unsafe_specification_fields(self, builder):
+        with pytest.raises(ValueError):
+            builder.where(
+                equals("status", "open") & ~equals("1=1 OR name", "x"),
+            ).compile()
+        with pytest.raises(ValueError):
+            builder.sum("amount", "total").having(
+                greater_than("total) OR (1", 0),
+            ).compile()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_without_executor(self, builder):
+        await builder.repository.batch_create([])
+        result = await builder.count().execute()
+        assert result.data == {"count_all": 0}
+
+
+class TestServerSideExecution:
+    @pytest.mark.asyncio
+    async def test_select_filters_on_the_server(self, orders):
+        results = await (
+            QueryBuilder(orders)
+            .where(greater_than("amount", 8) & less_than("amount", 60))
+            .order_by_asc("amount")
+            .to_list()
+        )
+        assert [o.amount for o in results] == [10.0, 30.0, 50.0]
+        assert all(isinstance(o, Order) for o in results)
+
+    @pytest.mark.asyncio
+    async def test_projection_reaches_the_database(self, orders):
+        rows = await QueryBuilder(orders).select("customer").distinct().to_list()
+        assert sorted(row["customer"] for row in rows) == ["ann", "bob", "cy"]
+
+    @pytest.mark.asyncio
+    async def test_grouped_aggregates(self, orders):
+        result = await (
+            QueryBuilder(orders)
+            .where(equals("status", "paid"))
+            .group_by("customer")
+            .sum("amount", "total")
+            .max("amount", "largest")
+            .having(greater_than("total", 10))
+            .order_by_desc("total")
+            .execute()
+        )
+        assert result.query_type == QueryType.AGGREGATE
+        assert result.data == [{"customer": "ann", "total": 40.0, "largest": 30.0}]
+
+    @pytest.mark.asyncio
+    async def test_ungrouped_aggregates_and_counts(self, orders):
+        builder = QueryBuilder(orders).where(equals("customer", "bob"))
+        result = await (
+            builder.clone()
+            .avg("amount", "mean")
+            .aggregate(AggregateFunction.COUNT_DISTINCT, "status", "statuses")
+            .execute()
+        )
+        assert result.data == {"mean": 27.5, "statuses": 2}
+        assert await builder.count_only() == 2
+        assert await builder.exists_any() is True
+        assert await QueryBuilder(orders).where_equals("id", 999).exists_any() is False
+
+    @pytest.mark.asyncio
+    async def test_ungrouped_having_filters_the_whole_table(self, orders):
+        builder = QueryBuilder(orders).where(equals("customer", "bob"))
+        kept = (
+            await builder.clone()
+            .sum("amount", "total")
+            .having(greater_than("total", 50))
+            .execute()
+        )
+        dropped = (
+            await builder.clone()
+            .sum("amount", "total")
+            .having(greater_than("total", 100))
+            .execute()
+        )
+
+        assert kept.data == {"total": 55.0}
+        assert not dropped.data
+
+    @pytest.mark.asyncio
+    async def test_entity_id_reads_the_primary_key(self, orders):
+        (order,) = await orders.get_many_by_ids([3])
+        assert orders.get_entity_id(order) == 3
+
+    @pytest.mark.asyncio
+    async def test_get_many_by_ids_keeps_requested_order(self, orders):
+        results = await orders.get_many_by_ids([4, 999, 1, 2])
+        assert [o.id for o in results] == [4, 1, 2]
+        assert await orders.get_many_by_ids([]) == []
+
+
+class FakeNosqlAdapter:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, Any]] = []
+
+    async def find(self, collection, filter, **kwargs):
+        self.calls.append(("find", (collection, filter, kwargs)))
+        return [{"_id": 1, "name": "doc", "active": True}]
+
+    async def count(self, collection, filter=None):
+        self.calls.append(("count", (collection, filter)))
+        return 3
+
+    async def aggregate(self, collection, pipeline):
+        self.calls.append(("aggregate", (collection, pipeline)))
+        return [{"count_all": 3}]
+
+
+class TestNoSqlExecution:
+    @pytest.mark.asyncio
+    async def test_find_count_and_aggregate(self):
+        class DocumentRepository(NoSqlBulkOperationsMixin, SampleRepository):
+            pass
+
+        repository = DocumentRepository()
+        adapter = FakeNosqlAdapter()
+        repository._nosql_adapter = adapter
+
+        entities = await (
+            QueryBuilder(repository).where(equals("active", True)).limit(1).to_list()
+        )
+        assert entities[0].id == 1
+        assert adapter.calls[0][1] == ("sampleentity", {"active": True}, {"limit": 1})
+
+        assert await QueryBuilder(repository).count_only() == 3
+        result = await QueryBuilder(repository).count().execute()
+        assert result.data == {"count_all": 3}
+
+        entities = await repository.get_many_by_ids([2, 1])
+        assert [entity.id for entity in entities] == [1]
+        assert adapter.calls[-1][1] == ("sampleentity", {"_id": {"$in": [2, 1]}}, {})
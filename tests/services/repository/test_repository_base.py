@@ -1,18 +1,30 @@
 """Tests for Repository Base Classes."""
 
 import pytest
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import Field as SQLField
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Any
 
 from acb.services.repository._base import (
+    BatchResult,
     DuplicateEntityError,
     EntityNotFoundError,
     PaginationInfo,
     RepositoryBase,
+    RepositoryError,
     RepositorySettings,
     SortCriteria,
     SortDirection,
 )
+from acb.services.repository.bulk import (
+    NoSqlBulkOperationsMixin,
+    SqlBulkOperationsMixin,
+)
 
 
 @dataclass
@@ -482,3 +494,181 @@ class SampleRepositoryErrors:
         assert error.value == "test@example.com"
         assert error.operation == "create"
         assert "SampleEntity with email=test@example.com already exists" in str(error)
+
+
+class TestBatchOperations:
+    """Test chunked batch operations."""
+
+    @pytest.mark.asyncio
+    async def test_batch_create_records_chunk_timings(self, repository):
+        entities = [SampleEntity(name=f"Entity {i}") for i in range(7)]
+
+        created = await repository.batch_create(entities, chunk_size=3)
+
+        assert len(created) == 7
+        result = repository.last_batch_result
+        assert isinstance(result, BatchResult)
+        assert result.operation == "batch_create"
+        assert result.total == 7
+        assert result.affected == 7
+        assert result.chunks == 3
+        assert result.total_time >= 0
+        metrics = await repository.get_metrics()
+        assert metrics["last_batch"]["chunks"] == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_delete_uses_settings_chunk_size(self, repository):
+        repository.settings.batch_size = 2
+        created = await repository.batch_create(
+            [SampleEntity(name=f"Entity {i}") for i in range(5)],
+        )
+
+        deleted = await repository.batch_delete([e.id for e in created] + [999])
+
+        assert deleted == 5
+        assert repository.last_batch_result.chunks == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_errors_are_wrapped(self, repository):
+        with pytest.raises(RepositoryError):
+            await repository.batch_update([SampleEntity(id=42, name="missing")])
+        assert repository._metrics["batch_update_error"] == 1
+
+
+class BulkUser(SQLModel, table=True):
+    __tablename__ = "bulk_user"
+
+    id: int | None = SQLField(default=None, primary_key=True)
+    name: str = ""
+
+
+class FakeSqlAdapter:
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+
+    @asynccontextmanager
+    async def get_session(self):
+        async with AsyncSession(self.engine, expire_on_commit=False) as session:
+            yield session
+
+
+class BulkUserRepository(SqlBulkOperationsMixin, SampleRepository):
+    def __init__(self, sql_adapter: FakeSqlAdapter) -> None:
+        super().__init__()
+        self.entity_type = BulkUser
+        self._sql_adapter = sql_adapter
+
+
+class TestSqlBulkOperations:
+    @pytest.fixture
+    async def sql_repository(self, tmp_path):
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'bulk.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(
+                BulkUser.metadata.create_all, tables=[BulkUser.__table__]
+            )
+        yield BulkUserRepository(FakeSqlAdapter(engine))
+        await engine.dispose()
+
+    async def _rows(self, repository) -> list[tuple[int, str]]:
+        async with repository._sql_adapter.get_session() as session:
+            result = await session.execute(
+                text("SELECT id, name FROM bulk_user ORDER BY id"),
+            )
+            return [tuple(row) for row in result]
+
+    @pytest.mark.asyncio
+    async def test_set_based_create_update_delete(self, sql_repository):
+        users = [BulkUser(name=f"user-{i}") for i in range(10)]
+
+        created = await sql_repository.batch_create(users, chunk_size=4)
+        assert [u.id for u in created] == list(range(1, 11))
+        assert sql_repository.last_batch_result.chunks == 3
+
+        for user in created:
+            user.name = user.name.upper()
+        await sql_repository.batch_update(created)
+        rows = await self._rows(sql_repository)
+        assert rows[0] == (1, "USER-0")
+
+        deleted = await sql_repository.batch_delete(list(range(1, 8)), chunk_size=5)
+        assert deleted == 7
+        assert [row[0] for row in await self._rows(sql_repository)] == [8, 9, 10]
+
+    @pytest.mark.asyncio
+    async def test_batch_rolls_back_as_one_transaction(self, sql_repository):
+        await sql_repository.batch_create([BulkUser(id=1, name="first")])
+
+        with pytest.raises(RepositoryError):
+            await sql_repository.batch_create(
+                [BulkUser(id=2, name="second"), BulkUser(id=1, name="duplicate")],
+                chunk_size=1,
+            )
+
+        assert await self._rows(sql_repository) == [(1, "first")]
+
+
+class FakeDeleteResult:
+    """Shaped like pymongo's ``DeleteResult``."""
+
+    def __init__(self, deleted_count: int) -> None:
+        self.deleted_count = deleted_count
+
+
+class FakeNosqlAdapter:
+    def __init__(self) -> None:
+        self.documents: dict[int, dict[str, Any]] = {}
+        self.calls: list[str] = []
+
+    async def insert_many(self, collection, documents):
+        self.calls.append("insert_many")
+        for document in documents:
+            self.documents[document["_id"]] = document
+
+    async def update_one(self, collection, filter, update):
+        self.calls.append("update_one")
+        self.documents[filter["_id"]].update(update["$set"])
+
+    async def delete_many(self, collection, filter):
+        self.calls.append("delete_many")
+        ids = [i for i in filter["_id"]["$in"] if i in self.documents]
+        for entity_id in ids:
+            del self.documents[entity_id]
+        return FakeDeleteResult(len(ids))
+
+
+class TestNoSqlBulkOperations:
+    @pytest.mark.asyncio
+    async def test_insert_many_and_delete_in(self):
+        class DocumentRepository(NoSqlBulkOperationsMixin, SampleRepository):
+            pass
+
+        repository = DocumentRepository()
+        repository._nosql_adapter = FakeNosqlAdapter()
+        entities = [SampleEntity(id=i, name=f"doc-{i}") for i in range(1, 6)]
+
+        await repository.batch_create(entities, chunk_size=2)
+        assert repository._nosql_adapter.calls == ["insert_many"] * 3
+        assert repository._collection == "sampleentity"
+
+        entities[0].name = "changed"
+        await repository.batch_update(entities[:2])
+        assert repository._nosql_adapter.documents[1]["name"] == "changed"
+
+        assert await repository.batch_delete([1, 2, 3, 99]) == 3
+        assert sorted(repository._nosql_adapter.documents) == [4, 5]
+
+    @pytest.mark.asyncio
+    async def test_delete_reads_dict_counts(self):
+        class DocumentRepository(NoSqlBulkOperationsMixin, SampleRepository):
+            pass
+
+        repository = DocumentRepository()
+        adapter = FakeNosqlAdapter()
+        repository._nosql_adapter = adapter
+
+        async def delete_many(collection, filter):
+            return {"deleted_count": len(filter["_id"]["$in"])}
+
+        adapter.delete_many = delete_many
+        assert await repository.batch_delete([1, 2]) == 2
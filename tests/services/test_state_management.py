@@ -1,12 +1,16 @@
 """Tests for State Management Service."""
 
+import time
+import tracemalloc
 from unittest.mock import AsyncMock, patch
 
 import asyncio
 import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
 
 from acb.services.state import (
     InMemoryStateManager,
+    MockRepositoryService,
     PersistentStateManager,
     StateEntry,
     StateManagerService,
@@ -140,6 +144,54 @@ class TestInMemoryStateManager:
         # Newer entries should be preserved
         assert await small_manager.get("key_4") == "value_4"
 
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self):
+        """Test bulk get/set/delete under a single lock."""
+        await self.manager.set_multi({"bulk1": 1, "bulk2": 2, "bulk3": 3})
+        await self.manager.set("short", "gone", ttl_seconds=0.05)
+        await asyncio.sleep(0.1)
+
+        values = await self.manager.get_multi(["bulk1", "bulk3", "short", "missing"])
+        assert values == {"bulk1": 1, "bulk3": 3}
+        assert "short" not in self.manager._state
+
+        deleted = await self.manager.delete_multi(["bulk1", "bulk2", "missing"])
+        assert deleted == ["bulk1", "bulk2"]
+        assert await self.manager.keys() == ["bulk3"]
+
+    @pytest.mark.asyncio
+    async def test_memory_limits_evict_least_recently_used(self):
+        """Test reads refresh recency so eviction drops the coldest key."""
+        small_manager = InMemoryStateManager(StateManagerSettings(max_memory_entries=3))
+        for key in ("a", "b", "c"):
+            await small_manager.set(key, key)
+
+        await small_manager.get("a")
+        await small_manager.set("d", "d")
+
+        assert sorted(await small_manager.keys()) == ["a", "c", "d"]
+
+    @pytest.mark.asyncio
+    async def test_purge_expired_uses_current_expiry(self):
+        """Test purging removes due entries and skips rewritten ones."""
+        await self.manager.set("due", 1, ttl_seconds=0.05)
+        await self.manager.set("renewed", 2, ttl_seconds=0.05)
+        await self.manager.set("renewed", 3, ttl_seconds=60)
+        await self.manager.set("kept", 4, state_type=StateType.PERSISTENT)
+        await asyncio.sleep(0.1)
+
+        assert await self.manager.purge_expired() == 1
+        assert sorted(await self.manager.keys()) == ["kept", "renewed"]
+        assert await self.manager.get("renewed") == 3
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap_stays_bounded(self):
+        """Test rewrites do not grow the expiry heap without bound."""
+        for i in range(1000):
+            await self.manager.set("hot", i, ttl_seconds=60)
+
+        assert len(self.manager._expiry_heap) <= 2 * len(self.manager._state) + 64
+
     @pytest.mark.asyncio
     async def test_metadata_support(self):
         """Test state entry metadata."""
@@ -220,6 +272,42 @@ class TestPersistentStateManager:
         cleared = await self.manager.clear()
         assert cleared >= 0  # Remaining entries
 
+    @pytest.mark.asyncio
+    async def test_bulk_operations_use_repository_batch_methods(self):
+        """Test bulk operations issue one repository call each."""
+        repository = MockRepositoryService()
+        repository.find_by_key = AsyncMock(side_effect=AssertionError)
+        repository.upsert = AsyncMock(side_effect=AssertionError)
+        repository.find_by_keys = AsyncMock(wraps=repository.find_by_keys)
+        repository.upsert_many = AsyncMock(wraps=repository.upsert_many)
+        repository.delete_by_keys = AsyncMock(wraps=repository.delete_by_keys)
+        self.manager._repository = repository
+
+        await self.manager.set_multi({"bulk1": "a", "bulk2": "b"})
+        values = await self.manager.get_multi(["bulk1", "bulk2", "missing"])
+        deleted = await self.manager.delete_multi(["bulk1", "missing"])
+
+        assert values == {"bulk1": "a", "bulk2": "b"}
+        assert deleted == ["bulk1"]
+        assert repository.upsert_many.await_count == 1
+        assert repository.find_by_keys.await_count == 1
+        assert repository.delete_by_keys.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations_fall_back_to_single_key_calls(self):
+        """Test bulk operations on a repository without batch methods."""
+        repository = MockRepositoryService()
+        for name in ("find_by_keys", "upsert_many", "delete_by_keys"):
+            setattr(repository, name, None)
+        self.manager._repository = repository
+
+        await self.manager.set_multi({"bulk1": "a", "bulk2": "b"})
+        assert await self.manager.get_multi(["bulk1", "bulk2"]) == {
+            "bulk1": "a",
+            "bulk2": "b",
+        }
+        assert await self.manager.delete_multi(["bulk2", "missing"]) == ["bulk2"]
+
 
 class TestStateManagerService:
     """Test StateManagerService functionality."""
@@ -359,6 +447,159 @@ class TestStateManagerService:
 
         await service.shutdown()
 
+    @pytest.mark.asyncio
+    async def test_get_multi_reads_persistent_storage_for_misses(self):
+        """Test batch get falls back to persistent storage in one read."""
+        service = StateManagerService(
+            StateManagerSettings(enable_persistent_storage=True)
+        )
+        service._persistent_manager._repository = MockRepositoryService()
+
+        await service.set_multi(
+            {"p1": "v1", "p2": "v2"}, state_type=StateType.PERSISTENT
+        )
+        await service.set("m1", "memory_only")
+        await service._memory_manager.delete_multi(["p1", "p2"])
+
+        results = await service.get_multi(["p1", "p2", "m1", "missing"])
+        assert results == {"p1": "v1", "p2": "v2", "m1": "memory_only"}
+        assert service._metrics.persistent_reads_total == 3
+        assert await service.delete_multi(["p1", "m1", "missing"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_state_compares_chunks_by_hash(self):
+        """Test sync only rewrites entries whose hashes differ."""
+        service = StateManagerService(
+            StateManagerSettings(enable_persistent_storage=True, batch_size=2)
+        )
+        persistent = service._persistent_manager
+        persistent._repository = MockRepositoryService()
+        persistent._repository.find_by_keys = AsyncMock(
+            wraps=persistent._repository.find_by_keys
+        )
+
+        items = {f"sync_{i}": {"n": i} for i in range(5)}
+        await service.set_multi(items, state_type=StateType.PERSISTENT)
+
+        await service.sync_state(list(items))
+        assert service._metrics.sync_conflicts_total == 0
+        assert persistent._repository.find_by_keys.await_count == 3
+
+        await service._memory_manager.set(
+            "sync_1", {"n": 100}, state_type=StateType.PERSISTENT
+        )
+        await persistent.set("remote_only", "remote")
+
+        await service.sync_state([*items, "remote_only"])
+        assert service._metrics.sync_conflicts_total == 2
+        assert await persistent.get("sync_1") == {"n": 100}
+        assert await service._memory_manager.get("remote_only") == "remote"
+
+    @pytest.mark.asyncio
+    async def test_sync_state_skips_chunks_that_fail_to_read(self):
+        """Test a failed persistent read does not rewrite the chunk."""
+        service = StateManagerService(
+            StateManagerSettings(enable_persistent_storage=True, batch_size=2)
+        )
+        persistent = service._persistent_manager
+        repository = MockRepositoryService()
+        persistent._repository = repository
+
+        find_by_keys = repository.find_by_keys
+
+        async def flaky_find_by_keys(collection, keys):
+            if "sync_0" in keys:
+                raise ConnectionError("repository unavailable")
+            return await find_by_keys(collection, keys)
+
+        items = {f"sync_{i}": i for i in range(4)}
+        await service.set_multi(items, state_type=StateType.PERSISTENT)
+        repository.find_by_keys = AsyncMock(side_effect=flaky_find_by_keys)
+        repository.upsert_many = AsyncMock(wraps=repository.upsert_many)
+
+        await service.sync_state(list(items))
+
+        assert repository.find_by_keys.await_count == 2
+        assert service._metrics.sync_conflicts_total == 0
+        repository.upsert_many.assert_not_awaited()
+        with pytest.raises(ConnectionError):
+            await persistent.get_entries(["sync_0"])
+
+    @pytest.mark.asyncio
+    async def test_cleanup_counts_expired_entries(self):
+        """Test cleanup purges due entries and records them in metrics."""
+        await self.service.set("short1", 1, ttl_seconds=0.05)
+        await self.service.set("short2", 2, ttl_seconds=0.05)
+        await self.service.set("long", 3)
+        await asyncio.sleep(0.1)
+
+        await self.service._cleanup_expired_entries()
+
+        assert self.service._metrics.expires_total == 2
+        assert await self.service._memory_manager.keys() == ["long"]
+
+
+@pytest.fixture
+def benchmark_keys(request: pytest.FixtureRequest) -> int:
+    """1M keys under --benchmark-only, a smoke-sized load in normal runs."""
+    if request.config.getoption("benchmark_only", default=False):
+        return 1_000_000
+    return 10_000
+
+
+class TestInMemoryStateManagerBenchmarks:
+    """Benchmarks for in-memory state at one million keys.
+
+    Normal test runs use 10k keys; run with --benchmark-only for the full size.
+    """
+
+    @pytest.mark.benchmark(group="state-memory")
+    def test_set_with_eviction(
+        self,
+        benchmark: BenchmarkFixture,
+        benchmark_keys: int,
+    ):
+        """Writes through a limit of a tenth of the keys; this used to sort per write."""
+        limit = benchmark_keys // 10
+        settings = StateManagerSettings(max_memory_entries=limit)
+
+        async def load() -> InMemoryStateManager:
+            manager = InMemoryStateManager(settings)
+            for i in range(benchmark_keys):
+                await manager.set(f"key_{i}", i)
+            return manager
+
+        with asyncio.Runner() as runner:
+            manager = benchmark.pedantic(lambda: runner.run(load()), rounds=1)
+
+            assert len(manager._state) == limit
+            last = benchmark_keys - 1
+            assert runner.run(manager.get(f"key_{last}")) == last
+            assert runner.run(manager.get("key_0")) is None
+
+    @pytest.mark.benchmark(group="state-memory")
+    def test_purge_expired(self, benchmark: BenchmarkFixture, benchmark_keys: int):
+        """Expire every key via the heap; setup records bytes per key."""
+        settings = StateManagerSettings(max_memory_entries=benchmark_keys)
+
+        def setup():
+            manager = InMemoryStateManager(settings)
+            tracemalloc.start()
+            now = time.time()
+            for i in range(benchmark_keys):
+                manager._put(f"key_{i}", i, StateType.CACHED, 0, None, now)
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            benchmark.extra_info["bytes_per_key"] = current / benchmark_keys
+            return (manager,), {}
+
+        def purge(manager: InMemoryStateManager) -> int:
+            return manager._purge_expired(time.time())
+
+        removed = benchmark.pedantic(purge, setup=setup, rounds=1)
+
+        assert removed == benchmark_keys
+
 
 class TestConvenienceFunctions:
     """Test convenience functions for state management."""
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import UTC, datetime, timedelta
 from typing import Any
@@ -7,7 +8,7 @@ from acb.tasks._base import (
     TaskData,
     TaskPriority,
 )
-from acb.tasks.scheduler import ScheduleRule, TaskScheduler
+from acb.tasks.scheduler import ScheduleRule, TaskScheduler, _parsed_cron
 
 
 class DummyQueue(QueueBase):
@@ -130,3 +131,98 @@ def test_scheduled_task_requires_one_of_cron_or_interval(
         @scheduled_task(scheduler)  # neither cron nor interval provided
         def demo():
             return None
+
+
+@pytest.mark.asyncio
+async def test_scheduler_sleeps_until_rule_added() -> None:
+    queue = DummyQueue()
+    scheduler = TaskScheduler(queue)
+
+    async with scheduler:
+        await asyncio.sleep(0.01)
+        scheduler.schedule_once(
+            datetime.now(tz=UTC) + timedelta(milliseconds=20), "t", name="soon"
+        )
+        await asyncio.sleep(0.1)
+
+    # The loop was parked on a 60s idle sleep and still ran the rule promptly
+    assert [task.tags["rule_name"] for task in queue.enqueued] == ["soon"]
+
+
+@pytest.mark.asyncio
+async def test_stale_heap_entries_are_skipped() -> None:
+    queue = DummyQueue()
+    scheduler = TaskScheduler(queue)
+    now = datetime.now(tz=UTC)
+
+    removed = scheduler.schedule_once(now, "t", name="removed")
+    disabled = scheduler.schedule_once(now, "t", name="disabled")
+    moved = scheduler.schedule_interval(0.001, "t", name="moved")
+    scheduler.remove_rule(removed)
+    scheduler.disable_rule(disabled)
+    scheduler.update_rule(moved, interval_seconds=3600)
+
+    assert await scheduler._run_due_rules(now + timedelta(seconds=1)) == 0
+    assert queue.enqueued == []
+
+    # Only the live entry for "moved" survives compaction
+    scheduler._compact_heap()
+    assert [entry[2] for entry in scheduler._heap] == [moved]
+
+
+@pytest.mark.asyncio
+async def test_due_rules_are_rescheduled() -> None:
+    queue = DummyQueue()
+    scheduler = TaskScheduler(queue)
+    rule_id = scheduler.schedule_interval(10, "t", name="tick")
+    rule = scheduler.get_rule(rule_id)
+    assert rule is not None and rule.next_run is not None
+
+    first = rule.next_run
+    assert await scheduler._run_due_rules(first - timedelta(seconds=1)) == 0
+    assert await scheduler._run_due_rules(first) == 1
+    assert await scheduler._run_due_rules(first) == 0
+    assert rule.next_run == first + timedelta(seconds=10)
+    assert scheduler._seconds_until_next_run() is not None
+
+
+def test_cron_expressions_are_parsed_once() -> None:
+    pytest.importorskip("croniter")
+    _parsed_cron.cache_clear()
+    rule = ScheduleRule(
+        name="cron",
+        task_type="t",
+        queue_name="q",
+        cron_expression="*/5 * * * *",
+    )
+    base = datetime(2025, 1, 1, 12, 1, tzinfo=UTC)
+
+    assert rule.calculate_next_run(base) == datetime(2025, 1, 1, 12, 5, tzinfo=UTC)
+    assert rule.calculate_next_run(base + timedelta(hours=1)) == datetime(
+        2025, 1, 1, 13, 5, tzinfo=UTC
+    )
+    assert _parsed_cron.cache_info().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_cost_does_not_scan_all_rules() -> None:
+    scheduler = TaskScheduler(DummyQueue())
+    later = datetime.now(tz=UTC) + timedelta(hours=1)
+    for i in range(10_000):
+        scheduler.schedule_once(later, "t", name=f"r{i}")
+
+    calls = 0
+    original = ScheduleRule.should_run
+
+    def counting_should_run(self: ScheduleRule, *args: Any) -> bool:
+        nonlocal calls
+        calls += 1
+        return original(self, *args)
+
+    ScheduleRule.should_run = counting_should_run  # type: ignore[method-assign]
+    try:
+        assert await scheduler._run_due_rules(datetime.now(tz=UTC)) == 0
+    finally:
+        ScheduleRule.should_run = original  # type: ignore[method-assign]
+    assert calls == 0
+    assert 0 < (scheduler._seconds_until_next_run() or 0) <= 3600
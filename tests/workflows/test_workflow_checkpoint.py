@@ -0,0 +1,184 @@
+"""Tests for workflow checkpointing, resume and step memoization."""
+
+import pytest
+
+from acb.services.state import StateManagerService, StateManagerSettings
+from acb.workflows import (
+    BasicWorkflowEngine,
+    StateCheckpointStore,
+    StepResult,
+    StepState,
+    WorkflowDefinition,
+    WorkflowState,
+    WorkflowStep,
+    step_input_hash,
+)
+
+
+@pytest.fixture
+def store() -> StateCheckpointStore:
+    state = StateManagerService(
+        StateManagerSettings(cleanup_interval_seconds=0),
+    )
+    return StateCheckpointStore(state)
+
+
+class CountingEngine(BasicWorkflowEngine):
+    """Engine that counts action calls and can fail a step on demand."""
+
+    def __init__(self, store: StateCheckpointStore) -> None:
+        super().__init__(checkpoint_store=store)
+        self.calls: list[str] = []
+        self.fail_steps: set[str] = set()
+
+        async def compute(**kwargs):
+            step_id = kwargs["step_id"]
+            self.calls.append(step_id)
+            if step_id in self.fail_steps:
+                raise RuntimeError(f"{step_id} crashed")
+            return {"step": step_id, "value": kwargs.get("value")}
+
+        self.register_action("compute", compute)
+
+
+def _workflow(workflow_id: str = "pipeline", memoize: bool = False):
+    return WorkflowDefinition(
+        workflow_id=workflow_id,
+        name="Pipeline",
+        steps=[
+            WorkflowStep(
+                step_id="extract",
+                name="extract",
+                action="compute",
+                params={"value": 1},
+                retry_attempts=0,
+                memoize=memoize,
+            ),
+            WorkflowStep(
+                step_id="transform",
+                name="transform",
+                action="compute",
+                depends_on=["extract"],
+                retry_attempts=0,
+                memoize=memoize,
+            ),
+            WorkflowStep(
+                step_id="load",
+                name="load",
+                action="compute",
+                depends_on=["transform"],
+                retry_attempts=0,
+            ),
+        ],
+    )
+
+
+class TestCheckpointResume:
+    async def test_resume_skips_checkpointed_steps(self, store):
+        first = CountingEngine(store)
+        first.fail_steps = {"load"}
+        failed = await first.execute(_workflow())
+        assert failed.state == WorkflowState.FAILED
+        assert first.calls == ["extract", "transform", "load"]
+
+        # A fresh engine, as after a restart, picks up from the checkpoint
+        second = CountingEngine(store)
+        result = await second.execute(_workflow())
+
+        assert result.state == WorkflowState.COMPLETED
+        assert second.calls == ["load"]
+        assert [step.step_id for step in result.steps] == [
+            "extract",
+            "transform",
+            "load",
+        ]
+        restored = {step.step_id: step for step in result.steps}
+        assert restored["extract"].metadata["restored"] is True
+        assert restored["transform"].output == {"step": "transform", "value": None}
+
+    async def test_checkpoints_cleared_after_completion(self, store):
+        engine = CountingEngine(store)
+        await engine.execute(_workflow())
+        await engine.execute(_workflow())
+
+        assert engine.calls == ["extract", "transform", "load"] * 2
+        assert await store.load("pipeline", ["extract", "transform", "load"]) == {}
+
+    async def test_resume_false_starts_fresh(self, store):
+        engine = CountingEngine(store)
+        engine.fail_steps = {"load"}
+        await engine.execute(_workflow())
+        engine.fail_steps.clear()
+        engine.calls.clear()
+
+        result = await engine.execute(_workflow(), resume=False)
+
+        assert result.state == WorkflowState.COMPLETED
+        assert engine.calls == ["extract", "transform", "load"]
+
+
+class TestStepMemoization:
+    async def test_identical_inputs_reuse_output(self, store):
+        engine = CountingEngine(store)
+        await engine.execute(_workflow("first", memoize=True))
+        engine.calls.clear()
+
+        result = await engine.execute(_workflow("second", memoize=True))
+
+        assert result.state == WorkflowState.COMPLETED
+        # Only the non-memoized step runs again
+        assert engine.calls == ["load"]
+        memoized = {step.step_id: step for step in result.steps}
+        assert memoized["extract"].metadata["memoized"] is True
+        assert memoized["extract"].output == {"step": "extract", "value": 1}
+
+    async def test_different_context_is_not_reused(self, store):
+        engine = CountingEngine(store)
+        await engine.execute(_workflow("first", memoize=True), {"tenant": "a"})
+        engine.calls.clear()
+
+        await engine.execute(_workflow("second", memoize=True), {"tenant": "b"})
+
+        assert engine.calls == ["extract", "transform", "load"]
+
+    async def test_failed_steps_are_not_memoized(self, store):
+        engine = CountingEngine(store)
+        engine.fail_steps = {"extract"}
+        await engine.execute(_workflow("first", memoize=True))
+        engine.fail_steps.clear()
+        engine.calls.clear()
+
+        await engine.execute(_workflow("second", memoize=True))
+
+        assert engine.calls == ["extract", "transform", "load"]
+
+    def test_input_hash_depends_on_params_dependencies_and_context(self):
+        step = WorkflowStep(step_id="s", name="s", action="a", params={"x": 1})
+        other = WorkflowStep(step_id="t", name="t", action="a", params={"x": 2})
+
+        assert step_input_hash(step, {}) == step_input_hash(step, {})
+        assert step_input_hash(step, {}) != step_input_hash(other, {})
+        assert step_input_hash(step, {"d": 1}) != step_input_hash(step, {"d": 2})
+        assert step_input_hash(step, {}, {"c": 1}) != step_input_hash(step, {})
+
+
+class TestStateCheckpointStore:
+    async def test_round_trip(self, store):
+        result = StepResult(
+            step_id="s",
+            state=StepState.COMPLETED,
+            output=[1, 2],
+            duration_ms=3.5,
+            metadata={"k": "v"},
+        )
+        await store.save_step("wf", result)
+
+        loaded = await store.load("wf", ["s", "missing"])
+
+        assert list(loaded) == ["s"]
+        assert loaded["s"].state == StepState.COMPLETED
+        assert loaded["s"].output == [1, 2]
+        assert loaded["s"].duration_ms == 3.5
+
+        await store.clear("wf", ["s"])
+        assert await store.load("wf", ["s"]) == {}
@@ -0,0 +1,185 @@
+"""Tests for BasicWorkflowEngine dependency scheduling."""
+
+import asyncio
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from acb.workflows import (
+    BasicWorkflowEngine,
+    StepState,
+    WorkflowDefinition,
+    WorkflowState,
+    WorkflowStep,
+)
+
+
+def _step(step_id: str, action: str = "noop", **kwargs) -> WorkflowStep:
+    return WorkflowStep(step_id=step_id, name=step_id, action=action, **kwargs)
+
+
+def _engine(max_concurrent_steps: int = 5) -> BasicWorkflowEngine:
+    engine = BasicWorkflowEngine(max_concurrent_steps=max_concurrent_steps)
+
+    async def noop(**kwargs):
+        return kwargs["step_id"]
+
+    async def failing(**kwargs):
+        raise ValueError("boom")
+
+    engine.register_action("noop", noop)
+    engine.register_action("failing", failing)
+    return engine
+
+
+class TestEagerScheduling:
+    async def test_slow_step_does_not_hold_back_other_branches(self):
+        """A step starts as soon as its own dependencies finish."""
+        engine = _engine()
+        branch_done = asyncio.Event()
+
+        async def slow(**kwargs):
+            # Under wave-by-wave scheduling "c" would wait for this step
+            await asyncio.wait_for(branch_done.wait(), timeout=2.0)
+
+        async def finish_branch(**kwargs):
+            branch_done.set()
+
+        engine.register_action("slow", slow)
+        engine.register_action("finish_branch", finish_branch)
+        workflow = WorkflowDefinition(
+            workflow_id="branches",
+            name="Branches",
+            steps=[
+                _step("a", "slow", retry_attempts=0),
+                _step("b"),
+                _step("c", "finish_branch", depends_on=["b"]),
+            ],
+        )
+
+        result = await engine.execute(workflow)
+
+        assert result.state == WorkflowState.COMPLETED
+        assert [step.step_id for step in result.steps] == ["a", "b", "c"]
+
+    async def test_respects_max_concurrent_steps(self):
+        engine = _engine(max_concurrent_steps=2)
+        running = 0
+        peak = 0
+
+        async def tracked(**kwargs):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        engine.register_action("tracked", tracked)
+        workflow = WorkflowDefinition(
+            workflow_id="bounded",
+            name="Bounded",
+            steps=[_step(f"s{i}", "tracked") for i in range(8)],
+        )
+
+        result = await engine.execute(workflow)
+
+        assert result.state == WorkflowState.COMPLETED
+        assert peak == 2
+
+    async def test_failed_dependency_blocks_dependents(self):
+        engine = _engine()
+        workflow = WorkflowDefinition(
+            workflow_id="blocked",
+            name="Blocked",
+            continue_on_error=True,
+            steps=[
+                _step("fail", "failing", retry_attempts=0),
+                _step("blocked", depends_on=["fail"]),
+                _step("skips", depends_on=["fail"], skip_on_failure=True),
+                _step("after_blocked", depends_on=["blocked"]),
+            ],
+        )
+
+        result = await engine.execute(workflow)
+
+        assert result.state == WorkflowState.FAILED
+        assert {step.step_id: step.state for step in result.steps} == {
+            "fail": StepState.FAILED,
+            "skips": StepState.COMPLETED,
+        }
+
+    async def test_stop_on_error_cancels_running_steps(self):
+        engine = _engine()
+        cancelled = asyncio.Event()
+
+        async def long_running(**kwargs):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        engine.register_action("long_running", long_running)
+        workflow = WorkflowDefinition(
+            workflow_id="stop",
+            name="Stop",
+            steps=[
+                _step("long", "long_running"),
+                _step("fail", "failing", retry_attempts=0),
+            ],
+        )
+
+        result = await engine.execute(workflow)
+
+        assert result.state == WorkflowState.FAILED
+        assert cancelled.is_set()
+        assert [step.step_id for step in result.steps] == ["fail"]
+
+    async def test_unknown_dependency_is_never_started(self):
+        engine = _engine()
+        workflow = WorkflowDefinition(
+            workflow_id="unknown-dep",
+            name="Unknown dependency",
+            steps=[_step("a"), _step("b", depends_on=["missing"])],
+        )
+
+        result = await engine.execute(workflow)
+
+        assert [step.step_id for step in result.steps] == ["a"]
+
+
+class TestSchedulingBenchmarks:
+    @pytest.mark.benchmark(group="workflow-dag")
+    def test_wide_dag(self, benchmark: BenchmarkFixture):
+        """One root fanning out to 1000 steps that join into one sink."""
+        engine = _engine(max_concurrent_steps=50)
+        fan = [_step(f"w{i}", depends_on=["root"]) for i in range(1000)]
+        workflow = WorkflowDefinition(
+            workflow_id="wide",
+            name="Wide",
+            steps=[
+                _step("root"),
+                *fan,
+                _step("sink", depends_on=[step.step_id for step in fan]),
+            ],
+        )
+
+        with asyncio.Runner() as runner:
+            result = benchmark(lambda: runner.run(engine.execute(workflow)))
+
+        assert result.state == WorkflowState.COMPLETED
+        assert len(result.steps) == 1002
+
+    @pytest.mark.benchmark(group="workflow-dag")
+    def test_deep_dag(self, benchmark: BenchmarkFixture):
+        """A 1000-step chain; each step used to trigger a rescan of all steps."""
+        engine = _engine()
+        steps = [_step("d0")] + [
+            _step(f"d{i}", depends_on=[f"d{i - 1}"]) for i in range(1, 1000)
+        ]
+        workflow = WorkflowDefinition(workflow_id="deep", name="Deep", steps=steps)
+
+        with asyncio.Runner() as runner:
+            result = benchmark(lambda: runner.run(engine.execute(workflow)))
+
+        assert result.state == WorkflowState.COMPLETED
+        assert len(result.steps) == 1000
@@ -0,0 +1,206 @@
+"""Tests for WorkflowService admission control."""
+
+import asyncio
+import pytest
+
+from acb.workflows import (
+    BasicWorkflowEngine,
+    WorkflowAdmissionError,
+    WorkflowDefinition,
+    WorkflowService,
+    WorkflowSettings,
+    WorkflowState,
+    WorkflowStep,
+)
+
+
+class GatedEngine(BasicWorkflowEngine):
+    """Engine whose steps block until the test opens the gate."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.running = 0
+        self.peak = 0
+        self.started: list[str] = []
+
+        async def gated(**kwargs):
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            self.started.append(kwargs["context"]["name"])
+            try:
+                await self.gate.wait()
+            finally:
+                self.running -= 1
+
+        self.register_action("gated", gated)
+
+
+def _workflow(workflow_id: str) -> WorkflowDefinition:
+    return WorkflowDefinition(
+        workflow_id=workflow_id,
+        name=workflow_id,
+        steps=[WorkflowStep(step_id="s", name="s", action="gated")],
+    )
+
+
+async def _submit(service: WorkflowService, name: str, **kwargs) -> str:
+    return await service.submit_workflow(
+        _workflow(name),
+        context={"name": name},
+        **kwargs,
+    )
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def engine() -> GatedEngine:
+    return GatedEngine()
+
+
+@pytest.fixture
+async def make_service(engine, mock_config):
+    services: list[WorkflowService] = []
+
+    async def factory(**settings) -> WorkflowService:
+        service = WorkflowService(
+            engine=engine,
+            settings=WorkflowSettings(health_check_enabled=False, **settings),
+        )
+        await service.initialize()
+        services.append(service)
+        return service
+
+    yield factory
+
+    engine.gate.set()
+    for service in services:
+        await service.shutdown()
+
+
+class TestWorkflowAdmission:
+    async def test_worker_pool_bounds_running_workflows(self, engine, make_service):
+        service = await make_service(max_concurrent_workflows=2)
+        ids = [await _submit(service, f"wf{i}") for i in range(5)]
+        await _settle()
+
+        assert engine.running == 2
+        assert service.get_custom_metric("workflows_pending") == 3
+
+        engine.gate.set()
+        for _ in range(50):
+            if service.get_custom_metric("workflows_pending") == 0 and not (
+                service._active_workflows
+            ):
+                break
+            await asyncio.sleep(0.01)
+
+        assert engine.peak == 2
+        for workflow_id in ids:
+            result = await service.get_workflow_result(workflow_id)
+            assert result is not None
+            assert result.state == WorkflowState.COMPLETED
+        assert service.get_custom_metric("workflow_avg_run_ms") > 0
+
+    async def test_higher_priority_starts_first(self, engine, make_service):
+        service = await make_service(max_concurrent_workflows=1)
+        await _submit(service, "first")
+        await _settle()
+        await _submit(service, "low")
+        await _submit(service, "high", priority=5)
+        await _submit(service, "low2")
+
+        engine.gate.set()
+        for _ in range(50):
+            if len(engine.started) == 4:
+                break
+            await asyncio.sleep(0.01)
+
+        assert engine.started == ["first", "high", "low", "low2"]
+
+    async def test_rejects_when_queue_is_full(self, engine, make_service):
+        service = await make_service(
+            max_concurrent_workflows=1,
+            max_pending_workflows=1,
+        )
+        await _submit(service, "running")
+        await _settle()
+        await _submit(service, "queued")
+
+        with pytest.raises(WorkflowAdmissionError):
+            await _submit(service, "rejected")
+
+        assert service.get_custom_metric("workflows_rejected") == 1
+        health = await service.health_check()
+        assert health["service_specific"]["pending_workflows"] == 1
+
+    async def test_admission_timeout_waits_for_space(self, engine, make_service):
+        service = await make_service(
+            max_concurrent_workflows=1,
+            max_pending_workflows=1,
+            admission_timeout=1.0,
+        )
+        await _submit(service, "running")
+        await _settle()
+        await _submit(service, "queued")
+
+        submit = asyncio.create_task(_submit(service, "waiting"))
+        await _settle()
+        assert not submit.done()
+
+        engine.gate.set()
+        assert await submit == "waiting"
+
+    async def test_cancel_pending_workflow(self, engine, make_service):
+        service = await make_service(max_concurrent_workflows=1)
+        await _submit(service, "running")
+        await _settle()
+        await _submit(service, "pending")
+
+        assert await service.cancel_workflow("pending") is True
+
+        engine.gate.set()
+        await asyncio.sleep(0.05)
+        assert engine.started == ["running"]
+
+    async def test_cancelled_workflows_free_pending_slots(self, engine, make_service):
+        service = await make_service(
+            max_concurrent_workflows=1,
+            max_pending_workflows=2,
+        )
+        await _submit(service, "running")
+        await _settle()
+        await _submit(service, "a")
+        await _submit(service, "b")
+
+        assert await service.cancel_workflow("a") is True
+        assert await service.cancel_workflow("b") is True
+        assert await _submit(service, "c") == "c"
+        assert await _submit(service, "d") == "d"
+        assert service.get_custom_metric("workflows_pending") == 2
+
+        engine.gate.set()
+        for _ in range(50):
+            if len(engine.started) == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        assert engine.started == ["running", "c", "d"]
+
+    async def test_rejects_duplicate_pending_workflow(self, engine, make_service):
+        service = await make_service(max_concurrent_workflows=1)
+        await _submit(service, "running")
+        await _settle()
+        await _submit(service, "pending")
+
+        with pytest.raises(WorkflowAdmissionError):
+            await _submit(service, "pending")
+
+        engine.gate.set()
+        await asyncio.sleep(0.05)
+        assert engine.started == ["running", "pending"]
+        assert service.get_custom_metric("workflows_rejected") == 1